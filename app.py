@@ -12,18 +12,23 @@ Etapa 2.1:
 """
 
 from pathlib import Path
-import json
 import logging
+import re
 import tomllib
-import wave
 import streamlit as st
 import subprocess
 import sys
 
+from core.app_jobs import HANDLERS, save_transcript
+from core.audio.ingest import copy_upload, read_slice
+from core.audio.storage import audio_duration, load_storage_config
+from core.job_queue import DONE, FAILED, get_job_queue
 from core.recorder_streamlit import StreamlitRecorder
-from core.whisper_core import whisper_transcribe
-from refiners.structural import refine_structural
-from core.summarizers.pipeline import run_summary_pipeline
+from core.decode_profiles import default_profile_name, profile_names, resolve_profile
+from core.model_pool import get_pool
+from core.segment_store import SegmentStore, sidecar_path
+from core.transcript_index import TranscriptIndex, format_timestamp, parse_timestamp
+from core.warmup import load_warmup_config, start_warmup, warmup_status
 
 # =====================================================
 # LOGGING
@@ -37,13 +42,20 @@ logger = logging.getLogger(__name__)
 # =====================================================
 # CONFIG
 # =====================================================
+# Cada interacao reexecuta o script: leituras de disco ficam em cache
+# (st.cache_data/st.cache_resource), invalidadas pelo mtime
 CONFIG_PATH = Path("config.toml")
-config = {}
 
-if CONFIG_PATH.exists():
-    with open(CONFIG_PATH, "rb") as f:
-        config = tomllib.load(f)
+
+@st.cache_data(show_spinner=False)
+def load_config(path: str, mtime_ns: int) -> dict:
+    with open(path, "rb") as f:
+        loaded = tomllib.load(f)
     logger.info("config.toml carregado")
+    return loaded
+
+
+config = load_config(str(CONFIG_PATH), CONFIG_PATH.stat().st_mtime_ns) if CONFIG_PATH.exists() else {}
 
 # =====================================================
 # PATHS
@@ -52,40 +64,57 @@ BASE_OUTPUT = Path(config.get("paths", {}).get("base_output", "output"))
 AUDIO_DIR = BASE_OUTPUT / "audio"
 TRANSCRIPT_DIR = BASE_OUTPUT / "transcripts"
 
-AUDIO_DIR.mkdir(parents=True, exist_ok=True)
-TRANSCRIPT_DIR.mkdir(parents=True, exist_ok=True)
+
+# mkdir a cada rerun: barato, e recria as pastas se forem apagadas
+for directory in (AUDIO_DIR, TRANSCRIPT_DIR):
+    directory.mkdir(parents=True, exist_ok=True)
+
+CACHE_DIR = BASE_OUTPUT / "cache" / "transcriptions"
+PCM_DIR = BASE_OUTPUT / "cache" / "pcm"
+
+# Fila de tarefas: sobrevive a reruns e ao recarregar o navegador.
+# O modelo do pool decodifica job_workers tarefas ao mesmo tempo
+# (sem isso o CTranslate2 atende uma chamada por vez)
+JOB_WORKERS = max(int(config.get("ui", {}).get("job_workers", 1)), 1)
+get_pool().num_workers = JOB_WORKERS
+JOBS = get_job_queue(BASE_OUTPUT / "jobs", HANDLERS, workers=JOB_WORKERS)
 
 # =====================================================
 # SESSION STATE
 # =====================================================
 st.session_state.setdefault("recorder", None)
 st.session_state.setdefault("audio_path", None)
-st.session_state.setdefault("transcript_text", None)
-st.session_state.setdefault("stats", None)
-st.session_state.setdefault("external_transcript", None)
-st.session_state.setdefault("external_stats", None)
-st.session_state.setdefault("summary_output", None)
-st.session_state.setdefault("recorded_files", [])
+st.session_state.setdefault("recording_job", None)
 
 # =====================================================
 # UTILS
 # =====================================================
 def get_audio_duration_seconds(path: Path) -> float | None:
     """
-    Retorna duracao em segundos apenas para WAV.
-    Para outros formatos, retorna None.
+    Retorna duracao em segundos (WAV, FLAC, OGG).
+    Para formatos sem leitura direta (mp3/m4a), retorna None.
     """
-    try:
-        if path.suffix.lower() != ".wav":
-            logger.info("Duracao ignorada (nao WAV): %s", path.name)
-            return None
-
-        with wave.open(str(path), "rb") as wf:
-            return wf.getnframes() / float(wf.getframerate())
-
-    except Exception as e:
-        logger.warning("Falha ao calcular duracao | %s | %s", path.name, e)
-        return None
+    duration = audio_duration(path)
+    if duration is None:
+        logger.info("Duracao indisponivel: %s", path.name)
+    return duration
+
+
+def submit_transcription(audio_path: Path, redecode_short: bool = False) -> str:
+    """Enfileira a transcricao (modelo/perfil/timestamps da sidebar)."""
+    return JOBS.submit(
+        "transcribe",
+        {
+            "audio_path": str(audio_path),
+            "transcript_dir": str(TRANSCRIPT_DIR),
+            "cache_dir": str(CACHE_DIR),
+            "pcm_dir": str(PCM_DIR),
+            "profile": decode_profile,
+            "word_timestamps": word_timestamps,
+            "redecode_short": redecode_short,
+        },
+        label=f"Transcricao | {audio_path.name}",
+    )
 
 
 def open_folder(path: Path):
@@ -97,183 +126,419 @@ def open_folder(path: Path):
         subprocess.Popen(["xdg-open", path])
 
 
+@st.cache_data(show_spinner=False)
+def scan_session_names(base_dir: str, mtime_ns: int) -> list[str]:
+    """
+    Sessoes mais recentes primeiro; refeito so quando base_dir muda
+    (sessao criada/removida). Ordem pelo nome (session_<data>_<hora>),
+    isto e, pela criacao: o mtime de cada sessao muda sem alterar o
+    de base_dir e deixaria a ordem em cache desatualizada.
+    """
+    names = [
+        p.name for p in Path(base_dir).iterdir() if p.is_dir() and p.name.startswith("session_")
+    ]
+    return sorted(names, reverse=True)
+
+
 def list_session_dirs(base_dir: Path) -> list[Path]:
     if not base_dir.exists():
         return []
-    return sorted(
-        [p for p in base_dir.iterdir() if p.is_dir() and p.name.startswith("session_")],
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
+    names = scan_session_names(str(base_dir), base_dir.stat().st_mtime_ns)
+    return [base_dir / name for name in names]
 
 # =====================================================
 # UI — TITULO
 # =====================================================
 st.title("Gravador & Transcritor Local")
 
+# =====================================================
+# SIDEBAR — MODELO
+# =====================================================
+MODEL_OPTIONS = ["tiny", "base", "small", "medium"]
+PROFILE_OPTIONS = profile_names()
+
+profile_name = st.sidebar.selectbox(
+    "Perfil de decodificacao",
+    options=PROFILE_OPTIONS,
+    index=PROFILE_OPTIONS.index(default_profile_name(config)),
+    help="live/fast: mais rapido | balanced: padrao | accurate: mais preciso",
+)
+decode_profile = resolve_profile(profile_name, config=config)
+
+# Modelo do perfil fora da lista (ex: large-v3 via config.toml) entra como opcao
+model_options = MODEL_OPTIONS + [m for m in [decode_profile["model"]] if m not in MODEL_OPTIONS]
+
+model_name = st.sidebar.selectbox(
+    "Modelo Whisper",
+    options=model_options,
+    index=model_options.index(decode_profile["model"]),
+    key=f"model_{profile_name}",
+)
+decode_profile["model"] = model_name
+
+word_timestamps = st.sidebar.checkbox(
+    "Timestamps por palavra (sidecar .npz)",
+    value=False,
+)
+
+live_mode = st.sidebar.checkbox(
+    "Transcricao ao vivo durante a gravacao",
+    value=False,
+    help="Transcreve regioes de fala enquanto grava; ao finalizar, so o trecho final e decodificado",
+)
+
+warmup_cfg = load_warmup_config(config)
+if warmup_cfg["enabled"]:
+    start_warmup(
+        model_name,
+        compute_type=decode_profile["compute_type"],
+        cpu_threads=decode_profile["cpu_threads"],
+        dummy_decode=warmup_cfg["dummy_decode"],
+        language=warmup_cfg["language"],
+    )
+    warmup = warmup_status()
+    if warmup["status"] == "ready" and warmup["model"] == model_name:
+        st.sidebar.success(f"Modelo {model_name} pronto ({warmup['seconds']:.1f}s)")
+    elif warmup["status"] == "failed":
+        st.sidebar.error(f"Falha no warm-up: {warmup['error']}")
+        if st.sidebar.button("Tentar warm-up novamente"):
+            start_warmup(
+                model_name,
+                compute_type=decode_profile["compute_type"],
+                cpu_threads=decode_profile["cpu_threads"],
+                dummy_decode=warmup_cfg["dummy_decode"],
+                retry=True,
+            )
+            st.rerun()
+    else:
+        st.sidebar.info(f"Carregando modelo {model_name} em background...")
+
+pool_stats = get_pool().stats()
+st.sidebar.caption(
+    f"Modelos em memoria: {', '.join(pool_stats['loaded']) or 'nenhum'} "
+    f"({pool_stats['used_mb']:.0f}/{pool_stats['budget_mb']:.0f} MB) | "
+    f"loads={pool_stats['loads']} hits={pool_stats['hits']} "
+    f"evictions={pool_stats['evictions']}"
+)
+
 # =====================================================
 # BLOCO 1 — GRAVACAO
 # =====================================================
 filename = st.text_input("Nome base do arquivo", value="sessao")
 col1, col2 = st.columns(2)
 
+
+def new_recorder() -> StreamlitRecorder:
+    live = None
+    if live_mode:
+        # VAD/modelo so carregam quando a transcricao ao vivo e usada
+        from core.live_transcriber import LiveTranscriber
+
+        live = LiveTranscriber(TRANSCRIPT_DIR, profile=decode_profile)
+    return StreamlitRecorder(
+        output_dir=AUDIO_DIR,
+        base_name=filename,
+        live_transcriber=live,
+        storage_cfg=load_storage_config(config),
+    )
+
+
 with col1:
     if st.button("Iniciar gravacao"):
-        recorder = StreamlitRecorder(
-            output_dir=AUDIO_DIR,
-            base_name=filename,
-        )
+        recorder = new_recorder()
         recorder.start()
         st.session_state.recorder = recorder
         st.session_state.audio_path = None
-        st.session_state.transcript_text = None
-        st.session_state.stats = None
-        st.session_state.recorded_files = []
+        st.session_state.recording_job = None
         st.success("Gravacao iniciada")
 
+# Pausar/retomar mantem um unico arquivo por sessao (pausas no .kept.json)
 with col2:
     if st.button("Pausar gravacao"):
         recorder = st.session_state.get("recorder")
         if recorder and recorder.is_running():
-            recorder.stop()
-            st.session_state.audio_path = recorder.final_audio_path
-            if recorder.final_audio_path:
-                st.session_state.recorded_files.append(recorder.final_audio_path)
-            st.success("Gravacao pausada (arquivo atual finalizado)")
+            recorder.pause()
+            st.success("Gravacao pausada")
 
 with col2:
     if st.button("Retomar gravacao"):
-        recorder = StreamlitRecorder(
-            output_dir=AUDIO_DIR,
-            base_name=filename,
-        )
-        recorder.start()
-        st.session_state.recorder = recorder
-        st.success("Gravacao retomada")
+        recorder = st.session_state.get("recorder")
+        if recorder and recorder.is_paused():
+            recorder.resume()
+            st.success("Gravacao retomada")
+        else:
+            recorder = new_recorder()
+            recorder.start()
+            st.session_state.recorder = recorder
+            st.session_state.audio_path = None
+            st.session_state.recording_job = None
+            st.success("Nova gravacao iniciada")
 
 with col2:
     if st.button("Finalizar gravacao"):
         recorder = st.session_state.get("recorder")
         if recorder and recorder.is_running():
-            recorder.stop()
+            with st.spinner("Finalizando arquivo de audio..."):
+                recorder.stop()
             st.session_state.audio_path = recorder.final_audio_path
-            if recorder.final_audio_path:
-                st.session_state.recorded_files.append(recorder.final_audio_path)
-            st.success("Gravacao finalizada")
+            st.session_state.recording_job = None
+            if recorder.final_audio_path is None:
+                st.error("Falha ao finalizar a gravacao (ver logs)")
+            else:
+                st.success("Gravacao finalizada")
+
+
+def show_partial_transcript() -> None:
+    recorder = st.session_state.get("recorder")
+    if recorder is None or recorder.live_transcriber is None:
+        return
+    if recorder.is_running():
+        live = recorder.live_transcriber
+        st.caption(f"Transcricao ao vivo | atraso {live.lag_s():.0f}s")
+    st.text_area(
+        "Transcricao parcial",
+        value=recorder.partial_transcript(),
+        height=200,
+        disabled=True,
+    )
+
+
+# st.fragment (Streamlit >= 1.37) atualiza so este trecho periodicamente
+if hasattr(st, "fragment"):
+    show_partial_transcript = st.fragment(run_every=2)(show_partial_transcript)
+elif live_mode:
+    st.button("Atualizar transcricao parcial")
+
+show_partial_transcript()
 
 st.divider()
 
 # =====================================================
 # BLOCO 2 — TRANSCRICAO DA GRAVACAO ATUAL
 # =====================================================
-if st.session_state.audio_path and st.session_state.transcript_text is None:
+if st.session_state.audio_path and st.session_state.recording_job is None:
     if st.button("Transcrever gravacao atual"):
-        with st.spinner("Transcrevendo audio gravado..."):
-            audio_path = st.session_state.audio_path
+        audio_path = st.session_state.audio_path
+        recorder = st.session_state.get("recorder")
+        live_result = recorder.live_result if recorder else None
+
+        # Transcricao ao vivo completa: nada a decodificar de novo
+        if (
+            live_result
+            and live_result.get("live_complete")
+            and recorder.final_audio_path == audio_path
+        ):
+            logger.info("Usando transcricao ao vivo | %s", audio_path.name)
+            saved = save_transcript(
+                audio_path, TRANSCRIPT_DIR, live_result,
+                get_audio_duration_seconds(audio_path), live=True,
+            )
+            st.session_state.recording_job = "live"
+            st.success(f"Transcricao ao vivo salva: {Path(saved['txt']).name}")
+        else:
+            st.session_state.recording_job = submit_transcription(audio_path)
+            st.success("Transcricao enfileirada (acompanhe em Tarefas)")
 
-            result = whisper_transcribe(audio_path)
-            raw_text = result.get("text", "").strip()
+st.divider()
 
-            refined_text = refine_structural(raw_text)
+# =====================================================
+# BLOCO 3 — TRANSCRICAO DE AUDIO EXISTENTE (INDEPENDENTE)
+# =====================================================
+st.subheader("Transcrever audio existente")
 
-            txt = TRANSCRIPT_DIR / f"{audio_path.stem}.txt"
-            jsn = TRANSCRIPT_DIR / f"{audio_path.stem}.json"
+uploaded_files = st.file_uploader(
+    "Selecione um ou mais arquivos de audio",
+    type=["wav", "mp3", "m4a", "flac", "ogg"],
+    accept_multiple_files=True,
+)
 
-            txt.write_text(refined_text, encoding="utf-8")
-            jsn.write_text(
-                json.dumps(result, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+if uploaded_files:
+    if st.button("Transcrever arquivos selecionados"):
+        for uploaded_file in uploaded_files:
+            # Copia em blocos: sem segunda copia do arquivo em memoria
+            temp_audio = copy_upload(uploaded_file, AUDIO_DIR / uploaded_file.name)
 
-            duration = get_audio_duration_seconds(audio_path)
-            words = len(refined_text.split())
+            logger.info("Transcricao manual enfileirada | %s", temp_audio)
+            submit_transcription(temp_audio, redecode_short=True)
 
-            st.session_state.transcript_text = refined_text
-            st.session_state.stats = {
-                "duration": duration,
-                "words": words,
-            }
+        st.success(f"{len(uploaded_files)} arquivo(s) na fila (acompanhe em Tarefas)")
 
 st.divider()
 
 # =====================================================
-# BLOCO 3 — TRANSCRICAO DE AUDIO EXISTENTE (INDEPENDENTE)
+# BLOCO 4 — TAREFAS (FILA EM BACKGROUND)
 # =====================================================
-st.subheader("Transcrever audio existente")
+st.subheader("Tarefas")
 
-uploaded_file = st.file_uploader(
-    "Selecione um arquivo de audio",
-    type=["wav", "mp3", "m4a", "flac", "ogg"],
-)
 
-if uploaded_file:
-    if st.button("Transcrever arquivo selecionado"):
-        with st.spinner("Transcrevendo arquivo, isso pode levar alguns minutos..."):
-            temp_audio = AUDIO_DIR / uploaded_file.name
-            temp_audio.write_bytes(uploaded_file.read())
+# -----------------------------------------------------
+# Visualizador paginado: so a pagina atual vai para o navegador
+# -----------------------------------------------------
+TRANSCRIPT_PAGE_SIZE = 50
+PLAYBACK_PAD_S = 0.25
 
-            logger.info("Transcricao manual iniciada | %s", temp_audio)
 
-            result = whisper_transcribe(temp_audio)
-            raw_text = result.get("text", "").strip()
+@st.cache_resource(max_entries=8, show_spinner=False)
+def load_transcript_index(json_path: str, mtime_ns: int, audio_path: str) -> TranscriptIndex:
+    return TranscriptIndex.load(Path(json_path), Path(audio_path))
 
-            duration = get_audio_duration_seconds(temp_audio)
-            if duration and duration > 30 and len(raw_text) < 80:
-                logger.warning("Transcricao curta detectada | retry sem VAD")
-                result = whisper_transcribe(temp_audio, vad_filter=False)
-                raw_text = result.get("text", "").strip()
 
-            refined_text = refine_structural(raw_text)
+@st.cache_resource(max_entries=8, show_spinner=False)
+def load_segment_store(npz_path: str, mtime_ns: int) -> SegmentStore:
+    return SegmentStore(Path(npz_path))
 
-            txt = TRANSCRIPT_DIR / f"{temp_audio.stem}.txt"
-            jsn = TRANSCRIPT_DIR / f"{temp_audio.stem}.json"
 
-            txt.write_text(refined_text, encoding="utf-8")
-            jsn.write_text(
-                json.dumps(result, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+def show_selected_words(json_path: Path, segment: dict) -> None:
+    # Sidecar .segments.npz (timestamps por palavra): so o recorte do segmento
+    npz_path = sidecar_path(json_path)
+    if not npz_path.exists():
+        return
+    store = load_segment_store(str(npz_path), npz_path.stat().st_mtime_ns)
+    # Ponto medio: vizinhos que so encostam nas bordas ficam de fora
+    middle = (segment["start"] + segment["end"]) / 2
+    words = [
+        word
+        for item in store.slice(middle, middle, with_words=True)
+        for word in item["words"]
+    ]
+    if words:
+        st.caption(" ".join(
+            f"`{format_timestamp(word['start'])}` {escape_markdown(word['word'].strip())}"
+            for word in words
+        ))
 
-            duration = get_audio_duration_seconds(temp_audio)
-            words = len(refined_text.split())
 
-            st.session_state.external_transcript = refined_text
-            st.session_state.external_stats = {
-                "duration": duration,
-                "words": words,
-            }
+def escape_markdown(text: str) -> str:
+    return re.sub(r"([\\`*_{}\[\]<>#|~])", r"\\\1", text)
 
-            st.success("Transcricao concluida")
 
-# =====================================================
-# BLOCO 4 — EXIBICAO DO RESULTADO
-# =====================================================
-if st.session_state.external_transcript:
-    st.subheader("Transcricao do arquivo")
+def select_segment(key: str, index: TranscriptIndex, segment: int) -> None:
+    st.session_state[f"seg_{key}"] = segment
+    st.session_state[f"page_{key}"] = index.page_of(segment, TRANSCRIPT_PAGE_SIZE)
+
+
+def jump_to_timestamp(key: str, index: TranscriptIndex) -> None:
+    seconds = parse_timestamp(st.session_state[f"jump_{key}"])
+    if seconds is not None:
+        select_segment(key, index, index.locate(seconds))
+
+
+def turn_page(key: str, delta: int, pages: int) -> None:
+    page = st.session_state[f"page_{key}"] + delta
+    st.session_state[f"page_{key}"] = min(max(page, 0), pages - 1)
+
+
+def show_transcript_viewer(key: str, json_path: Path, audio_path: Path) -> None:
+    if not json_path.exists():
+        st.caption("Transcricao nao encontrada")
+        return
+    index = load_transcript_index(str(json_path), json_path.stat().st_mtime_ns, str(audio_path))
+    if not len(index):
+        st.caption("Transcricao sem segmentos")
+        return
+
+    pages = index.page_count(TRANSCRIPT_PAGE_SIZE)
+    st.session_state.setdefault(f"page_{key}", 0)
+    selected = st.session_state.get(f"seg_{key}")
 
     col1, col2 = st.columns(2)
+    query = col1.text_input("Buscar na transcricao", key=f"query_{key}")
+    col2.text_input(
+        "Ir para (hh:mm:ss)",
+        key=f"jump_{key}",
+        on_change=jump_to_timestamp,
+        args=(key, index),
+    )
 
-    if st.session_state.external_stats["duration"] is not None:
-        col1.metric(
-            "Duracao (s)",
-            round(st.session_state.external_stats["duration"], 2),
+    if query:
+        hits = index.search(query, limit=20)
+        st.caption(f"{len(hits)} resultado(s)" + (" (primeiros 20)" if len(hits) == 20 else ""))
+        for hit in hits:
+            segment = index.segment(hit)
+            st.button(
+                f"{format_timestamp(segment['start'])} | {segment['text'][:80]}",
+                key=f"hit_{key}_{hit}",
+                on_click=select_segment,
+                args=(key, index, hit),
+            )
+
+    page = st.session_state[f"page_{key}"]
+    lines = []
+    for segment in index.page(page, TRANSCRIPT_PAGE_SIZE):
+        line = f"`{format_timestamp(segment['start'])}` {escape_markdown(segment['text'])}"
+        lines.append(f"**{line}**" if segment["index"] == selected else line)
+    st.markdown("  \n".join(lines))
+
+    nav1, nav2, nav3 = st.columns([1, 2, 1])
+    nav1.button("Anterior", key=f"prev_{key}", on_click=turn_page, args=(key, -1, pages), disabled=page == 0)
+    nav2.caption(f"Pagina {page + 1} de {pages} | {format_timestamp(index.duration)}")
+    nav3.button("Proxima", key=f"next_{key}", on_click=turn_page, args=(key, 1, pages), disabled=page >= pages - 1)
+
+    if selected is not None:
+        show_selected_words(json_path, index.segment(selected))
+
+    # Trecho do segmento selecionado: leitura por seek, nao o arquivo inteiro
+    if selected is not None and audio_path.exists():
+        start, end = index.file_span(selected)
+        samples, sample_rate = read_slice(
+            audio_path, max(start - PLAYBACK_PAD_S, 0.0), end + PLAYBACK_PAD_S, PCM_DIR
         )
-    else:
-        col1.caption("Duracao indisponivel para este formato")
+        st.audio(samples, sample_rate=sample_rate)
 
-    col2.metric("Palavras", st.session_state.external_stats["words"])
 
-    st.text_area(
-        "Texto transcrito",
-        value=st.session_state.external_transcript,
-        height=300,
-    )
+def show_job_result(job: dict) -> None:
+    result = job["result"] or {}
+
+    if job["kind"] == "summary":
+        output_path = Path(result["output"])
+        st.success(f"{job['label']} | {output_path.name}")
+        st.button(
+            "Abrir pasta da sessao",
+            key=f"open_{job['id']}",
+            on_click=open_folder,
+            args=(output_path.parent,),
+        )
+        return
+
+    with st.expander(f"{job['label']} | {result.get('words', 0)} palavras"):
+        col1, col2 = st.columns(2)
+        if result.get("duration") is not None:
+            col1.metric("Duracao (s)", round(result["duration"], 2))
+        else:
+            col1.caption("Duracao indisponivel para este formato")
+        col2.metric("Palavras", result.get("words", 0))
+
+        show_transcript_viewer(job["id"], Path(result["json"]), Path(result["audio"]))
+        st.button(
+            "Abrir pasta de transcricoes",
+            key=f"open_{job['id']}",
+            on_click=open_folder,
+            args=(TRANSCRIPT_DIR,),
+        )
+
+
+def show_jobs() -> None:
+    jobs = JOBS.jobs(limit=10)
+    if not jobs:
+        st.caption("Nenhuma tarefa ainda")
+        return
+
+    for job in jobs:
+        if job["status"] == DONE:
+            show_job_result(job)
+        elif job["status"] == FAILED:
+            st.error(f"{job['label']} | {job['error']}")
+        else:
+            st.progress(job["progress"], text=f"{job['label']} | {job['message']}")
 
-    st.button(
-        "Abrir pasta de transcricoes",
-        on_click=open_folder,
-        args=(TRANSCRIPT_DIR,),
-    )
+
+# Com tarefas ativas, o painel se atualiza sozinho (st.fragment)
+if hasattr(st, "fragment"):
+    show_jobs = st.fragment(run_every=1 if JOBS.active() else None)(show_jobs)
+else:
+    st.button("Atualizar tarefas")
+
+show_jobs()
 
 st.divider()
 
@@ -312,19 +577,10 @@ if st.button("Gerar resumo/ata"):
     if not selected_session:
         st.error("Nenhuma sessao encontrada em output/")
     else:
-        session_dir = BASE_OUTPUT / selected_session
-        with st.spinner("Gerando resumo/ata..."):
-            try:
-                output_path = run_summary_pipeline(session_dir, meeting_type)
-                st.session_state.summary_output = output_path
-                st.success(f"Resumo gerado: {output_path.name}")
-            except Exception as exc:
-                st.error(f"Falha ao gerar resumo/ata: {exc}")
-
-if st.session_state.summary_output:
-    st.button(
-        "Abrir pasta da sessao",
-        on_click=open_folder,
-        args=(st.session_state.summary_output.parent,),
-    )
-
+        JOBS.submit(
+            "summary",
+            {"session_dir": str(BASE_OUTPUT / selected_session), "meeting_type": meeting_type},
+            label=f"Resumo | {selected_session} | {meeting_type}",
+        )
+        # Tarefas fica acima: rerun para o painel ja mostrar o progresso
+        st.rerun()
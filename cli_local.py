@@ -15,10 +15,22 @@ Fontes:
 
 import argparse
 import logging
+import time
+import tomllib
 from pathlib import Path
 
+from core.audio.storage import load_storage_config
+from core.batch_transcribe import collect_audio_files, run_batch
+from core.decode_profiles import profile_names, resolve_profile
+from core.live_transcriber import LiveTranscriber
+from core.streaming_recognizer import StreamingRecognizer
 from core.recorder import record_until_stop
-from core.whisper_core import whisper_transcribe
+from core.transcription_cache import transcribe_cached
+from core.warmup import load_warmup_config, start_warmup
+from core.whisper_core import (
+    build_result,
+    whisper_transcribe_iter,
+)
 
 # ---------------------------------------------------------
 # Logging
@@ -39,22 +51,44 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------
 AUDIO_DIR = Path("output/audio")
 TRANSCRIPT_DIR = Path("output/transcripts")
+CONFIG_PATH = Path("config.toml")
+
+
+def _load_config() -> dict:
+    if not CONFIG_PATH.exists():
+        return {}
+    with open(CONFIG_PATH, "rb") as f:
+        return tomllib.load(f)
 
 
 # ---------------------------------------------------------
 # Comando: GRAVAR
 # ---------------------------------------------------------
-def cmd_gravar(_args):
+def cmd_gravar(args):
     """
     Comando CLI para gravação de áudio.
+    Com --live, transcreve durante a gravação e salva o TXT ao final.
+    Com --captions, mostra legendas de baixa latência no terminal.
     """
 
+    # Modelo carrega enquanto o nome é digitado e a gravação começa
+    if args.captions or args.live:
+        _start_warmup(args)
+
     base_name = input("📝 Nome do arquivo de áudio: ").strip()
+    live = None
+    if args.captions:
+        live = StreamingRecognizer(on_event=_print_caption, profile=_resolve_profile(args))
+    elif args.live:
+        live = LiveTranscriber(TRANSCRIPT_DIR, profile=_resolve_profile(args))
 
     try:
         audio_path = record_until_stop(
             output_dir=AUDIO_DIR,
             base_name=base_name,
+            show_timer=not args.captions,
+            live=live,
+            storage_cfg=load_storage_config(_load_config()),
         )
     except Exception as e:
         print(f"\n❌ Falha na gravação: {e}")
@@ -65,15 +99,127 @@ def cmd_gravar(_args):
     print(f"📄 Arquivo gerado: {audio_path}")
     logger.info("Gravação concluída: %s", audio_path)
 
+    if args.captions and live.result:
+        print(
+            f"⏱️ Legendas | latência média {live.result['latency_avg_s']:.1f}s | "
+            f"computação {live.result['compute_per_audio_s']:.2f}s por s de áudio"
+        )
+        return
+    if live is None or live.result is None:
+        return
+    if not live.result["live_complete"]:
+        print("⚠️ Transcrição ao vivo incompleta; use 'transcrever -a' no arquivo gerado")
+        return
+
+    output_path = TRANSCRIPT_DIR / f"{audio_path.stem}.txt"
+    output_path.write_text(live.result["text"], encoding="utf-8")
+    print(
+        f"📝 Transcrição ao vivo salva: {output_path} "
+        f"(trecho final em {live.result['tail_decode_s']:.1f}s)"
+    )
+
+
+def _print_caption(event: dict) -> None:
+    """Final: linha confirmada; partial: hipótese reescrita no lugar."""
+    if event["type"] == "final":
+        print(f"\r\033[K{event['text']}", flush=True)
+    else:
+        print(f"\r\033[K… {event['text'][-80:]}", end="", flush=True)
+
+
+# ---------------------------------------------------------
+# Progresso
+# ---------------------------------------------------------
+def _format_clock(seconds: float | None) -> str:
+    if seconds is None:
+        return "--:--"
+    seconds = int(seconds)
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+def _print_progress(event: dict) -> None:
+    width = 30
+    filled = int(event["progress"] * width)
+    print(
+        f"\r⏳ [{'#' * filled}{'-' * (width - filled)}] "
+        f"{event['progress'] * 100:5.1f}% | "
+        f"RTF {event['rtf']:.2f} | "
+        f"ETA {_format_clock(event['eta_s'])}",
+        end="",
+        flush=True,
+    )
+
+
+def _transcribe_streaming(audio_path: Path, output_path: Path, profile: dict) -> dict:
+    """
+    Consome whisper_transcribe_iter: desenha a barra de progresso e
+    grava cada segmento no TXT assim que é decodificado.
+    """
+    t0 = time.time()
+    segments = []
+    language = None
+    audio_s = None
+
+    with output_path.open("w", encoding="utf-8") as out:
+        for event in whisper_transcribe_iter(audio_path, profile=profile):
+            segment = event["segment"]
+            if segment is not None:
+                if segments:
+                    out.write(" ")
+                out.write(segment["text"])
+                out.flush()
+                segments.append(segment)
+
+            language = event["language"]
+            audio_s = event["audio_s"]
+            _print_progress(event)
+
+    print()
+    return build_result(
+        segments,
+        language,
+        time.time() - t0,
+        profile["model"],
+        profile=profile,
+        audio_s=audio_s,
+    )
+
 
 # ---------------------------------------------------------
 # Comando: TRANSCRIBER
 # ---------------------------------------------------------
+def _resolve_profile(args) -> dict:
+    return resolve_profile(
+        name=args.profile,
+        session_type=args.type,
+        config=_load_config(),
+    )
+
+
+def _start_warmup(args) -> None:
+    """Warm-up opcional ([transcription.warmup]) do modelo do perfil."""
+    warmup_cfg = load_warmup_config(_load_config())
+    if not warmup_cfg["enabled"]:
+        return
+    profile = _resolve_profile(args)
+    start_warmup(
+        model_name=profile["model"],
+        compute_type=profile["compute_type"],
+        cpu_threads=profile["cpu_threads"],
+        dummy_decode=warmup_cfg["dummy_decode"],
+        language=warmup_cfg["language"],
+    )
+
+
 def cmd_transcrever(args):
     """
     Comando CLI para transcrição de áudio usando Whisper.
     """
 
+    if args.audio is None:
+        cmd_transcrever_lote(args)
+        return
+
     audio_path = Path(args.audio)
 
     if not audio_path.exists():
@@ -81,12 +227,21 @@ def cmd_transcrever(args):
         return
 
     TRANSCRIPT_DIR.mkdir(parents=True, exist_ok=True)
+    output_path = TRANSCRIPT_DIR / audio_path.with_suffix(".txt").name
 
-    print("▶ Iniciando transcrição...")
-    logger.info("Transcrição iniciada: %s", audio_path)
+    profile = _resolve_profile(args)
+    print(f"▶ Iniciando transcrição... | perfil={profile['name']} | modelo={profile['model']}")
+    logger.info("Transcrição iniciada: %s | perfil=%s", audio_path, profile["name"])
 
     try:
-        result = whisper_transcribe(audio_path)
+        if args.workers > 1:
+            result = transcribe_cached(audio_path, workers=args.workers, profile=profile)
+        else:
+            result = transcribe_cached(
+                audio_path,
+                profile=profile,
+                transcribe=lambda: _transcribe_streaming(audio_path, output_path, profile),
+            )
     except Exception:
         import traceback
         print("\n❌ Falha na transcrição:")
@@ -106,14 +261,59 @@ def cmd_transcrever(args):
         text = str(result)
         logger.info("Resultado Whisper (str) | chars=%d", len(text))
 
-    output_path = TRANSCRIPT_DIR / audio_path.with_suffix(".txt").name
     output_path.write_text(text, encoding="utf-8")
 
-    print("✔ Transcrição concluída")
+    print("✔ Transcrição concluída" + (" (cache)" if isinstance(result, dict) and result.get("cached") else ""))
+    if isinstance(result, dict) and result.get("rtf") is not None:
+        print(f"⏱ Perfil {result.get('profile')} | RTF {result['rtf']:.2f}")
     print(f"📄 Arquivo gerado: {output_path}")
     logger.info("Transcrição concluída: %s", output_path)
 
 
+def cmd_transcrever_lote(args):
+    """
+    Transcrição em lote (--dir / --glob) com manifesto retomável.
+    """
+
+    files = collect_audio_files(
+        directory=Path(args.dir) if args.dir else None,
+        pattern=args.glob,
+    )
+
+    if not files:
+        print("❌ Nenhum arquivo de áudio encontrado")
+        return
+
+    manifest_path = Path(args.manifest) if args.manifest else None
+
+    def on_record(index, total, record):
+        name = Path(record["audio"]).name
+        if record["status"] == "done":
+            rtf = record.get("rtf")
+            rtf_label = f"{rtf:.2f}" if rtf is not None else "--"
+            print(f"[{index}/{total}] ✔ {name} | RTF {rtf_label}")
+        else:
+            print(f"[{index}/{total}] ❌ {name} | {record.get('error')}")
+
+    print(f"▶ Lote: {len(files)} arquivo(s) | jobs={args.jobs}")
+
+    summary = run_batch(
+        files,
+        output_dir=TRANSCRIPT_DIR,
+        manifest_path=manifest_path,
+        jobs=args.jobs,
+        profile=_resolve_profile(args),
+        on_record=on_record,
+        root=Path(args.dir) if args.dir else None,
+    )
+
+    print(
+        f"✔ Lote concluído | concluídos={summary['done']} | "
+        f"falhas={summary['failed']} | pulados={summary['skipped']} | "
+        f"tempo={summary['elapsed_s']:.0f}s"
+    )
+
+
 # ---------------------------------------------------------
 # Main
 # ---------------------------------------------------------
@@ -124,14 +324,71 @@ def main():
     sub = parser.add_subparsers(dest="cmd")
 
     g = sub.add_parser("gravar", help="Gravar áudio")
+    g.add_argument(
+        "--live",
+        action="store_true",
+        help="Transcrever durante a gravação (regiões de fala concluídas)",
+    )
+    g.add_argument(
+        "--captions",
+        action="store_true",
+        help="Legendas ao vivo de baixa latência no terminal (use -p live)",
+    )
+    g.add_argument(
+        "-t", "--type",
+        default=None,
+        help="Tipo de sessão (perfil de decodificação do modo --live)",
+    )
+    g.add_argument(
+        "-p", "--profile",
+        choices=profile_names(),
+        default=None,
+        help="Perfil de decodificação dos modos --live/--captions",
+    )
     g.set_defaults(func=cmd_gravar)
 
     t = sub.add_parser("transcrever", help="Transcrever áudio WAV")
-    t.add_argument(
+    src = t.add_mutually_exclusive_group(required=True)
+    src.add_argument(
         "-a", "--audio",
-        required=True,
         help="Caminho do arquivo WAV",
     )
+    src.add_argument(
+        "--dir",
+        help="Lote: transcreve todos os áudios do diretório",
+    )
+    src.add_argument(
+        "--glob",
+        help='Lote: padrão glob (ex: "output/audio/*.wav")',
+    )
+    t.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="Processos paralelos para arquivos longos (1 = sequencial)",
+    )
+    t.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Lote: arquivos transcritos em paralelo (1 processo por job)",
+    )
+    t.add_argument(
+        "-t", "--type",
+        default=None,
+        help="Tipo de sessão (escolhe o perfil via [decode_profiles.session_types])",
+    )
+    t.add_argument(
+        "-p", "--profile",
+        choices=profile_names(),
+        default=None,
+        help="Perfil de decodificação (padrão: [transcription] target)",
+    )
+    t.add_argument(
+        "--manifest",
+        default=None,
+        help="Lote: caminho do manifesto JSONL (padrão: output/transcripts/batch_manifest.jsonl)",
+    )
     t.set_defaults(func=cmd_transcrever)
 
     args = parser.parse_args()
@@ -140,6 +397,11 @@ def main():
         parser.print_help()
         return
 
+    # Warm-up só faz sentido quando o mesmo processo vai transcrever
+    # (gravar --live/--captions dispara o seu no início do comando)
+    if args.cmd == "transcrever" and args.audio and args.workers <= 1:
+        _start_warmup(args)
+
     args.func(args)
 
 
@@ -154,3 +416,15 @@ if __name__ == "__main__":
 # - Correção: suporte a retorno dict do Whisper
 # - Logs explícitos de tamanho/keys do resultado
 # - Mantida separação CLI vs core
+#
+# 2026-10-18
+# - transcrever: opção -w/--workers (transcrição paralela por chunks)
+# - transcrever: barra de progresso (RTF/ETA) e TXT gravado por segmento
+# - transcrever --dir/--glob: lote com manifesto JSONL retomável (-j/--jobs)
+# - Warm-up opcional do modelo ([transcription.warmup] no config.toml)
+# - transcrever: perfis de decodificação (-p/--profile, -t/--type) com RTF no log
+# - gravar --live: transcrição durante a gravação (só o trecho final ao parar)
+# - gravar --captions: legendas em streaming (parciais + prefixo estável)
+# - gravar: formato de armazenamento de [recording] (WAV PCM16 / FLAC)
+# - transcrever: cache de transcrições (mesmo áudio + perfil não decodifica de novo)
+# - gravar --live/--captions: warm-up do modelo no início do comando
@@ -0,0 +1,271 @@
+"""
+app_jobs.py
+
+Tarefas da interface Streamlit executadas pela fila (core.job_queue).
+
+Responsabilidades:
+- "transcribe": transcrever um áudio (cache de PCM decodificado, cache
+  de transcrições, sidecar de palavras,
+  re-decodificação de lacunas do VAD, mapa do gate de fala, refino
+  estrutural) e salvar TXT + JSON em transcripts/
+- "summary": gerar resumo/ata de uma sessão consolidada
+- Reportar progresso pela callback da fila
+
+Decisões:
+- Mesmo pipeline que rodava inline no app.py; aqui sem Streamlit, para
+  continuar rodando entre reruns e recarregamentos do navegador
+- Parâmetros e resultados só com tipos JSON (caminhos como str): o
+  estado da tarefa é persistido em disco
+- O texto fica nos arquivos; o resultado da tarefa guarda caminhos e
+  métricas
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from core.audio.ingest import ingest
+from core.audio.speech_gate import load_kept_map, pause_map, remap_result, to_source_time
+from core.audio.storage import audio_duration
+from core.job_queue import Progress
+from core.segment_store import SegmentColumns, sidecar_path
+from core.transcription_cache import TranscriptionCache, decode_params
+from core.whisper_core import (
+    BEAM_SIZE,
+    COMPUTE_TYPE,
+    build_result,
+    redecode_gaps,
+    whisper_transcribe_iter,
+)
+from refiners.structural import refine_structural
+
+logger = logging.getLogger(__name__)
+
+# Transcrição suspeita de perda pelo VAD: áudio longo, quase sem texto
+SHORT_TEXT_MIN_AUDIO_S = 30.0
+SHORT_TEXT_MAX_CHARS = 80
+
+
+def _transcribe(
+    audio_path: Path,
+    transcript_dir: Path,
+    cache: TranscriptionCache,
+    profile: Dict[str, Any],
+    word_timestamps: bool,
+    progress: Progress,
+    pcm_dir: Path | None = None,
+) -> Tuple[Dict[str, Any], Optional[SegmentColumns]]:
+    """
+    Consome whisper_transcribe_iter anexando cada segmento em
+    <stem>.partial.txt. Resultado no cache por hash do audio + parametros.
+    Devolve (resultado, colunas com as palavras ou None); o sidecar e
+    gravado por save_transcript, depois do remapeamento.
+    """
+    model_name = profile["model"]
+    cache_key = cache.key_for(
+        audio_path,
+        **decode_params(model_name, COMPUTE_TYPE, True, BEAM_SIZE, None, profile),
+        word_timestamps=word_timestamps,
+    )
+    cached = cache.get(cache_key)
+    if cached is not None:
+        logger.info("Transcricao recuperada do cache | %s", audio_path.name)
+        columns = cache.get_columns(cache_key) if word_timestamps else None
+        return {**cached, "cached": True}, columns
+
+    progress(0.0, "Carregando modelo...")
+    partial_path = transcript_dir / f"{audio_path.stem}.partial.txt"
+
+    t0 = time.time()
+    segments = []
+    language = None
+    vad_dropped = None
+    audio_s = None
+    columns = SegmentColumns() if word_timestamps else None
+
+    with partial_path.open("w", encoding="utf-8") as partial:
+        for event in whisper_transcribe_iter(
+            audio_path,
+            word_timestamps=word_timestamps,
+            profile=profile,
+            pcm_dir=pcm_dir,
+        ):
+            segment = event["segment"]
+            if segment is not None:
+                partial.write(f"{segment['text']}\n")
+                partial.flush()
+
+                if columns is not None:
+                    columns.append(segment)
+                    segment = {k: segment[k] for k in ("start", "end", "text")}
+
+                segments.append(segment)
+            language = event["language"]
+            vad_dropped = event["vad_dropped"]
+            audio_s = event["audio_s"]
+
+            eta = event["eta_s"]
+            eta_label = f"{int(eta)}s" if eta is not None else "--"
+            progress(event["progress"], f"Transcrevendo... RTF {event['rtf']:.2f} | ETA {eta_label}")
+
+    partial_path.unlink(missing_ok=True)
+
+    result = build_result(
+        segments,
+        language,
+        time.time() - t0,
+        model_name,
+        vad_dropped=vad_dropped,
+        profile=profile,
+        audio_s=audio_s,
+    )
+    cache.put(cache_key, result, columns)
+    return result, columns
+
+
+def _redecode_gaps_cached(
+    audio_path: Path,
+    result: Dict[str, Any],
+    cache: TranscriptionCache,
+    profile: Dict[str, Any],
+    word_timestamps: bool,
+    pcm_dir: Path | None = None,
+) -> Dict[str, Any]:
+    """
+    Recupera fala que o VAD descartou decodificando so as lacunas.
+    Custo proporcional ao audio descartado (nao ao arquivo inteiro).
+    Mesma chave da primeira passada (perfil, word_timestamps) + lacunas.
+    """
+    cache_key = cache.key_for(
+        audio_path,
+        **decode_params(profile["model"], COMPUTE_TYPE, True, BEAM_SIZE, None, profile),
+        word_timestamps=word_timestamps,
+        redecode_gaps=True,
+    )
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return {**cached, "cached": True}
+
+    result = redecode_gaps(audio_path, result, profile=profile, pcm_dir=pcm_dir)
+    cache.put(cache_key, result)
+    return result
+
+
+def transcribe_job(params: Dict[str, Any], progress: Progress) -> Dict[str, Any]:
+    """
+    params: audio_path, transcript_dir, cache_dir, pcm_dir (opcional),
+    profile, word_timestamps, redecode_short (re-decodifica lacunas
+    quando o texto sai curto demais para a duração).
+    """
+    audio_path = Path(params["audio_path"])
+    transcript_dir = Path(params["transcript_dir"])
+    pcm_dir = Path(params["pcm_dir"]) if params.get("pcm_dir") else None
+    cache = TranscriptionCache(Path(params["cache_dir"]), pcm_dir=pcm_dir)
+    profile = params["profile"]
+
+    # mp3/m4a: duração exata vem da decodificação (feita uma vez, no cache)
+    duration = audio_duration(audio_path)
+    if duration is None and pcm_dir is not None:
+        progress(0.0, "Decodificando audio...")
+        duration = ingest(audio_path, pcm_dir)["duration_s"]
+
+    result, columns = _transcribe(
+        audio_path,
+        transcript_dir,
+        cache,
+        profile,
+        params.get("word_timestamps", False),
+        progress,
+        pcm_dir,
+    )
+    raw_text = result.get("text", "").strip()
+
+    if (
+        params.get("redecode_short")
+        and duration
+        and duration > SHORT_TEXT_MIN_AUDIO_S
+        and len(raw_text) < SHORT_TEXT_MAX_CHARS
+    ):
+        logger.warning("Transcricao curta detectada | re-decodificando lacunas do VAD")
+        progress(1.0, "Re-decodificando trechos descartados pelo VAD...")
+        result = _redecode_gaps_cached(
+            audio_path, result, cache, profile, params.get("word_timestamps", False), pcm_dir
+        )
+
+    # Lacunas re-decodificadas não têm palavras: ficam só no JSON
+    return save_transcript(audio_path, transcript_dir, result, duration, columns=columns)
+
+
+def save_transcript(
+    audio_path: Path,
+    transcript_dir: Path,
+    result: Dict[str, Any],
+    duration: float | None = None,
+    live: bool = False,
+    columns: Optional[SegmentColumns] = None,
+) -> Dict[str, Any]:
+    """
+    Refino estrutural + TXT/JSON em transcript_dir; devolve caminhos e
+    métricas. Com <audio>.kept.json (gate de fala, pausas), os
+    timestamps voltam ao tempo da sessão. live=True: result veio da
+    transcrição ao vivo, já no tempo do stream antes do gate; só as
+    pausas são somadas. columns (palavras) vira o sidecar .segments.npz,
+    no mesmo tempo do JSON.
+    """
+    kept_map = load_kept_map(audio_path)
+    if kept_map is not None:
+        mapping = pause_map(kept_map) if live else kept_map
+        result = remap_result(result, mapping)
+        if columns is not None:
+            columns.remap_times(lambda t: to_source_time(t, mapping))
+
+    refined_text = refine_structural(result.get("text", "").strip())
+
+    txt = transcript_dir / f"{audio_path.stem}.txt"
+    jsn = transcript_dir / f"{audio_path.stem}.json"
+    txt.write_text(refined_text, encoding="utf-8")
+    jsn.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    if columns is not None:
+        columns.save(sidecar_path(txt))
+
+    return {
+        "audio": str(audio_path),
+        "txt": str(txt),
+        "json": str(jsn),
+        "duration": duration,
+        "words": len(refined_text.split()),
+        "rtf": result.get("rtf"),
+        "cached": bool(result.get("cached")),
+    }
+
+
+def summary_job(params: Dict[str, Any], progress: Progress) -> Dict[str, Any]:
+    """params: session_dir, meeting_type."""
+    from core.summarizers.pipeline import run_summary_pipeline
+
+    progress(0.0, "Gerando resumo/ata...")
+    output_path = run_summary_pipeline(Path(params["session_dir"]), params["meeting_type"])
+    return {"output": str(output_path)}
+
+
+HANDLERS = {
+    "transcribe": transcribe_job,
+    "summary": summary_job,
+}
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criadas tarefas de transcrição e resumo para a fila em background
+# - Transcrição lê o cache de PCM (pcm_dir); duração exata para mp3/m4a
+# - Mapa .kept.json aplicado em save_transcript (também na transcrição ao vivo)
+# - Transcrição ao vivo: só as pausas (timestamps já estão antes do gate)
+# - Re-decodificação de lacunas com o perfil e a chave da primeira passada
+# - Sidecar de palavras gravado em save_transcript, depois do mapa .kept.json
+# - Acerto de cache refaz o sidecar a partir das colunas guardadas
@@ -0,0 +1,245 @@
+"""
+ingest.py
+
+Entrada de áudio para transcrição: uploads e cache de PCM decodificado.
+
+Responsabilidades:
+- Copiar uploads para o disco em blocos (sem read() do arquivo inteiro)
+- Decodificar qualquer container suportado (wav, flac, ogg, mp3, m4a)
+  em streaming para PCM 16 kHz mono, uma única vez por arquivo
+- Guardar o PCM em <pcm_dir>/<chave>.s16 (int16 cru, mapeável com
+  np.memmap) + <chave>.json com duração exata e origem
+- Servir o PCM do cache para transcrição, re-decodificação de lacunas
+  e novas tentativas
+- Ler trechos de áudio (visualizador de transcrição) sem carregar o
+  arquivo inteiro
+
+Decisões:
+- Decodificação com PyAV (já dependência do faster-whisper), quadro a
+  quadro: memória constante, independente da duração do arquivo
+- int16, como o decode_audio do faster-whisper produz internamente:
+  metade do disco de float32 e sem perda em relação a ele
+- Chave por (caminho, tamanho, mtime), como o memo de hash de
+  core.transcription_cache: arquivo alterado gera nova entrada
+- Escrita em .tmp + os.replace: entrada parcial nunca é lida; o .tmp
+  leva pid e thread no nome, então workers decodificando o mesmo
+  arquivo (ou PCM e .json da mesma chave) não escrevem no mesmo .tmp
+- Despejo por mtime (tocado a cada acerto) acima de max_bytes
+"""
+
+from __future__ import annotations
+
+import gc
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+
+import numpy as np
+import soundfile as sf
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+DEFAULT_PCM_DIR = Path("output") / "cache" / "pcm"
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024 * 1024
+COPY_CHUNK_BYTES = 1 << 20
+PCM_SUFFIX = ".s16"
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+# ---------------------------------------------------------
+# Uploads
+# ---------------------------------------------------------
+def copy_upload(source: BinaryIO, dest: Path, chunk_bytes: int = COPY_CHUNK_BYTES) -> Path:
+    """Copia um arquivo aberto (ex: UploadedFile) para dest em blocos."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _tmp_path(dest)
+    source.seek(0)
+    with tmp.open("wb") as out:
+        shutil.copyfileobj(source, out, chunk_bytes)
+    os.replace(tmp, dest)
+    return dest
+
+
+# ---------------------------------------------------------
+# Decodificação em streaming
+# ---------------------------------------------------------
+def iter_pcm16(audio_path: Path) -> Iterator[np.ndarray]:
+    """Blocos int16 mono 16 kHz decodificados do arquivo, em ordem."""
+    import av
+
+    resampler = av.audio.resampler.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+    try:
+        with av.open(str(audio_path), mode="r", metadata_errors="ignore") as container:
+            stream = container.streams.audio[0]
+            for packet in container.demux(stream):
+                try:
+                    frames = packet.decode()
+                except av.error.InvalidDataError:
+                    continue
+                for frame in frames:
+                    frame.pts = None
+                    for out in resampler.resample(frame):
+                        yield out.to_ndarray().reshape(-1)
+
+            # None esvazia o resampler
+            for out in resampler.resample(None):
+                yield out.to_ndarray().reshape(-1)
+    finally:
+        # Objetos do resampler só são liberados pelo GC (faster-whisper #390)
+        del resampler
+        gc.collect()
+
+
+# ---------------------------------------------------------
+# Cache de PCM
+# ---------------------------------------------------------
+def _entry_key(audio_path: Path) -> str:
+    stat = audio_path.stat()
+    return hashlib.sha1(
+        f"{audio_path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}".encode()
+    ).hexdigest()
+
+
+def cached_entry(audio_path: Path, pcm_dir: Path = DEFAULT_PCM_DIR) -> Optional[Dict[str, Any]]:
+    """Entrada do cache para audio_path, ou None se ainda não decodificado."""
+    key = _entry_key(audio_path)
+    meta_path = pcm_dir / f"{key}.json"
+    pcm_path = pcm_dir / f"{key}{PCM_SUFFIX}"
+    if not (meta_path.exists() and pcm_path.exists()):
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if pcm_path.stat().st_size != meta["frames"] * 2:
+        return None
+
+    os.utime(pcm_path)
+    return {**meta, "pcm": str(pcm_path)}
+
+
+def ingest(
+    audio_path: Path,
+    pcm_dir: Path = DEFAULT_PCM_DIR,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> Dict[str, Any]:
+    """
+    Decodifica audio_path para o cache (se ainda não estiver lá).
+
+    Retorna {"pcm", "sample_rate", "frames", "duration_s", "source"}.
+    """
+    if not audio_path.exists():
+        raise FileNotFoundError(f"Audio nao encontrado: {audio_path}")
+
+    entry = cached_entry(audio_path, pcm_dir)
+    if entry is not None:
+        return entry
+
+    pcm_dir.mkdir(parents=True, exist_ok=True)
+    key = _entry_key(audio_path)
+    pcm_path = pcm_dir / f"{key}{PCM_SUFFIX}"
+    tmp = _tmp_path(pcm_path)
+
+    t0 = time.time()
+    frames = 0
+    try:
+        with tmp.open("wb") as out:
+            for block in iter_pcm16(audio_path):
+                out.write(block.tobytes())
+                frames += block.shape[0]
+        os.replace(tmp, pcm_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    meta = {
+        "source": str(audio_path),
+        "sample_rate": SAMPLE_RATE,
+        "frames": frames,
+        "duration_s": frames / SAMPLE_RATE,
+    }
+    meta_path = pcm_dir / f"{key}.json"
+    meta_tmp = _tmp_path(meta_path)
+    meta_tmp.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    os.replace(meta_tmp, meta_path)
+
+    logger.info(
+        "Audio decodificado para cache PCM | %s | %.1fs de audio | %.2fs",
+        audio_path.name, meta["duration_s"], time.time() - t0,
+    )
+    _evict(pcm_dir, max_bytes, keep=pcm_path)
+    return {**meta, "pcm": str(pcm_path)}
+
+
+def open_pcm(entry: Dict[str, Any]) -> np.ndarray:
+    """PCM int16 da entrada mapeado em memória (somente leitura)."""
+    if entry["frames"] == 0:
+        return np.zeros(0, dtype=np.int16)
+    return np.memmap(entry["pcm"], dtype=np.int16, mode="r")
+
+
+def load_audio(audio_path: Path, pcm_dir: Path = DEFAULT_PCM_DIR) -> np.ndarray:
+    """
+    float32 mono 16 kHz pronto para o Whisper (equivalente a
+    faster_whisper.decode_audio), decodificando só na primeira vez.
+    """
+    pcm = open_pcm(ingest(audio_path, pcm_dir))
+    return pcm.astype(np.float32) / 32768.0
+
+
+def read_slice(
+    audio_path: Path,
+    start_s: float,
+    end_s: float,
+    pcm_dir: Path = DEFAULT_PCM_DIR,
+) -> tuple[np.ndarray, int]:
+    """
+    Trecho [start_s, end_s) como float32 mono, sem ler o arquivo
+    inteiro: seek no WAV/FLAC/OGG; demais formatos pelo cache de PCM.
+    Retorna (amostras, sample_rate).
+    """
+    try:
+        with sf.SoundFile(str(audio_path)) as f:
+            first = max(int(start_s * f.samplerate), 0)
+            f.seek(min(first, f.frames))
+            block = f.read(max(int(end_s * f.samplerate) - first, 0), dtype="float32", always_2d=True)
+            return block.mean(axis=1), f.samplerate
+    except RuntimeError:
+        pass
+
+    pcm = open_pcm(ingest(audio_path, pcm_dir))
+    first = max(int(start_s * SAMPLE_RATE), 0)
+    block = pcm[first:max(int(end_s * SAMPLE_RATE), first)]
+    return block.astype(np.float32) / 32768.0, SAMPLE_RATE
+
+
+def _evict(pcm_dir: Path, max_bytes: int, keep: Path) -> None:
+    entries = sorted(pcm_dir.glob(f"*{PCM_SUFFIX}"), key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in entries)
+    for path in entries:
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        total -= path.stat().st_size
+        path.unlink(missing_ok=True)
+        path.with_suffix(".json").unlink(missing_ok=True)
+        logger.info("Cache PCM: entrada despejada | %s", path.name)
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criada camada de ingestão: cópia de uploads em blocos e cache de PCM 16 kHz
+# - read_slice: trecho por seek (ou pelo cache de PCM) para tocar segmentos
+# - .tmp únicos por processo/thread (PCM e .json da mesma chave não colidem)
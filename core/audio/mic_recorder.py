@@ -1,12 +1,12 @@
 ﻿from __future__ import annotations
 
 import logging
-import os
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import speech_recognition as sr
-from faster_whisper import WhisperModel
+
+from core.model_pool import get_model
 
 
 class MicRecorder:
@@ -22,6 +22,8 @@ class MicRecorder:
         mic_index: Optional[int] = None,
         language: Optional[str] = None,
         download_root: str = "~/.cache/whisper",
+        open_microphone: bool = True,
+        num_workers: Optional[int] = None,
     ) -> None:
         if not logging.getLogger().handlers:
             logging.basicConfig(
@@ -31,13 +33,17 @@ class MicRecorder:
 
         self.logger = logging.getLogger(__name__)
         self.language = language
+        self.last_language: Optional[str] = None
+        self.last_language_probability = 0.0
 
-        model_root = os.path.expanduser(download_root)
-        self.model = WhisperModel(
+        # Compartilhado com whisper_core: instanciar outro MicRecorder
+        # com os mesmos parametros nao recarrega o modelo.
+        self.model = get_model(
             model,
             device=device,
             compute_type=compute_type,
-            download_root=model_root,
+            download_root=download_root,
+            num_workers=num_workers,
         )
 
         self.recognizer = sr.Recognizer()
@@ -45,9 +51,12 @@ class MicRecorder:
         self.recognizer.pause_threshold = pause
         self.recognizer.dynamic_energy_threshold = dynamic_energy
 
-        self.source = sr.Microphone(sample_rate=sample_rate, device_index=mic_index)
-        with self.source:
-            self.recognizer.adjust_for_ambient_noise(self.source)
+        # Sem microfone: so transcricao de chunks ja gravados (--resume)
+        self.source = None
+        if open_microphone:
+            self.source = sr.Microphone(sample_rate=sample_rate, device_index=mic_index)
+            with self.source:
+                self.recognizer.adjust_for_ambient_noise(self.source)
 
     def record_until_stop(self) -> str:
         self.logger.info("Listening until silence...")
@@ -61,16 +70,66 @@ class MicRecorder:
             audio = self.recognizer.record(microphone, duration=seconds)
         return self.transcribe_audio(audio.get_raw_data())
 
-    def transcribe_audio(self, audio_bytes: bytes) -> str:
+    def transcribe_audio(self, audio_bytes: bytes, language: Optional[str] = None) -> str:
+        """
+        Transcreve PCM16 mono. `language` sobrepõe self.language (ex:
+        idioma fixado pela sessão). Idioma/probabilidade detectados ficam
+        em last_language / last_language_probability.
+        """
+        text, detected, probability = self.transcribe_with_info(audio_bytes, language)
+        if detected is not None:
+            self.last_language = detected
+            self.last_language_probability = probability
+        return text
+
+    def transcribe_with_info(
+        self,
+        audio_bytes: bytes,
+        language: Optional[str] = None,
+    ) -> Tuple[str, Optional[str], float]:
+        """
+        Como transcribe_audio, mas devolve (texto, idioma, probabilidade)
+        sem tocar em last_*: seguro para vários workers em paralelo.
+        """
+        if not audio_bytes:
+            return "", None, 0.0
+
+        segments, info = self._decode(audio_bytes, language)
+        text = "".join(segment.text for segment in segments).strip()
+        return text, info.language, float(info.language_probability)
+
+    def transcribe_words(
+        self,
+        audio_bytes: bytes,
+        language: Optional[str] = None,
+        offset_s: float = 0.0,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], float]:
+        """
+        Palavras com timestamps ({start, end, word, probability}),
+        deslocadas por offset_s (posição do chunk na sessão).
+        """
         if not audio_bytes:
-            return ""
+            return [], None, 0.0
 
+        segments, info = self._decode(audio_bytes, language, word_timestamps=True)
+        words = [
+            {
+                "start": offset_s + word.start,
+                "end": offset_s + word.end,
+                "word": word.word,
+                "probability": word.probability,
+            }
+            for segment in segments
+            for word in (segment.words or [])
+        ]
+        return words, info.language, float(info.language_probability)
+
+    def _decode(self, audio_bytes: bytes, language: Optional[str], **kwargs: Any):
         audio = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
 
-        kwargs = {}
-        if self.language:
-            kwargs["language"] = self.language
+        language = language or self.language
+        if language:
+            kwargs["language"] = language
 
-        segments, _info = self.model.transcribe(audio, **kwargs)
-        text = "".join(segment.text for segment in segments).strip()
-        return text
+        segments, info = self.model.transcribe(audio, **kwargs)
+        return list(segments), info
@@ -0,0 +1,175 @@
+"""
+ring_buffer.py
+
+Buffer circular pré-alocado para o callback de captura (sounddevice).
+
+Responsabilidades:
+- Receber blocos no callback com uma única cópia (slice assignment)
+  para um array alocado uma vez, sem criar objetos por bloco
+- Permitir leitores independentes (writer de arquivo, transcrição ao
+  vivo, medidor de nível), cada um com seu próprio cursor
+- Contar overruns (blocos descartados) e registrar o high-watermark
+
+Decisões:
+- Um produtor; cada leitor é consumido por uma única thread. Posições
+  são contadores monotônicos de frames (int do Python): o produtor só
+  escreve _written e cada leitor só escreve o próprio cursor, então
+  não há lock
+- Sem espaço (leitor mais lento atrasado), o bloco inteiro é
+  descartado e contado: o callback de áudio nunca espera e dados ainda
+  não lidos nunca são sobrescritos
+- peek_latest() não tem cursor e não segura o produtor (medidor de
+  nível pode perder amostras sem problema)
+- Leitores "lossy" (ex: transcrição ao vivo) também não seguram o
+  produtor: se ficarem para trás, pulam o áudio mais antigo e contam
+  skipped_frames. A gravação em arquivo nunca perde áudio por causa
+  de um consumidor lento
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+# Leitor lossy pula para manter esta folga em relação ao produtor
+_LOSSY_MARGIN = 0.1
+
+
+class RingReader:
+    """Cursor de leitura; deve ser consumido por uma única thread."""
+
+    def __init__(self, ring: "RingBuffer", position: int, lossy: bool = False) -> None:
+        self._ring = ring
+        self.position = position
+        self.lossy = lossy
+        self.skipped_frames = 0
+
+    def available(self) -> int:
+        return self._ring._written - self.position
+
+    def read(self, max_frames: Optional[int] = None) -> np.ndarray:
+        """Copia até max_frames frames disponíveis e avança o cursor."""
+        ring = self._ring
+        count = self.available()
+        if self.lossy:
+            limit = int(ring.capacity * (1 - _LOSSY_MARGIN))
+            if count > limit:
+                self.skipped_frames += count - limit
+                self.position += count - limit
+                count = limit
+        if max_frames is not None:
+            count = min(count, max_frames)
+        if count <= 0:
+            return ring._data[:0].copy()
+
+        start = self.position % ring.capacity
+        first = min(count, ring.capacity - start)
+        out = np.empty((count, ring.channels), dtype=ring._data.dtype)
+        out[:first] = ring._data[start: start + first]
+        if first < count:
+            out[first:] = ring._data[: count - first]
+
+        self.position += count
+        return out
+
+    def close(self) -> None:
+        self._ring.remove_reader(self)
+
+
+class RingBuffer:
+    def __init__(
+        self,
+        capacity_frames: int,
+        channels: int = 1,
+        dtype: Any = np.float32,
+    ) -> None:
+        self.capacity = int(capacity_frames)
+        self.channels = channels
+        self._data = np.zeros((self.capacity, channels), dtype=dtype)
+        self._readers: List[RingReader] = []
+
+        self._written = 0
+        self.overruns = 0
+        self.dropped_frames = 0
+        self.high_watermark = 0
+
+    # -----------------------------------------------------
+    # Leitores
+    # -----------------------------------------------------
+    def add_reader(self, lossy: bool = False) -> RingReader:
+        """Novo cursor a partir do ponto atual (não lê o passado)."""
+        reader = RingReader(self, self._written, lossy)
+        # Cópia + troca: o produtor itera a lista antiga sem lock
+        self._readers = self._readers + [reader]
+        return reader
+
+    def remove_reader(self, reader: RingReader) -> None:
+        self._readers = [r for r in self._readers if r is not reader]
+
+    def _fill(self) -> int:
+        readers = [r for r in self._readers if not r.lossy]
+        if not readers:
+            return 0
+        return self._written - min(r.position for r in readers)
+
+    # -----------------------------------------------------
+    # Produtor (callback)
+    # -----------------------------------------------------
+    def write(self, block: np.ndarray) -> bool:
+        """
+        Copia o bloco para o buffer. Retorna False (overrun) se algum
+        leitor ainda não liberou espaço suficiente.
+        """
+        frames = block.shape[0]
+        fill = self._fill()
+        if fill + frames > self.capacity:
+            self.overruns += 1
+            self.dropped_frames += frames
+            return False
+
+        start = self._written % self.capacity
+        first = min(frames, self.capacity - start)
+        self._data[start: start + first] = block[:first].reshape(first, self.channels)
+        if first < frames:
+            self._data[: frames - first] = block[first:].reshape(frames - first, self.channels)
+
+        self._written += frames
+        if fill + frames > self.high_watermark:
+            self.high_watermark = fill + frames
+        return True
+
+    # -----------------------------------------------------
+    # Consulta
+    # -----------------------------------------------------
+    @property
+    def frames_written(self) -> int:
+        return self._written
+
+    def peek_latest(self, frames: int) -> np.ndarray:
+        """Cópia dos últimos `frames` escritos (para medidores de nível)."""
+        frames = min(frames, self._written, self.capacity)
+        end = self._written % self.capacity
+        if frames <= end:
+            return self._data[end - frames: end].copy()
+        return np.concatenate((self._data[self.capacity - (frames - end):], self._data[:end]))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "capacity_frames": self.capacity,
+            "frames_written": self._written,
+            "fill_frames": self._fill(),
+            "high_watermark_frames": self.high_watermark,
+            "high_watermark_ratio": round(self.high_watermark / self.capacity, 3),
+            "overruns": self.overruns,
+            "dropped_frames": self.dropped_frames,
+        }
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado buffer circular pré-alocado (um produtor, leitores com cursor)
+# - Leitores lossy (não seguram o produtor; pulam áudio se atrasarem)
@@ -0,0 +1,194 @@
+"""
+silence.py
+
+Detecção barata de silêncio por energia (vetorizada com NumPy).
+
+Responsabilidades:
+- Calcular energia RMS por janela curta (frames)
+- Escolher pontos de corte em regiões de baixa energia
+- Cortar chunks online (captura contínua) perto do tamanho alvo
+- Não depender de modelo (roda antes/fora do Whisper)
+
+Decisão técnica:
+- O corte é o frame de MENOR energia dentro de uma janela de tolerância
+  ao redor do alvo, não um limiar absoluto: microfones com AGC não têm
+  um "zero" confiável (ver docs/POSTMORTEM_TRANSCRICAO.md)
+"""
+
+from __future__ import annotations
+
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+FRAME_MS = 30
+QUIET_RATIO = 0.1
+
+
+def frame_rms(audio: np.ndarray, sample_rate: int, frame_ms: int = FRAME_MS) -> np.ndarray:
+    """RMS por frame de frame_ms; o último frame incompleto é descartado."""
+    frame_len = max(1, int(sample_rate * frame_ms / 1000))
+    n_frames = audio.shape[0] // frame_len
+    if n_frames == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    frames = audio[: n_frames * frame_len].reshape(n_frames, frame_len)
+    return np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+
+
+def quietest_point(
+    audio: np.ndarray,
+    sample_rate: int,
+    start: int,
+    end: int,
+    frame_ms: int = FRAME_MS,
+) -> int:
+    """
+    Retorna o índice (amostra) do centro do frame mais silencioso
+    dentro de [start, end).
+    """
+    start = max(0, start)
+    end = min(audio.shape[0], end)
+    rms = frame_rms(audio[start:end], sample_rate, frame_ms)
+    if rms.size == 0:
+        return min(max(start, 0), audio.shape[0])
+
+    frame_len = max(1, int(sample_rate * frame_ms / 1000))
+    best = int(np.argmin(rms))
+    return start + best * frame_len + frame_len // 2
+
+
+def nearest_quiet_point(
+    audio: np.ndarray,
+    sample_rate: int,
+    center: int,
+    tolerance: int,
+    frame_ms: int = FRAME_MS,
+    quiet_ratio: float = QUIET_RATIO,
+) -> int:
+    """
+    Como quietest_point, mas entre os frames "quietos" da janela
+    [center - tolerance, center + tolerance) escolhe o mais próximo de
+    center. Quieto = RMS até min + quiet_ratio * (mediana - min) da
+    própria janela (limiar relativo, sem zero absoluto).
+    """
+    start = max(0, center - tolerance)
+    end = min(audio.shape[0], center + tolerance)
+    rms = frame_rms(audio[start:end], sample_rate, frame_ms)
+    if rms.size == 0:
+        return min(max(center, 0), audio.shape[0])
+
+    floor = float(rms.min())
+    threshold = floor + quiet_ratio * (float(np.median(rms)) - floor)
+    quiet = np.flatnonzero(rms <= threshold)
+
+    frame_len = max(1, int(sample_rate * frame_ms / 1000))
+    centers = start + quiet * frame_len + frame_len // 2
+    return int(centers[np.argmin(np.abs(centers - center))])
+
+
+class Chunk(NamedTuple):
+    audio: np.ndarray
+    start: int          # amostra inicial na sessão
+    end: int            # amostra final (exclusiva) na sessão
+    cut: str            # "silence" | "final"
+
+
+class OnlineChunker:
+    """
+    Acumula áudio da captura e emite chunks cortados no ponto quieto
+    mais próximo de target_s (± tolerance_s). Mantém no máximo
+    target_s + tolerance_s de áudio em memória.
+
+    Com overlap_s > 0, cada chunk começa overlap_s antes do corte
+    anterior (as bordas são unidas depois por core.stitcher).
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        target_s: float,
+        tolerance_s: float,
+        frame_ms: int = FRAME_MS,
+        overlap_s: float = 0.0,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.target = int(target_s * sample_rate)
+        self.tolerance = int(min(tolerance_s, target_s / 2) * sample_rate)
+        self.frame_ms = frame_ms
+        # Overlap menor que o menor chunk possível
+        self.overlap = min(int(overlap_s * sample_rate), max(self.target - self.tolerance - 1, 0))
+
+        self._pieces: List[np.ndarray] = []
+        self._buffered = 0
+        self._carried = 0   # amostras de overlap já emitidas no chunk anterior
+        self._offset = 0
+
+    def feed(self, audio: np.ndarray) -> List[Chunk]:
+        self._pieces.append(audio)
+        self._buffered += audio.shape[0]
+
+        chunks: List[Chunk] = []
+        while self._buffered >= self.target + self.tolerance:
+            buffer = np.concatenate(self._pieces)
+            cut = nearest_quiet_point(
+                buffer, self.sample_rate, self.target, self.tolerance, self.frame_ms
+            )
+            chunks.append(self._emit(buffer, cut, "silence"))
+        return chunks
+
+    def flush(self) -> Optional[Chunk]:
+        """Emite o resto (fim da sessão), se houver áudio novo."""
+        if self._buffered <= self._carried:
+            return None
+        buffer = np.concatenate(self._pieces)
+        return self._emit(buffer, buffer.shape[0], "final")
+
+    def _emit(self, buffer: np.ndarray, cut: int, reason: str) -> Chunk:
+        keep_from = cut - self.overlap if reason != "final" else cut
+        rest = buffer[keep_from:].copy()  # não segura o buffer inteiro
+        self._pieces = [rest] if rest.shape[0] else []
+        self._buffered = rest.shape[0]
+        self._carried = cut - keep_from
+
+        chunk = Chunk(buffer[:cut], self._offset, self._offset + cut, reason)
+        self._offset += keep_from
+        return chunk
+
+
+def find_silence_cuts(
+    audio: np.ndarray,
+    sample_rate: int,
+    target_s: float,
+    tolerance_s: float,
+    frame_ms: int = FRAME_MS,
+) -> List[int]:
+    """
+    Pontos de corte (amostras) próximos de cada múltiplo de target_s,
+    ajustados para o frame mais silencioso em ±tolerance_s.
+
+    Não inclui 0 nem o fim do áudio.
+    """
+    total = audio.shape[0]
+    target = int(target_s * sample_rate)
+    tolerance = int(tolerance_s * sample_rate)
+
+    cuts: List[int] = []
+    last = 0
+    while total - last > target + tolerance:
+        ideal = last + target
+        cut = quietest_point(audio, sample_rate, ideal - tolerance, ideal + tolerance, frame_ms)
+        if cut <= last:
+            cut = ideal
+        cuts.append(cut)
+        last = cut
+    return cuts
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado detector de silêncio por energia para cortes de chunk
+# - Corte online (OnlineChunker) no ponto quieto mais próximo do alvo
+# - OnlineChunker: overlap opcional entre chunks consecutivos
@@ -0,0 +1,362 @@
+"""
+speech_gate.py
+
+Gate de fala na captura: descarta silêncios longos antes do disco.
+
+Responsabilidades:
+- Classificar frames curtos como fala/silêncio por energia (vetorizado,
+  core.audio.silence.frame_rms)
+- Manter pausas de até max_silence_s inteiras e descartar o excesso
+  de silêncios mais longos (intervalos, compartilhamento de tela)
+- Registrar o mapa de intervalos mantidos (<nome>.kept.json) para
+  converter timestamps do arquivo em tempo real da reunião
+- Remapear segmentos/palavras transcritos do arquivo para esse tempo
+- Incluir no mesmo mapa as pausas da gravação (pausar/retomar sem
+  fechar o arquivo): uma sessão, um arquivo, uma transcrição
+
+Decisões:
+- Limiar relativo a um piso de ruído adaptativo (desce rápido, sobe
+  devagar), não absoluto: microfones com AGC não têm um "zero"
+  confiável (ver docs/POSTMORTEM_TRANSCRICAO.md)
+- Silêncio descartado guarda os últimos pad_s em um pré-roll: o início
+  da fala (consoantes fracas) nunca é cortado
+- Mapa compacto: um trio [início_origem, fim_origem, início_arquivo]
+  por intervalo mantido, em segundos; started_at dá o relógio de parede
+- Roda na thread do writer, nunca no callback de áudio
+- Pausas medidas em amostras descartadas pelo callback (relógio do
+  dispositivo) e aplicadas ao mapa no fim: o gate não precisa saber
+  delas e a gravação sem gate usa o mesmo formato
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from core.audio.silence import frame_rms
+
+GATE_FRAME_MS = 20
+MAX_SILENCE_S = 3.0
+PAD_S = 0.3
+THRESHOLD_RATIO = 3.0       # ~10 dB acima do piso de ruído
+MIN_RMS = 1e-4
+FLOOR_RISE = 0.02           # fração por bloco que o piso sobe
+KEPT_SUFFIX = ".kept.json"
+
+
+def load_gate_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Lê [recording.speech_gate] com defaults seguros (desligado)."""
+    cfg = config.get("recording", {}).get("speech_gate", {})
+    return {
+        "enabled": bool(cfg.get("enabled", False)),
+        "max_silence_s": float(cfg.get("max_silence_s", MAX_SILENCE_S)),
+        "pad_s": float(cfg.get("pad_s", PAD_S)),
+    }
+
+
+class SpeechGate:
+    def __init__(
+        self,
+        sample_rate: int,
+        max_silence_s: float = MAX_SILENCE_S,
+        pad_s: float = PAD_S,
+        frame_ms: int = GATE_FRAME_MS,
+        threshold_ratio: float = THRESHOLD_RATIO,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.max_silence_s = max_silence_s
+        self.frame_ms = frame_ms
+        self.frame_len = max(1, int(sample_rate * frame_ms / 1000))
+        self.max_silence_frames = int(max_silence_s * 1000 / frame_ms)
+        self.threshold_ratio = threshold_ratio
+
+        self._pending = np.zeros((0, 1), dtype=np.float32)   # resto < 1 frame
+        self._preroll: deque = deque(maxlen=max(1, int(pad_s * 1000 / frame_ms)))
+        self._silence_run = 0
+        self._floor: Optional[float] = None
+
+        self.source_frames = 0       # amostras recebidas
+        self.kept_frames = 0         # amostras mantidas (arquivo)
+        self.intervals: List[List[int]] = []   # [origem_ini, origem_fim, arquivo_ini]
+        self.started_at = datetime.now()
+
+    # -----------------------------------------------------
+    # Processamento
+    # -----------------------------------------------------
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Recebe (n, canais); devolve só as amostras mantidas."""
+        if self._pending.shape[1] != block.shape[1]:
+            self._pending = np.zeros((0, block.shape[1]), dtype=block.dtype)
+        data = np.concatenate((self._pending, block)) if self._pending.size else block
+        n_frames = data.shape[0] // self.frame_len
+        self._pending = data[n_frames * self.frame_len:].copy()
+        if n_frames == 0:
+            return data[:0]
+
+        frames = data[: n_frames * self.frame_len]
+        rms = frame_rms(frames.mean(axis=1), self.sample_rate, self.frame_ms)
+        speech = rms > self._threshold(rms)
+
+        kept: List[np.ndarray] = []
+        for i in range(n_frames):
+            start = self.source_frames
+            frame = frames[i * self.frame_len: (i + 1) * self.frame_len]
+            self.source_frames += self.frame_len
+
+            if speech[i]:
+                self._silence_run = 0
+                while self._preroll:
+                    kept.append(self._keep(*self._preroll.popleft()))
+                kept.append(self._keep(frame, start))
+                continue
+
+            self._silence_run += 1
+            if self._silence_run <= self.max_silence_frames:
+                kept.append(self._keep(frame, start))
+            else:
+                self._preroll.append((frame, start))
+
+        return np.concatenate(kept) if kept else data[:0]
+
+    def flush(self) -> np.ndarray:
+        """Fim da captura: o resto (< 1 frame) é mantido se não estiver descartando."""
+        rest, self._pending = self._pending, self._pending[:0]
+        if rest.shape[0] == 0 or self._silence_run > self.max_silence_frames:
+            self.source_frames += rest.shape[0]
+            return rest[:0]
+        kept = self._keep(rest, self.source_frames)
+        self.source_frames += rest.shape[0]
+        return kept
+
+    def _threshold(self, rms: np.ndarray) -> float:
+        low = float(np.percentile(rms, 10))
+        if self._floor is None or low < self._floor:
+            self._floor = low
+        elif low < self._floor * self.threshold_ratio:
+            # Só blocos com cara de silêncio sobem o piso: fala
+            # contínua nunca vira "ruído de fundo"
+            self._floor += (low - self._floor) * FLOOR_RISE
+        return max(self._floor * self.threshold_ratio, MIN_RMS)
+
+    def _keep(self, frame: np.ndarray, source_start: int) -> np.ndarray:
+        last = self.intervals[-1] if self.intervals else None
+        if last is not None and last[1] == source_start:
+            last[1] += frame.shape[0]
+        else:
+            self.intervals.append([source_start, source_start + frame.shape[0], self.kept_frames])
+        self.kept_frames += frame.shape[0]
+        return frame
+
+    # -----------------------------------------------------
+    # Mapa de intervalos
+    # -----------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        sr = self.sample_rate
+        return {
+            "source_s": round(self.source_frames / sr, 3),
+            "kept_s": round(self.kept_frames / sr, 3),
+            "dropped_s": round((self.source_frames - self.kept_frames) / sr, 3),
+            "kept_intervals": len(self.intervals),
+        }
+
+    def kept_map(self) -> Dict[str, Any]:
+        sr = self.sample_rate
+        return {
+            "version": 1,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "sample_rate": sr,
+            "max_silence_s": self.max_silence_s,
+            **self.stats(),
+            "intervals": [
+                [round(a / sr, 3), round(b / sr, 3), round(k / sr, 3)]
+                for a, b, k in self.intervals
+            ],
+        }
+
+    def save_map(self, audio_path: Path) -> Path:
+        return save_kept_map(audio_path, self.kept_map())
+
+
+# ---------------------------------------------------------
+# Pausas
+# ---------------------------------------------------------
+def linear_map(frames: int, sample_rate: int, started_at: datetime) -> Dict[str, Any]:
+    """Mapa de uma captura sem gate: tudo mantido, num só intervalo."""
+    seconds = round(frames / sample_rate, 3)
+    return {
+        "version": 1,
+        "started_at": started_at.isoformat(timespec="seconds"),
+        "sample_rate": sample_rate,
+        "source_s": seconds,
+        "kept_s": seconds,
+        "dropped_s": 0.0,
+        "kept_intervals": 1,
+        "intervals": [[0.0, seconds, 0.0]] if frames else [],
+    }
+
+
+def add_pauses(kept_map: Dict[str, Any], pauses: List[List[int]]) -> Dict[str, Any]:
+    """
+    Cópia de kept_map com as pausas inseridas no tempo de origem.
+
+    pauses: [[posição, duração]] em amostras, ambas no stream entregue
+    ao gate (posição = amostras capturadas antes da pausa).
+    """
+    sr = kept_map["sample_rate"]
+    marks = [(pos / sr, dur / sr) for pos, dur in sorted(pauses)]
+
+    def shift(t: float) -> float:
+        # Pausa exatamente em t aconteceu antes do áudio de t
+        return sum(dur for pos, dur in marks if pos <= t)
+
+    intervals: List[List[float]] = []
+    for source_start, source_end, kept_start in kept_map["intervals"]:
+        cuts = [pos for pos, _dur in marks if source_start < pos < source_end]
+        bounds = [source_start, *cuts, source_end]
+        for a, b in zip(bounds, bounds[1:]):
+            intervals.append([
+                round(a + shift(a), 3),
+                round(b + shift(a), 3),
+                round(kept_start + (a - source_start), 3),
+            ])
+
+    paused_s = sum(dur for _pos, dur in marks)
+    return {
+        **kept_map,
+        "source_s": round(kept_map["source_s"] + paused_s, 3),
+        "paused_s": round(paused_s, 3),
+        "pauses": [
+            [round(pos + shift(pos) - dur, 3), round(dur, 3)] for pos, dur in marks
+        ],
+        "kept_intervals": len(intervals),
+        "intervals": intervals,
+    }
+
+
+def pause_map(kept_map: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Mapa só com as pausas de kept_map, sem os cortes do gate: para
+    timestamps no tempo do stream capturado (transcrição ao vivo, que
+    recebe o áudio antes do gate mas não o das pausas).
+    """
+    sr = kept_map["sample_rate"]
+    stream_s = round(kept_map["source_s"] - kept_map.get("paused_s", 0.0), 3)
+    base = {
+        **kept_map,
+        "source_s": stream_s,
+        "kept_s": stream_s,
+        "dropped_s": 0.0,
+        "kept_intervals": 1,
+        "intervals": [[0.0, stream_s, 0.0]] if stream_s else [],
+    }
+
+    # pauses está no tempo da sessão; add_pauses quer a posição no stream
+    pauses: List[List[int]] = []
+    before = 0.0
+    for start, duration in kept_map.get("pauses", []):
+        pauses.append([round((start - before) * sr), round(duration * sr)])
+        before += duration
+    return add_pauses(base, pauses) if pauses else base
+
+
+# ---------------------------------------------------------
+# Leitura / remapeamento
+# ---------------------------------------------------------
+def kept_map_path(audio_path: Path) -> Path:
+    return audio_path.with_name(audio_path.stem + KEPT_SUFFIX)
+
+
+def save_kept_map(audio_path: Path, kept_map: Dict[str, Any]) -> Path:
+    path = kept_map_path(audio_path)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(kept_map, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def load_kept_map(audio_path: Path) -> Optional[Dict[str, Any]]:
+    path = kept_map_path(audio_path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def to_source_time(t: float, kept_map: Dict[str, Any]) -> float:
+    """Segundos no arquivo -> segundos desde o início da gravação."""
+    intervals = kept_map["intervals"]
+    if not intervals:
+        return t
+    starts = [k for _a, _b, k in intervals]
+    i = max(bisect.bisect_right(starts, t) - 1, 0)
+    source_start, source_end, kept_start = intervals[i]
+    return min(source_start + (t - kept_start), source_end)
+
+
+def to_file_time(t: float, kept_map: Dict[str, Any]) -> float:
+    """
+    Inverso de to_source_time: segundos da gravação -> segundos no
+    arquivo. Instantes descartados (silêncio, pausa) caem no início do
+    trecho mantido seguinte.
+    """
+    intervals = kept_map["intervals"]
+    if not intervals:
+        return t
+    starts = [a for a, _b, _k in intervals]
+    i = max(bisect.bisect_right(starts, t) - 1, 0)
+    source_start, source_end, kept_start = intervals[i]
+    if t > source_end and i + 1 < len(intervals):
+        return intervals[i + 1][2]
+    return kept_start + min(max(t - source_start, 0.0), source_end - source_start)
+
+
+def to_wall_clock(t: float, kept_map: Dict[str, Any]) -> datetime:
+    started = datetime.fromisoformat(kept_map["started_at"])
+    return started + timedelta(seconds=to_source_time(t, kept_map))
+
+
+def remap_result(result: Dict[str, Any], kept_map: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Cópia de result com timestamps de segmentos (e palavras) no tempo
+    da reunião; vad_dropped continua no tempo do arquivo.
+    """
+    def remap(item: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **item,
+            "start": to_source_time(item["start"], kept_map),
+            "end": to_source_time(item["end"], kept_map),
+        }
+
+    segments = []
+    for segment in result.get("segments", []):
+        segment = remap(segment)
+        if "words" in segment:
+            segment["words"] = [remap(w) for w in segment["words"]]
+        segments.append(segment)
+
+    return {
+        **result,
+        "segments": segments,
+        "speech_gate": {
+            "started_at": kept_map["started_at"],
+            "source_s": kept_map["source_s"],
+            "kept_s": kept_map["kept_s"],
+            "paused_s": kept_map.get("paused_s", 0.0),
+        },
+    }
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado gate de fala na captura com mapa de intervalos mantidos
+# - Pausas da gravação no mesmo mapa (add_pauses / linear_map)
+# - to_file_time: tempo da gravação -> tempo do arquivo (tocar trechos)
+# - pause_map: só as pausas, para timestamps da transcrição ao vivo
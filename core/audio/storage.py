@@ -0,0 +1,122 @@
+"""
+storage.py
+
+Formato de armazenamento das gravações ([recording] no config.toml).
+
+Responsabilidades:
+- Ler a opção de formato: "wav" (PCM 16 bits) ou "flac" (16 bits sem
+  perdas, gravado de forma incremental)
+- Converter float -> 16 bits com dither TPDF
+- Ler/escrever PCM 16 bits em qualquer um dos formatos (chunks do
+  mic_cli, retomada de sessão)
+- Duração de arquivos sem depender do container
+
+Decisões:
+- Arquivo parcial da captura: WAV FLOAT no formato "wav" (como antes) e
+  FLAC PCM_24 no formato "flac" — 24 bits preservam a precisão para o
+  ganho de normalização aplicado depois, com ~3-4x menos disco e I/O
+  que float32 em fala
+- Arquivo final sempre em 16 bits (o que o Whisper usa); o FLAC reduz
+  o armazenamento em ~2x sobre o WAV PCM16 sem perda
+- Dither TPDF de ±1 LSB: remove a distorção de quantização em trechos
+  baixos; desligável (dither = false) para saídas bit-exatas
+- soundfile (libsndfile) lê ambos; whisper_core usa PyAV/ffmpeg e não
+  depende do container
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import soundfile as sf
+
+from core.audio.speech_gate import load_gate_config
+
+FORMATS: Dict[str, Dict[str, str]] = {
+    "wav": {"container": "WAV", "suffix": ".wav", "capture_subtype": "FLOAT"},
+    "flac": {"container": "FLAC", "suffix": ".flac", "capture_subtype": "PCM_24"},
+}
+DEFAULT_FORMAT = "wav"
+FINAL_SUBTYPE = "PCM_16"
+
+_LSB16 = 1.0 / 32768.0
+
+
+def load_storage_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Lê [recording] com defaults compatíveis (WAV, com dither, sem gate
+    de fala — ver core.audio.speech_gate).
+    """
+    cfg = config.get("recording", {})
+    fmt = str(cfg.get("format", DEFAULT_FORMAT)).lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"[recording] format invalido: {fmt} (use {', '.join(FORMATS)})")
+    return {
+        "format": fmt,
+        "dither": bool(cfg.get("dither", True)),
+        "speech_gate": load_gate_config(config),
+    }
+
+
+def suffix(fmt: str) -> str:
+    return FORMATS[fmt]["suffix"]
+
+
+def container(fmt: str) -> str:
+    return FORMATS[fmt]["container"]
+
+
+def capture_subtype(fmt: str) -> str:
+    return FORMATS[fmt]["capture_subtype"]
+
+
+def tpdf_dither(block: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Soma ruído triangular de ±1 LSB (16 bits) antes da quantização."""
+    noise = rng.random(block.shape, dtype=np.float32) - rng.random(block.shape, dtype=np.float32)
+    return block + noise * np.float32(_LSB16)
+
+
+# ---------------------------------------------------------
+# PCM 16 bits (bytes) — chunks do mic_cli
+# ---------------------------------------------------------
+def write_pcm16(audio_bytes: bytes, sample_rate: int, path: Path) -> None:
+    """Grava bytes int16 mono; o container segue a extensão de path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    samples = np.frombuffer(audio_bytes, dtype=np.int16)
+    sf.write(str(path), samples, sample_rate, subtype=FINAL_SUBTYPE)
+
+
+def read_pcm16(path: Path) -> bytes:
+    samples, _sr = sf.read(str(path), dtype="int16")
+    return samples.tobytes()
+
+
+def audio_info(path: Path) -> Dict[str, Any]:
+    info = sf.info(str(path))
+    return {"sample_rate": info.samplerate, "frames": info.frames, "duration_s": info.duration}
+
+
+def audio_duration(path: Path) -> Optional[float]:
+    """Duração em segundos (WAV, FLAC, OGG...); None se ilegível."""
+    try:
+        return float(sf.info(str(path)).duration)
+    except RuntimeError:
+        return None
+
+
+def find_audio(directory: Path, pattern: str) -> List[Path]:
+    """Arquivos que casam com pattern em qualquer formato suportado."""
+    found: List[Path] = []
+    for fmt in FORMATS:
+        found.extend(directory.glob(f"{pattern}{suffix(fmt)}"))
+    return sorted(found)
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado formato de armazenamento configurável (WAV PCM16 / FLAC) com dither TPDF
+# - [recording.speech_gate] incluído na configuração de gravação
@@ -0,0 +1,223 @@
+"""
+stream_writer.py
+
+Gravação em disco por streaming (sem acumular o áudio em RAM).
+
+Responsabilidades:
+- Receber blocos do callback de captura sem bloqueá-lo
+- Drenar o buffer circular em uma thread e anexar ao SoundFile aberto
+- Atualizar o cabeçalho periodicamente (arquivo parcial reproduzível)
+- Acumular estatísticas do sinal (pico, RMS, std) sem reler o áudio
+- Aplicar ganho em uma segunda passada, também em blocos
+
+Decisões:
+- Buffer circular pré-alocado (core.audio.ring_buffer): se o disco
+  travar, blocos são descartados e contados (o callback nunca espera).
+  Outros consumidores podem abrir leitores no mesmo buffer (writer.ring)
+- Captura em FLOAT (WAV) ou PCM_24 (FLAC, core.audio.storage): o
+  ganho de normalização é aplicado depois, sem perda de precisão em
+  microfones com nível baixo
+- Conversão final para 16 bits com dither TPDF (opcional)
+- Gate de fala opcional (core.audio.speech_gate) entre o buffer e o
+  arquivo: silêncios longos não chegam ao disco; o buffer (e leitores
+  como a transcrição ao vivo) continua recebendo tudo
+- Estatísticas em float64 (somas de horas de áudio)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import soundfile as sf
+
+from core.audio.ring_buffer import RingBuffer
+from core.audio.speech_gate import SpeechGate
+from core.audio.storage import tpdf_dither
+
+logger = logging.getLogger(__name__)
+
+BUFFER_SECONDS = 60.0
+POLL_INTERVAL_S = 0.05
+FLUSH_INTERVAL_S = 5.0
+POSTPASS_BLOCK_FRAMES = 1 << 16
+
+
+class StreamingWavWriter:
+    def __init__(
+        self,
+        path: Path,
+        sample_rate: int,
+        channels: int = 1,
+        subtype: str = "FLOAT",
+        format: str = "WAV",
+        buffer_seconds: float = BUFFER_SECONDS,
+        flush_interval_s: float = FLUSH_INTERVAL_S,
+        gate: Optional[SpeechGate] = None,
+    ) -> None:
+        self.path = path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.subtype = subtype
+        self.format = format
+        self.flush_interval_s = flush_interval_s
+        self.gate = gate
+
+        self.ring = RingBuffer(int(sample_rate * buffer_seconds), channels)
+        self._reader = self.ring.add_reader()
+        self._closing = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+        self.frames = 0
+        self.peak = 0.0
+        self._sum = 0.0
+        self._sumsq = 0.0
+
+    # -----------------------------------------------------
+    # Ciclo de vida
+    # -----------------------------------------------------
+    def start(self) -> "StreamingWavWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="wav-writer", daemon=True)
+        self._thread.start()
+        return self
+
+    def push(self, block: np.ndarray) -> None:
+        """Chamado pelo callback de áudio: uma cópia, nunca bloqueia."""
+        self.ring.write(block)
+
+    def close(self) -> Dict[str, Any]:
+        """Esvazia o buffer, fecha o arquivo e devolve as estatísticas."""
+        if self._thread is not None:
+            self._closing.set()
+            self._thread.join()
+            self._thread = None
+
+        if self._error is not None:
+            raise RuntimeError(f"Falha ao gravar {self.path.name}") from self._error
+
+        ring = self.ring.stats()
+        if ring["overruns"]:
+            logger.warning(
+                "Blocos de áudio descartados (buffer cheio) | %d | %s",
+                ring["overruns"], self.path.name,
+            )
+        logger.info(
+            "Buffer de captura | high-watermark=%.0f%% | overruns=%d",
+            ring["high_watermark_ratio"] * 100, ring["overruns"],
+        )
+        return self.stats()
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        try:
+            with sf.SoundFile(
+                str(self.path),
+                mode="w",
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                subtype=self.subtype,
+                format=self.format,
+            ) as f:
+                while True:
+                    # Lê o flag antes do buffer: nada escrito antes do
+                    # close() fica para trás
+                    closing = self._closing.is_set()
+                    block = self._reader.read()
+                    if block.shape[0] == 0:
+                        if closing:
+                            if self.gate is not None:
+                                self._write(f, self.gate.flush())
+                            break
+                        time.sleep(POLL_INTERVAL_S)
+                        continue
+
+                    if self.gate is not None:
+                        block = self.gate.process(block)
+                    self._write(f, block)
+
+                    if time.monotonic() - last_flush >= self.flush_interval_s:
+                        f.flush()   # reescreve o cabeçalho com o tamanho atual
+                        last_flush = time.monotonic()
+        except Exception as exc:
+            logger.exception("Writer de áudio falhou | %s", self.path)
+            self._error = exc
+            # Libera o buffer: o callback segue vivo, sem overruns falsos
+            self._reader.close()
+
+    def _write(self, f: sf.SoundFile, block: np.ndarray) -> None:
+        if block.shape[0]:
+            f.write(block)
+            self._accumulate(block)
+
+    # -----------------------------------------------------
+    # Estatísticas
+    # -----------------------------------------------------
+    def _accumulate(self, block: np.ndarray) -> None:
+        if block.size == 0:
+            return
+        data = block.astype(np.float64, copy=False)
+        self.frames += block.shape[0]
+        self.peak = max(self.peak, float(np.max(np.abs(data))))
+        self._sum += float(np.sum(data))
+        self._sumsq += float(np.sum(np.square(data)))
+
+    def stats(self) -> Dict[str, Any]:
+        samples = self.frames * self.channels
+        mean = self._sum / samples if samples else 0.0
+        mean_sq = self._sumsq / samples if samples else 0.0
+        return {
+            "frames": self.frames,
+            "duration_s": self.frames / self.sample_rate,
+            "peak": self.peak,
+            "rms": float(np.sqrt(mean_sq)),
+            "std": float(np.sqrt(max(mean_sq - mean * mean, 0.0))),
+            "dropped_blocks": self.ring.overruns,
+            "buffer": self.ring.stats(),
+            "gate": self.gate.stats() if self.gate is not None else None,
+        }
+
+
+def apply_gain(
+    src: Path,
+    dst: Path,
+    gain: float,
+    subtype: str = "PCM_16",
+    format: str = "WAV",
+    dither: bool = False,
+    block_frames: int = POSTPASS_BLOCK_FRAMES,
+) -> Path:
+    """
+    Copia src -> dst multiplicando por gain, bloco a bloco. Com dither,
+    soma ruído TPDF antes da quantização para 16 bits.
+    """
+    rng = np.random.default_rng() if dither else None
+    with sf.SoundFile(str(src)) as fin, sf.SoundFile(
+        str(dst),
+        mode="w",
+        samplerate=fin.samplerate,
+        channels=fin.channels,
+        subtype=subtype,
+        format=format,
+    ) as fout:
+        for block in fin.blocks(blocksize=block_frames, dtype="float32"):
+            block = block * np.float32(gain)
+            if rng is not None:
+                block = np.clip(tpdf_dither(block, rng), -1.0, 1.0)
+            fout.write(block)
+    return dst
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado writer em streaming (fila limitada + thread) com ganho em pós-passada
+# - Fila substituída pelo buffer circular pré-alocado (core.audio.ring_buffer)
+# - Container configurável (WAV/FLAC) e dither TPDF na pós-passada
+# - Gate de fala opcional antes do arquivo (silêncios longos descartados)
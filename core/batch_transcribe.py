@@ -0,0 +1,279 @@
+"""
+batch_transcribe.py
+
+Transcrição em lote de vários arquivos com manifesto retomável.
+
+Responsabilidades:
+- Carregar o modelo uma única vez por worker e processar muitos arquivos
+- Limitar o paralelismo a N processos (pool fixo)
+- Registrar cada arquivo concluído/falho em um manifesto JSONL
+- Pular arquivos já concluídos ao reiniciar
+- Espelhar em output_dir os caminhos relativos à raiz do lote, sem
+  colisão entre áudios de mesmo nome
+
+Decisões:
+- Manifesto append-only: uma linha por tentativa, a última vence
+- Manifesto indexado pelo .txt de saída: é ele que precisa existir (e ter
+  vindo do mesmo áudio) para o arquivo ser pulado
+- Apenas o processo principal escreve no manifesto (sem lock de arquivo)
+- Workers em processos separados (spawn), como no modo paralelo do
+  whisper_core: threads disputariam a mesma instância do CTranslate2
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from core.whisper_core import COMPUTE_TYPE, MODEL_NAME, whisper_transcribe
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".m4a", ".flac", ".ogg"}
+MANIFEST_NAME = "batch_manifest.jsonl"
+
+
+# ---------------------------------------------------------
+# Descoberta de arquivos
+# ---------------------------------------------------------
+def collect_audio_files(
+    directory: Optional[Path] = None,
+    pattern: Optional[str] = None,
+) -> List[Path]:
+    """
+    Lista arquivos de áudio de um diretório (não recursivo) ou de um
+    padrão glob relativo ao diretório atual (ex: "output/audio/**/*.wav").
+    """
+    if directory is not None:
+        candidates: Iterable[Path] = directory.iterdir()
+    elif pattern is not None:
+        candidates = Path().glob(pattern)
+    else:
+        raise ValueError("Informe um diretório ou um padrão glob")
+
+    return sorted(
+        p for p in candidates
+        if p.is_file() and p.suffix.lower() in AUDIO_EXTENSIONS
+    )
+
+
+def plan_outputs(
+    files: List[Path],
+    output_dir: Path,
+    root: Optional[Path] = None,
+) -> Dict[Path, Path]:
+    """
+    .txt de saída de cada áudio: o caminho relativo a root espelhado em
+    output_dir (root padrão = diretório comum dos arquivos). Áudios com
+    o mesmo nome-base no mesmo diretório (a.wav, a.mp3) mantêm a
+    extensão no nome (a.wav.txt, a.mp3.txt).
+    """
+    resolved = [p.resolve() for p in files]
+    if root is None:
+        root = Path(os.path.commonpath([p.parent for p in resolved])) if resolved else Path()
+    root = root.resolve()
+
+    relative = [p.relative_to(root) for p in resolved]
+    stems = Counter(rel.with_suffix("") for rel in relative)
+
+    outputs: Dict[Path, Path] = {}
+    for path, rel in zip(files, relative):
+        if stems[rel.with_suffix("")] > 1:
+            rel = rel.with_name(rel.name + ".txt")
+        else:
+            rel = rel.with_suffix(".txt")
+        outputs[path] = output_dir / rel
+    return outputs
+
+
+# ---------------------------------------------------------
+# Manifesto
+# ---------------------------------------------------------
+def load_manifest(manifest_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Último registro por arquivo de saída (chave = caminho absoluto do .txt)."""
+    records: Dict[str, Dict[str, Any]] = {}
+    if not manifest_path.exists():
+        return records
+
+    with manifest_path.open("r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Linha truncada por queda no meio da escrita
+                logger.warning("Manifesto: linha %d ignorada (JSON inválido)", line_no)
+                continue
+            records[record.get("output") or record["audio"]] = record
+    return records
+
+
+def _append_manifest(manifest_path: Path, record: Dict[str, Any]) -> None:
+    with manifest_path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _is_done(record: Optional[Dict[str, Any]], audio_path: Path) -> bool:
+    return (
+        record is not None
+        and record.get("status") == "done"
+        and record.get("audio") == str(audio_path.resolve())
+        and Path(record.get("output", "")).exists()
+    )
+
+
+# ---------------------------------------------------------
+# Worker
+# ---------------------------------------------------------
+def _audio_seconds(audio_path: Path, segments: List[Dict[str, Any]]) -> Optional[float]:
+    try:
+        import soundfile as sf
+
+        return float(sf.info(str(audio_path)).duration)
+    except Exception:
+        return segments[-1]["end"] if segments else None
+
+
+def _transcribe_one(
+    audio_path: Path,
+    output_path: Path,
+    options: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Transcreve um arquivo e devolve o registro do manifesto."""
+    record: Dict[str, Any] = {
+        "audio": str(audio_path.resolve()),
+        "output": str(output_path.resolve()),
+    }
+    t0 = time.time()
+
+    try:
+        result = whisper_transcribe(audio_path, **options)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(result.get("text", ""), encoding="utf-8")
+
+        elapsed = time.time() - t0
+        audio_s = _audio_seconds(audio_path, result.get("segments", []))
+        record.update(
+            status="done",
+            language=result.get("language"),
+            profile=result.get("profile"),
+            chars=len(result.get("text", "")),
+            audio_s=audio_s,
+            elapsed_s=round(elapsed, 2),
+            rtf=round(elapsed / audio_s, 3) if audio_s else None,
+        )
+    except Exception as exc:
+        logger.exception("Falha ao transcrever %s", audio_path)
+        record.update(
+            status="failed",
+            error=f"{type(exc).__name__}: {exc}",
+            elapsed_s=round(time.time() - t0, 2),
+        )
+
+    record["finished_at"] = datetime.now().isoformat(timespec="seconds")
+    return record
+
+
+# ---------------------------------------------------------
+# API pública
+# ---------------------------------------------------------
+def run_batch(
+    files: List[Path],
+    output_dir: Path,
+    manifest_path: Optional[Path] = None,
+    jobs: int = 1,
+    model_name: str = MODEL_NAME,
+    compute_type: str = COMPUTE_TYPE,
+    language: Optional[str] = None,
+    profile: Optional[Dict[str, Any]] = None,
+    on_record: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+    root: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Transcreve `files`, pulando os já concluídos no manifesto.
+
+    Args:
+        jobs: número de processos; 1 = no processo atual
+        profile: perfil de decodificação (core.decode_profiles); as
+            threads por job continuam sendo divididas pelo lote
+        on_record: callback(indice, total, registro) após cada arquivo
+        root: raiz espelhada em output_dir (ex: --dir); padrão = diretório
+            comum dos arquivos
+
+    Returns:
+        resumo {"total", "skipped", "done", "failed", "elapsed_s"}
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = manifest_path or output_dir / MANIFEST_NAME
+
+    outputs = plan_outputs(files, output_dir, root)
+    previous = load_manifest(manifest_path)
+    pending = [
+        p for p in files
+        if not _is_done(previous.get(str(outputs[p].resolve())), p)
+    ]
+    skipped = len(files) - len(pending)
+
+    logger.info(
+        "Lote iniciado | arquivos=%d | pendentes=%d | pulados=%d | jobs=%d | manifesto=%s",
+        len(files), len(pending), skipped, jobs, manifest_path,
+    )
+
+    jobs = max(1, min(jobs, len(pending) or 1))
+    threads = max(1, (os.cpu_count() or 1) // jobs) if jobs > 1 else 0
+    options = {
+        "model_name": model_name,
+        "compute_type": compute_type,
+        "cpu_threads": threads,
+        "language": language,
+    }
+    if profile is not None:
+        options["profile"] = {**profile, "cpu_threads": threads} if jobs > 1 else profile
+
+    summary = {"total": len(files), "skipped": skipped, "done": 0, "failed": 0}
+    t0 = time.time()
+
+    def _collect(index: int, record: Dict[str, Any]) -> None:
+        _append_manifest(manifest_path, record)
+        summary[record["status"]] += 1
+        if on_record:
+            on_record(index, len(pending), record)
+
+    if jobs == 1:
+        for index, audio_path in enumerate(pending, start=1):
+            _collect(index, _transcribe_one(audio_path, outputs[audio_path], options))
+    else:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as executor:
+            futures = [
+                executor.submit(_transcribe_one, audio_path, outputs[audio_path], options)
+                for audio_path in pending
+            ]
+            for index, future in enumerate(as_completed(futures), start=1):
+                _collect(index, future.result())
+
+    summary["elapsed_s"] = round(time.time() - t0, 2)
+    logger.info("Lote concluído | %s", summary)
+    return summary
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado modo lote com pool de processos e manifesto JSONL retomável
+# - Perfil de decodificação opcional (registrado no manifesto)
+# - Saídas espelham o caminho relativo à raiz do lote (sem colisão de nomes);
+#   manifesto indexado pelo .txt de saída
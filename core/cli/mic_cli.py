@@ -1,25 +1,47 @@
 ﻿from __future__ import annotations
 
 import argparse
+import json
 import logging
+import queue
 import sys
 import tempfile
+import tomllib
 import wave
+from collections import deque
 from datetime import datetime
 import threading
 import time
 import re
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from core.audio import storage
+from core.audio.silence import Chunk, OnlineChunker
+from core.language_session import SessionLanguage
+from core.session_manifest import (
+    SessionManifest,
+    audio_name,
+    rebuild_consolidated,
+    transcript_name,
+    words_name,
+)
+from core.stitcher import SeamStitcher, words_to_text
+
 if TYPE_CHECKING:
     from core.audio.mic_recorder import MicRecorder
 
 
+MIN_CHUNK_SECONDS = 10.0
+CAPTURE_STEP_SECONDS = 5.0
+
+
 def _write_temp_wav(audio_bytes: bytes, sample_rate: int) -> Path:
     temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
     temp_path = Path(temp_file.name)
@@ -34,13 +56,13 @@ def _write_temp_wav(audio_bytes: bytes, sample_rate: int) -> Path:
     return temp_path
 
 
-def _write_wav(audio_bytes: bytes, sample_rate: int, output_path: Path) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with wave.open(str(output_path), "wb") as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(audio_bytes)
+def _default_audio_format() -> str:
+    """[recording] format do config.toml do projeto (padrao: wav)."""
+    config_path = PROJECT_ROOT / "config.toml"
+    if not config_path.exists():
+        return storage.DEFAULT_FORMAT
+    with open(config_path, "rb") as config_file:
+        return storage.load_storage_config(tomllib.load(config_file))["format"]
 
 
 def _parse_args() -> argparse.Namespace:
@@ -112,9 +134,45 @@ def _parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--chunk-minutes",
+        type=float,
+        default=None,
+        help="Ativa gravacao continua com chunks de ~N minutos (aceita fracao, ex: 0.5).",
+    )
+    parser.add_argument(
+        "--chunk-tolerance",
+        type=float,
+        default=15.0,
+        help="Modo continuo: segundos em torno do alvo para procurar silencio no corte.",
+    )
+    parser.add_argument(
+        "--overlap",
+        type=float,
+        default=0.0,
+        help="Modo continuo: segundos de audio repetidos entre chunks (ex: 2); a emenda e deduplicada.",
+    )
+    parser.add_argument(
+        "--workers",
         type=int,
+        default=1,
+        help="Modo continuo: threads de transcricao (a captura nunca espera); o modelo decodifica esse numero de chunks em paralelo.",
+    )
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=2,
+        help="Modo continuo: chunks aguardando transcricao em memoria (excedente fica so no disco).",
+    )
+    parser.add_argument(
+        "--audio-format",
+        choices=sorted(storage.FORMATS),
         default=None,
-        help="Ativa gravacao continua com chunks de N minutos.",
+        help="Modo continuo: formato dos chunks (padrao: [recording] format do config.toml).",
+    )
+    parser.add_argument(
+        "--resume",
+        default=None,
+        metavar="SESSION_DIR",
+        help="Retoma uma sessao (output/session_*): transcreve so chunks pendentes e refaz o consolidado.",
     )
     parser.add_argument(
         "--session-name",
@@ -134,14 +192,134 @@ def _record_audio(mic: "MicRecorder", duration: Optional[float]) -> bytes:
     return audio.get_raw_data()
 
 
+class _ChunkJob(NamedTuple):
+    index: int
+    audio_path: Path
+    audio_bytes: Optional[bytes]  # None = derramado para disco (fila cheia)
+    captured_at: float
+    start_s: float = 0.0
+    end_s: float = 0.0
+
+
+class _ChunkResult(NamedTuple):
+    job: _ChunkJob
+    text: str
+    words: Optional[list]  # so com overlap (timestamps absolutos)
+    language: Optional[str]
+    probability: float
+    decode_s: float
+    error: Optional[str] = None
+
+
+def _transcribe_chunk(
+    mic: "MicRecorder",
+    job: _ChunkJob,
+    audio_bytes: bytes,
+    language: Optional[str],
+    with_words: bool,
+) -> _ChunkResult:
+    t0 = time.time()
+    if with_words:
+        words, detected, probability = mic.transcribe_words(
+            audio_bytes, language=language, offset_s=job.start_s
+        )
+        text = words_to_text(words)
+    else:
+        words = None
+        text, detected, probability = mic.transcribe_with_info(audio_bytes, language=language)
+    return _ChunkResult(job, text, words, detected, probability, time.time() - t0)
+
+
+def _save_chunk_transcript(session_dir: Path, result: _ChunkResult) -> Path:
+    index = result.job.index
+    text_path = session_dir / transcript_name(index)
+    text_path.write_text(result.text, encoding="utf-8-sig")
+    if result.words is not None:
+        (session_dir / words_name(index)).write_text(
+            json.dumps(result.words, ensure_ascii=False), encoding="utf-8"
+        )
+    return text_path
+
+
+def _transcription_worker(
+    mic: "MicRecorder",
+    jobs: "queue.Queue[Optional[_ChunkJob]]",
+    spilled: "deque[_ChunkJob]",
+    session_language: SessionLanguage,
+    on_done: Callable[[_ChunkResult], None],
+    logger: logging.Logger,
+    with_words: bool = False,
+) -> None:
+    while True:
+        # Fila primeiro: um chunk so e derramado com a fila cheia, entao e
+        # mais novo que os enfileirados antes dele. A ordem final do
+        # consolidado vem da reordenacao em _on_done.
+        try:
+            job = jobs.get_nowait()
+        except queue.Empty:
+            try:
+                job = spilled.popleft()
+            except IndexError:
+                job = jobs.get()
+
+        if job is None:
+            try:
+                job = spilled.popleft()
+            except IndexError:
+                return
+            # Ainda ha chunks no disco: devolve a sentinela, senao um
+            # worker fica sem ela e o join do encerramento nunca retorna
+            jobs.put(None)
+
+        audio_bytes = job.audio_bytes
+        if audio_bytes is None:
+            audio_bytes = storage.read_pcm16(job.audio_path)
+
+        try:
+            result = _transcribe_chunk(
+                mic, job, audio_bytes, session_language.language, with_words
+            )
+        except Exception as exc:
+            logger.exception("Falha ao transcrever chunk %04d", job.index)
+            result = _ChunkResult(
+                job, "", [] if with_words else None, None, 0.0, 0.0,
+                error=f"{type(exc).__name__}: {exc}",
+            )
+        on_done(result)
+
+
 def _run_chunk_mode(
     mic: "MicRecorder",
-    chunk_minutes: int,
+    chunk_minutes: float,
     sample_rate: int,
     logger: logging.Logger,
     session_name: Optional[str],
+    workers: int = 1,
+    max_pending: int = 2,
+    tolerance_s: float = 15.0,
+    overlap_s: float = 0.0,
+    audio_format: str = storage.DEFAULT_FORMAT,
 ) -> int:
-    chunk_seconds = max(chunk_minutes, 1) * 60
+    """
+    Captura e transcricao em pipeline: a thread principal so grava o
+    chunk, salva o audio (WAV/FLAC) e enfileira; `workers` threads transcrevem. O
+    consolidado e escrito na ordem dos chunks, mesmo com varios workers.
+
+    A fila guarda no maximo `max_pending` chunks em memoria; com a fila
+    cheia o chunk segue apenas no disco (audio ja salvo) e a captura nao
+    espera.
+
+    O corte acontece no ponto silencioso mais proximo de chunk_minutes
+    (+- tolerance_s); os offsets reais vao para session.json.
+
+    Com overlap_s > 0, chunks consecutivos compartilham overlap_s de
+    audio; as palavras repetidas na emenda sao removidas pelo stitcher
+    (a cauda de cada chunk so vai para o consolidado quando o proximo
+    chega).
+    """
+    chunk_seconds = max(chunk_minutes * 60, MIN_CHUNK_SECONDS)
+    # Captura em passos curtos: o chunker decide onde cortar
+    step_seconds = max(1.0, min(tolerance_s, CAPTURE_STEP_SECONDS))
     session_stamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
     safe_name = None
     if session_name:
@@ -152,8 +330,15 @@ def _run_chunk_mode(
     else:
         session_dir = Path("output") / f"session_{session_stamp}"
     consolidated_path = session_dir / "transcricao_completa.txt"
-
-    logger.info("Modo continuo ativado | chunk=%d min | session=%s", chunk_minutes, session_dir)
+    session_language = SessionLanguage(session_dir, fixed=mic.language)
+    chunker = OnlineChunker(sample_rate, chunk_seconds, tolerance_s, overlap_s=overlap_s)
+    overlap_s = chunker.overlap / sample_rate
+    manifest = SessionManifest(session_dir, sample_rate, overlap_s=overlap_s)
+
+    logger.info(
+        "Modo continuo ativado | chunk=%.0fs +-%.0fs | workers=%d | session=%s",
+        chunk_seconds, tolerance_s, workers, session_dir,
+    )
 
     pause_event = threading.Event()
     stop_event = threading.Event()
@@ -181,37 +366,206 @@ def _run_chunk_mode(
     key_thread = threading.Thread(target=_key_listener, daemon=True)
     key_thread.start()
 
+    jobs: "queue.Queue[Optional[_ChunkJob]]" = queue.Queue(maxsize=max(max_pending, 1))
+    spilled: "deque[_ChunkJob]" = deque()
+
+    # Reordenacao: workers terminam fora de ordem, o consolidado nao
+    write_lock = threading.Lock()
+    finished: dict = {}
+    next_to_write = [1]
+    # Overlap: a cauda do ultimo chunk escrito fica retida ate o proximo
+    stitcher = SeamStitcher(overlap_s) if overlap_s > 0 else None
+
+    def _consolidated_text(result: _ChunkResult) -> Tuple[str, str]:
+        """(continuacao da secao anterior, corpo da secao do chunk)."""
+        if stitcher is None:
+            return "", result.text
+        return stitcher.push(result.words, result.job.start_s, result.job.end_s)
+
+    def _on_done(result: _ChunkResult) -> None:
+        with write_lock:
+            finished[result.job.index] = result
+            while next_to_write[0] in finished:
+                result = finished.pop(next_to_write[0])
+                done = result.job
+                next_to_write[0] += 1
+
+                session_language.observe(result.language, result.probability)
+
+                text_path = _save_chunk_transcript(session_dir, result)
+                if result.error:
+                    manifest.mark_failed(done.index, result.error)
+                else:
+                    manifest.mark_done(
+                        done.index,
+                        result.decode_s,
+                        result.language,
+                        words_name(done.index) if result.words is not None else None,
+                    )
+
+                head, body = _consolidated_text(result)
+                with consolidated_path.open("a", encoding="utf-8-sig") as consolidated_file:
+                    if head:
+                        consolidated_file.write(f" {head}")
+                    if done.index > 1:
+                        consolidated_file.write("\n\n")
+                    consolidated_file.write(f"--- Chunk {done.index:04d} ---\n")
+                    consolidated_file.write(body)
+
+                logger.info(
+                    "Transcricao salva em %s | decode=%.1fs | atraso=%.1fs | fila=%d | disco=%d",
+                    text_path,
+                    result.decode_s,
+                    time.time() - done.captured_at,
+                    jobs.qsize(),
+                    len(spilled),
+                )
+
+    worker_threads = [
+        threading.Thread(
+            target=_transcription_worker,
+            args=(mic, jobs, spilled, session_language, _on_done, logger, overlap_s > 0),
+            name=f"chunk-worker-{n}",
+            daemon=True,
+        )
+        for n in range(max(workers, 1))
+    ]
+    for thread in worker_threads:
+        thread.start()
+
     chunk_index = 1
+
+    def _emit(chunk: Chunk) -> None:
+        nonlocal chunk_index
+        audio_bytes = chunk.audio.tobytes()
+        audio_path = session_dir / audio_name(chunk_index, storage.suffix(audio_format))
+        storage.write_pcm16(audio_bytes, sample_rate, audio_path)
+        entry = manifest.add_chunk(
+            chunk_index, audio_path, chunk.start, chunk.end, chunk.cut, audio_bytes
+        )
+
+        job = _ChunkJob(
+            chunk_index, audio_path, audio_bytes, time.time(), entry["start_s"], entry["end_s"]
+        )
+        try:
+            jobs.put_nowait(job)
+        except queue.Full:
+            spilled.append(job._replace(audio_bytes=None))
+            logger.warning(
+                "Fila de transcricao cheia | chunk %04d segue so no disco", chunk_index
+            )
+
+        logger.info(
+            "Chunk salvo em %s | %.1fs-%.1fs (%s) | fila=%d | disco=%d",
+            audio_path, entry["start_s"], entry["end_s"], chunk.cut,
+            jobs.qsize(), len(spilled),
+        )
+        chunk_index += 1
+
     try:
         with mic.source as microphone:
+            logger.info("Gravando chunk %04d...", chunk_index)
             while True:
                 if pause_event.is_set():
                     while pause_event.is_set():
                         time.sleep(0.2)
-                logger.info("Gravando chunk %04d...", chunk_index)
-                audio = mic.recognizer.record(microphone, duration=chunk_seconds)
-                audio_bytes = audio.get_raw_data()
+                audio = mic.recognizer.record(microphone, duration=step_seconds)
+                pcm = np.frombuffer(audio.get_raw_data(), dtype=np.int16)
+                for chunk in chunker.feed(pcm):
+                    _emit(chunk)
+                    logger.info("Gravando chunk %04d...", chunk_index)
+    except KeyboardInterrupt:
+        logger.info("Encerrando por interrupcao do usuario.")
+        stop_event.set()
 
-                audio_path = session_dir / f"audio_{chunk_index:04d}.wav"
-                text_path = session_dir / f"transcricao_{chunk_index:04d}.txt"
+    # Audio ja capturado do chunk corrente nao e descartado
+    final = chunker.flush()
+    if final is not None and final.audio.shape[0] >= sample_rate:
+        _emit(final)
 
-                _write_wav(audio_bytes, sample_rate, audio_path)
-                logger.info("Chunk salvo em %s", audio_path)
+    pending = jobs.qsize() + len(spilled)
+    if pending:
+        logger.info("Aguardando transcricao de %d chunk(s) pendente(s)...", pending)
+    for _ in worker_threads:
+        jobs.put(None)
+    try:
+        for thread in worker_threads:
+            thread.join()
+    except KeyboardInterrupt:
+        logger.warning("Transcricoes pendentes abandonadas (WAVs preservados em %s)", session_dir)
+
+    with write_lock:
+        if consolidated_path.exists():
+            tail = stitcher.flush() if stitcher is not None else ""
+            with consolidated_path.open("a", encoding="utf-8-sig") as consolidated_file:
+                consolidated_file.write(f" {tail}\n\n" if tail else "\n\n")
+
+    pending = manifest.pending()
+    if pending:
+        logger.warning(
+            "%d chunk(s) sem transcricao | retome com: --resume %s", len(pending), session_dir
+        )
+    return 0
 
-                text = mic.transcribe_audio(audio_bytes)
-                text_path.write_text(text, encoding="utf-8-sig")
-                logger.info("Transcricao salva em %s", text_path)
 
-                with consolidated_path.open("a", encoding="utf-8-sig") as consolidated_file:
-                    consolidated_file.write(f"--- Chunk {chunk_index:04d} ---\n")
-                    consolidated_file.write(text)
-                    consolidated_file.write("\n\n")
+def _run_resume(mic: "MicRecorder", session_dir: Path, logger: logging.Logger) -> int:
+    """
+    Retoma uma sessao: transcreve so os chunks pendentes/falhos do
+    session.json e reconstroi transcricao_completa.txt a partir dos
+    arquivos por chunk.
+    """
+    if not session_dir.is_dir():
+        logger.error("Sessao nao encontrada: %s", session_dir)
+        return 1
+
+    manifest = SessionManifest.load(session_dir)
+    session_language = SessionLanguage(session_dir, fixed=mic.language)
+    with_words = manifest.overlap_s > 0
+    pending = manifest.pending()
+
+    logger.info(
+        "Retomando sessao %s | chunks=%d | pendentes=%d",
+        session_dir, len(manifest.chunks), len(pending),
+    )
 
-                chunk_index += 1
-    except KeyboardInterrupt:
-        logger.info("Encerrando por interrupcao do usuario.")
-        stop_event.set()
-        return 0
+    for entry in pending:
+        index = entry["index"]
+        audio_path = session_dir / entry["audio"]
+        if not audio_path.exists():
+            logger.error("Chunk %04d sem audio (%s)", index, audio_path.name)
+            manifest.mark_failed(index, "audio ausente")
+            continue
+
+        audio_bytes = storage.read_pcm16(audio_path)
+        if not manifest.verify_audio(entry, audio_bytes):
+            logger.warning("Chunk %04d: hash do audio difere do session.json", index)
+
+        job = _ChunkJob(index, audio_path, None, time.time(), entry["start_s"], entry["end_s"])
+        try:
+            result = _transcribe_chunk(
+                mic, job, audio_bytes, session_language.language, with_words
+            )
+        except Exception as exc:
+            logger.exception("Falha ao transcrever chunk %04d", index)
+            manifest.mark_failed(index, f"{type(exc).__name__}: {exc}")
+            continue
+
+        session_language.observe(result.language, result.probability)
+        _save_chunk_transcript(session_dir, result)
+        manifest.mark_done(
+            index,
+            result.decode_s,
+            result.language,
+            words_name(index) if with_words else None,
+        )
+        logger.info("Chunk %04d transcrito | decode=%.1fs", index, result.decode_s)
+
+    consolidated_path = rebuild_consolidated(manifest)
+    remaining = len(manifest.pending())
+    logger.info(
+        "Consolidado reconstruido em %s | pendentes=%d", consolidated_path, remaining
+    )
+    return 0 if remaining == 0 else 1
 
 
 def main() -> int:
@@ -225,6 +579,16 @@ def main() -> int:
 
     from core.audio.mic_recorder import MicRecorder
 
+    if args.resume:
+        mic = MicRecorder(
+            model=args.model,
+            device=args.device,
+            compute_type=args.compute_type,
+            language=args.language,
+            open_microphone=False,
+        )
+        return _run_resume(mic, Path(args.resume), logger)
+
     mic = MicRecorder(
         model=args.model,
         device=args.device,
@@ -235,6 +599,7 @@ def main() -> int:
         dynamic_energy=args.dynamic_energy,
         mic_index=args.mic_index,
         language=args.language,
+        num_workers=args.workers,
     )
 
     if args.chunk_minutes:
@@ -244,6 +609,11 @@ def main() -> int:
             args.sample_rate,
             logger,
             args.session_name,
+            workers=args.workers,
+            max_pending=args.max_pending,
+            tolerance_s=args.chunk_tolerance,
+            overlap_s=args.overlap,
+            audio_format=args.audio_format or _default_audio_format(),
         )
 
     logger.info("Gravando audio do microfone...")
@@ -0,0 +1,183 @@
+"""
+decode_profiles.py
+
+Perfis de decodificação (velocidade x precisão) do Whisper.
+
+Responsabilidades:
+- Definir perfis nomeados: live, fast, balanced, accurate
+- Mesclar overrides do config.toml sobre os perfis embutidos
+- Resolver o perfil de um tipo de sessão (daily, reuniao_externa, ...)
+
+Precedência (da mais fraca para a mais forte):
+1. [transcription.whisper]            — política global do projeto; só
+                                        preenche chaves que o perfil
+                                        embutido não define
+2. Perfil embutido (BUILTIN_PROFILES)
+3. [decode_profiles.<perfil>]         — ajuste do perfil
+4. [profiles.<tipo_sessao>.whisper]   — ajuste fino por tipo de sessão
+
+Perfil padrão: [transcription] target (ex: "balanced").
+Mapeamento de sessão: [decode_profiles.session_types].
+
+Decisões:
+- "balanced" mantém modelo e beam históricos (small, beam 5); chamadas
+  ao core sem perfil seguem com o comportamento anterior
+- O config.toml usa "logprob_threshold"; o faster-whisper espera
+  "log_prob_threshold" — o nome antigo é aceito
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import tomllib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+CONFIG_PATH = PROJECT_ROOT / "config.toml"
+
+DEFAULT_PROFILE = "balanced"
+
+# Chaves repassadas diretamente a WhisperModel.transcribe
+DECODE_KEYS = (
+    "beam_size",
+    "best_of",
+    "temperature",
+    "condition_on_previous_text",
+    "no_speech_threshold",
+    "log_prob_threshold",
+    "compression_ratio_threshold",
+)
+
+BUILTIN_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Legendas / chunks curtos: latência acima de tudo
+    "live": {
+        "model": "base",
+        "compute_type": "int8",
+        "cpu_threads": 0,
+        "beam_size": 1,
+        "best_of": 1,
+        "temperature": 0.0,
+        "condition_on_previous_text": False,
+        "vad_filter": True,
+        "vad_parameters": {"min_silence_duration_ms": 500, "speech_pad_ms": 200},
+    },
+    # Dailies e reuniões rotineiras
+    "fast": {
+        "model": "base",
+        "compute_type": "int8",
+        "cpu_threads": 0,
+        "beam_size": 2,
+        "best_of": 2,
+        "temperature": [0.0, 0.4, 0.8],
+        "condition_on_previous_text": False,
+        "vad_filter": True,
+        "vad_parameters": {"min_silence_duration_ms": 1000},
+    },
+    # Padrão histórico do projeto
+    "balanced": {
+        "model": "small",
+        "compute_type": "int8",
+        "cpu_threads": 0,
+        "beam_size": 5,
+        "vad_filter": True,
+        "vad_parameters": {},
+    },
+    # Reuniões externas / atas formais
+    "accurate": {
+        "model": "medium",
+        "compute_type": "int8",
+        "cpu_threads": 0,
+        "beam_size": 5,
+        "best_of": 5,
+        "temperature": [0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+        "condition_on_previous_text": True,
+        "vad_filter": True,
+        "vad_parameters": {"min_silence_duration_ms": 2000, "speech_pad_ms": 400},
+    },
+}
+
+# Nomes antigos de [transcription] target
+_ALIASES = {"high_quality": "accurate"}
+
+
+def load_config(path: Path = CONFIG_PATH) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    return tomllib.loads(path.read_text(encoding="utf-8"))
+
+
+def _normalize(overrides: Dict[str, Any]) -> Dict[str, Any]:
+    out = dict(overrides)
+    if "logprob_threshold" in out:
+        out.setdefault("log_prob_threshold", out.pop("logprob_threshold"))
+    return out
+
+
+def profile_names() -> list[str]:
+    return list(BUILTIN_PROFILES)
+
+
+def default_profile_name(config: Optional[Dict[str, Any]] = None) -> str:
+    config = load_config() if config is None else config
+    target = config.get("transcription", {}).get("target", DEFAULT_PROFILE)
+    target = _ALIASES.get(target, target)
+    return target if target in BUILTIN_PROFILES else DEFAULT_PROFILE
+
+
+def resolve_profile(
+    name: Optional[str] = None,
+    session_type: Optional[str] = None,
+    config: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Retorna o perfil efetivo (dict com "name", modelo, VAD e as chaves
+    de DECODE_KEYS).
+
+    Args:
+        name: perfil explícito; tem prioridade sobre o mapeamento
+        session_type: tipo de sessão usado para escolher o perfil e
+            aplicar [profiles.<tipo>.whisper]
+    """
+    config = load_config() if config is None else config
+    section = config.get("decode_profiles", {})
+
+    if name is None and session_type:
+        name = section.get("session_types", {}).get(session_type)
+    name = _ALIASES.get(name or "", name) or default_profile_name(config)
+
+    if name not in BUILTIN_PROFILES:
+        logger.warning("Perfil de decodificação desconhecido: %s | usando %s", name, DEFAULT_PROFILE)
+        name = DEFAULT_PROFILE
+
+    profile = copy.deepcopy(BUILTIN_PROFILES[name])
+    # Global não apaga o que o perfil define (ex: fallback de temperatura)
+    for key, value in _normalize(config.get("transcription", {}).get("whisper", {})).items():
+        profile.setdefault(key, value)
+    profile.update(_normalize(section.get(name, {})))
+    if session_type:
+        profile.update(
+            _normalize(config.get("profiles", {}).get(session_type, {}).get("whisper", {}))
+        )
+
+    profile["name"] = name
+    return profile
+
+
+def decode_kwargs(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Subconjunto do perfil aceito por WhisperModel.transcribe."""
+    kwargs = {key: profile[key] for key in DECODE_KEYS if key in profile}
+    if profile.get("vad_parameters"):
+        kwargs["vad_parameters"] = dict(profile["vad_parameters"])
+    return kwargs
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criados perfis live / fast / balanced / accurate via config.toml
+# - [transcription.whisper] só preenche chaves ausentes no perfil embutido
@@ -0,0 +1,233 @@
+"""
+job_queue.py
+
+Fila de tarefas em background (transcrição, resumo) para a interface.
+
+Responsabilidades:
+- Receber tarefas (kind + parâmetros) e executá-las em threads worker
+- Expor estado por tarefa: queued / running (progresso) / done / failed
+- Persistir o estado em <jobs_dir>/<id>.json a cada mudança
+- Sobreviver a reruns do Streamlit e a recarregar o navegador
+
+Decisões:
+- Singleton por processo (get_job_queue), como core.model_pool e
+  core.warmup: módulos importados sobrevivem aos reruns do script
+- Threads, não processos: todos os workers compartilham o modelo
+  aquecido do pool (o CTranslate2 libera o GIL durante a decodificação).
+  Decodificações simultâneas na mesma instância exigem num_workers do
+  modelo >= workers (core.model_pool: pool.num_workers)
+- Handlers (um por kind, fixos na criação) recebem (params, progress)
+  e devolvem um dict serializável; não podem depender do Streamlit
+- Gravação do estado limitada a 2x/s durante o progresso; tmp +
+  os.replace, como session.json
+- Tarefas queued/running encontradas ao iniciar (processo reiniciado)
+  voltam para a fila: os handlers são idempotentes
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+PROGRESS_SAVE_INTERVAL_S = 0.5
+
+Progress = Callable[[float, str], None]
+Handler = Callable[[Dict[str, Any], Progress], Dict[str, Any]]
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class JobQueue:
+    def __init__(self, jobs_dir: Path, handlers: Dict[str, Handler], workers: int = 1) -> None:
+        self.jobs_dir = jobs_dir
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+
+        # Handlers antes dos workers: tarefas retomadas já têm quem as execute
+        self._handlers = dict(handlers)
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[str]" = queue.Queue()
+
+        self._load_existing()
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"job-worker-{n}", daemon=True)
+            for n in range(max(workers, 1))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    # -----------------------------------------------------
+    # API
+    # -----------------------------------------------------
+    def submit(self, kind: str, params: Dict[str, Any], label: str = "") -> str:
+        job_id = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+        job = {
+            "id": job_id,
+            "kind": kind,
+            "label": label or kind,
+            "params": params,
+            "status": QUEUED,
+            "progress": 0.0,
+            "message": "Na fila",
+            "created_at": _now(),
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None,
+        }
+        with self._lock:
+            self._jobs[job_id] = job
+            self._save(job)
+        self._queue.put(job_id)
+        logger.info("Tarefa enfileirada | %s | %s | %s", job_id, kind, job["label"])
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Tarefas mais recentes primeiro."""
+        with self._lock:
+            items = sorted(self._jobs.values(), key=lambda j: j["id"], reverse=True)
+            return [dict(j) for j in items[:limit]]
+
+    def active(self) -> bool:
+        with self._lock:
+            return any(j["status"] in (QUEUED, RUNNING) for j in self._jobs.values())
+
+    def remove(self, job_id: str) -> None:
+        """Remove uma tarefa concluída (ou com falha) da lista."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job["status"] in (QUEUED, RUNNING):
+                return
+            del self._jobs[job_id]
+            (self.jobs_dir / f"{job_id}.json").unlink(missing_ok=True)
+
+    # -----------------------------------------------------
+    # Execução
+    # -----------------------------------------------------
+    def _worker(self) -> None:
+        while True:
+            job_id = self._queue.get()
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None or job["status"] != QUEUED:
+                    continue
+                handler = self._handlers.get(job["kind"])
+                job.update(status=RUNNING, started_at=_now(), message="Iniciando")
+                self._save(job)
+
+            if handler is None:
+                self._finish(job_id, error=f"Tipo de tarefa sem handler: {job['kind']}")
+                continue
+
+            t0 = time.time()
+            try:
+                result = handler(job["params"], self._progress_callback(job_id))
+            except Exception as exc:
+                logger.exception("Tarefa falhou | %s", job_id)
+                self._finish(job_id, error=f"{type(exc).__name__}: {exc}")
+                continue
+
+            self._finish(job_id, result=result)
+            logger.info("Tarefa concluida | %s | %.1fs", job_id, time.time() - t0)
+
+    def _progress_callback(self, job_id: str) -> Progress:
+        last_save = [0.0]
+
+        def progress(fraction: float, message: str = "") -> None:
+            with self._lock:
+                job = self._jobs[job_id]
+                job["progress"] = max(0.0, min(float(fraction), 1.0))
+                if message:
+                    job["message"] = message
+                if time.monotonic() - last_save[0] >= PROGRESS_SAVE_INTERVAL_S:
+                    self._save(job)
+                    last_save[0] = time.monotonic()
+
+        return progress
+
+    def _finish(
+        self,
+        job_id: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            job.update(
+                status=FAILED if error else DONE,
+                progress=job["progress"] if error else 1.0,
+                message="Falhou" if error else "Concluida",
+                finished_at=_now(),
+                result=result,
+                error=error,
+            )
+            self._save(job)
+
+    # -----------------------------------------------------
+    # Persistência
+    # -----------------------------------------------------
+    def _save(self, job: Dict[str, Any]) -> None:
+        path = self.jobs_dir / f"{job['id']}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(job, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _load_existing(self) -> None:
+        for path in sorted(self.jobs_dir.glob("*.json")):
+            try:
+                job = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                logger.warning("Estado de tarefa ilegivel | %s", path.name)
+                continue
+
+            if job["status"] in (QUEUED, RUNNING):
+                job.update(status=QUEUED, progress=0.0, message="Retomada apos reinicio")
+                self._save(job)
+                self._queue.put(job["id"])
+            self._jobs[job["id"]] = job
+
+
+_queue_lock = threading.Lock()
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue(
+    jobs_dir: Path,
+    handlers: Dict[str, Handler],
+    workers: int = 1,
+) -> JobQueue:
+    """Fila única do processo (criada na primeira chamada)."""
+    global _job_queue
+    with _queue_lock:
+        if _job_queue is None:
+            _job_queue = JobQueue(jobs_dir, handlers, workers)
+        return _job_queue
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criada fila de tarefas em background com estado persistido por tarefa
@@ -0,0 +1,117 @@
+"""
+language_session.py
+
+Idioma fixado por sessão para gravações em chunks.
+
+Responsabilidades:
+- Observar o idioma detectado nos primeiros chunks de uma sessão
+- Fixar o idioma quando a confiança é suficiente (ou após N chunks)
+- Persistir a decisão em <session_dir>/language.json
+- Fornecer o idioma fixado para todas as decodificações seguintes
+
+Decisões:
+- A detecção reaproveita o TranscriptionInfo da própria transcrição do
+  chunk (sem chamada extra ao modelo)
+- Sem confiança alta, vence o idioma com maior soma de probabilidades
+  nos N primeiros chunks
+- Idioma passado explicitamente (--language) tem prioridade e é
+  persistido como tal
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+LANGUAGE_FILE = "language.json"
+MIN_PROBABILITY = 0.8
+MAX_CHUNKS = 3
+
+
+class SessionLanguage:
+    def __init__(
+        self,
+        session_dir: Path,
+        fixed: Optional[str] = None,
+        min_probability: float = MIN_PROBABILITY,
+        max_chunks: int = MAX_CHUNKS,
+    ) -> None:
+        self.path = session_dir / LANGUAGE_FILE
+        self.min_probability = min_probability
+        self.max_chunks = max_chunks
+
+        self.language: Optional[str] = None
+        self.source: Optional[str] = None
+        self._votes: Dict[str, float] = {}
+        self._observed = 0
+
+        if fixed:
+            self._pin(fixed, 1.0, source="cli")
+        else:
+            self._load()
+
+    @property
+    def pinned(self) -> bool:
+        return self.language is not None
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("language.json inválido, ignorado: %s", self.path)
+            return
+        self.language = data.get("language")
+        self.source = data.get("source")
+        if self.language:
+            logger.info("Idioma da sessão recuperado: %s (%s)", self.language, self.source)
+
+    def _pin(self, language: str, probability: float, source: str) -> None:
+        self.language = language
+        self.source = source
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "language": language,
+                    "probability": round(probability, 4),
+                    "source": source,
+                    "chunks_observed": self._observed,
+                    "votes": {k: round(v, 4) for k, v in self._votes.items()},
+                },
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+        logger.info("Idioma da sessão fixado: %s | p=%.2f | origem=%s", language, probability, source)
+
+    def observe(self, language: Optional[str], probability: float) -> None:
+        """Registra a detecção de um chunk; fixa o idioma se for o caso."""
+        if self.pinned or not language:
+            return
+
+        self._observed += 1
+        self._votes[language] = self._votes.get(language, 0.0) + probability
+
+        if probability >= self.min_probability:
+            self._pin(language, probability, source="detected")
+        elif self._observed >= self.max_chunks:
+            best = max(self._votes, key=self._votes.get)
+            self._pin(best, self._votes[best] / self._observed, source="majority")
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado idioma por sessão (detecção nos primeiros chunks + cache)
@@ -0,0 +1,259 @@
+"""
+live_transcriber.py
+
+Transcrição ao vivo durante a gravação (core.recorder).
+
+Responsabilidades:
+- Ler o áudio capturado do buffer circular (leitor lossy) em background
+- Detectar regiões de fala concluídas (Silero VAD do faster-whisper) e
+  decodificá-las com whisper_core enquanto a gravação continua
+- Persistir cada segmento em <nome>.live.jsonl assim que decodificado
+- Ao parar, decodificar só o trecho final ainda pendente
+
+Decisões:
+- Região concluída = fala seguida de pelo menos min_silence_s de
+  silêncio; o corte fica no meio desse silêncio
+- Sem pausa até max_region_s, corta no ponto mais quieto perto do fim
+  (core.audio.silence): a latência do texto parcial fica limitada
+- Leitor lossy: uma decodificação lenta nunca faz a gravação em
+  arquivo perder áudio; se o leitor for ultrapassado, o resultado sai
+  com live_complete=False e o chamador pode retranscrever o arquivo
+- Idioma fixado após a primeira região confiante (como no mic_cli)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from core.audio.ring_buffer import RingBuffer, RingReader
+from core.audio.silence import nearest_quiet_point
+from core.whisper_core import MODEL_NAME, SAMPLE_RATE, build_result, transcribe_array
+
+logger = logging.getLogger(__name__)
+
+LIVE_SUFFIX = ".live.jsonl"
+MIN_REGION_S = 5.0
+MAX_REGION_S = 30.0
+MIN_SILENCE_S = 0.6
+POLL_INTERVAL_S = 0.5
+PIN_LANGUAGE_PROBABILITY = 0.8
+
+
+class LiveTranscriber:
+    def __init__(
+        self,
+        output_dir: Path,
+        language: Optional[str] = None,
+        profile: Optional[Dict[str, Any]] = None,
+        min_region_s: float = MIN_REGION_S,
+        max_region_s: float = MAX_REGION_S,
+        min_silence_s: float = MIN_SILENCE_S,
+    ) -> None:
+        self.output_dir = output_dir
+        self.language = language
+        self.profile = profile
+        self.min_region = int(min_region_s * SAMPLE_RATE)
+        self.max_region = int(max_region_s * SAMPLE_RATE)
+        self.min_silence = int(min_silence_s * SAMPLE_RATE)
+
+        self.output_path: Optional[Path] = None
+        self.result: Optional[Dict[str, Any]] = None
+
+        self._reader: Optional[RingReader] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+        self._segments: List[Dict[str, Any]] = []
+        self._pending: List[np.ndarray] = []
+        self._pending_frames = 0
+        self._pending_start = 0          # amostra (na gravação) do início pendente
+        self._decoded_until = 0
+        self._complete = True
+        self._decode_s = 0.0
+        self._ring: Optional[RingBuffer] = None
+
+    # -----------------------------------------------------
+    # Ciclo de vida (chamado por core.recorder)
+    # -----------------------------------------------------
+    def attach(self, ring: RingBuffer, name: str) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_path = self.output_dir / f"{name}{LIVE_SUFFIX}"
+        self.output_path.write_text("", encoding="utf-8")
+
+        self._ring = ring
+        self._reader = ring.add_reader(lossy=True)
+        self._pending_start = self._decoded_until = self._reader.position
+        self._thread = threading.Thread(target=self._run, name="live-transcriber", daemon=True)
+        self._thread.start()
+        logger.info("Transcricao ao vivo iniciada | %s", self.output_path.name)
+
+    def finish(self) -> Dict[str, Any]:
+        """Para a thread, decodifica o trecho final e monta o resultado."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+        t_tail = time.time()
+        if self._reader is not None:
+            self._drain()
+            if self._pending_frames:
+                try:
+                    self._decode(self._pending_frames)
+                except Exception:
+                    # O que já foi decodificado continua no resultado
+                    logger.exception("Falha na transcricao ao vivo | trecho final descartado")
+                    self._complete = False
+            self._reader.close()
+
+        tail_s = time.time() - t_tail
+        audio_s = self._decoded_until / SAMPLE_RATE
+        self.result = build_result(
+            self.segments(),
+            self.language,
+            self._decode_s,
+            self.profile["model"] if self.profile else MODEL_NAME,
+            profile=self.profile,
+            audio_s=audio_s,
+        )
+        self.result.update(live=True, live_complete=self._complete, tail_decode_s=round(tail_s, 2))
+
+        logger.info(
+            "Transcricao ao vivo concluida | audio=%.1fs | final=%.1fs | completa=%s",
+            audio_s, tail_s, self._complete,
+        )
+        return self.result
+
+    # -----------------------------------------------------
+    # Consulta (UI)
+    # -----------------------------------------------------
+    def segments(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._segments)
+
+    def partial_text(self) -> str:
+        return " ".join(seg["text"] for seg in self.segments()).strip()
+
+    def lag_s(self) -> float:
+        """Áudio capturado ainda não decodificado (segundos)."""
+        if self._ring is None:
+            return 0.0
+        written = self._ring.frames_written
+        return max(written - self._decoded_until, 0) / SAMPLE_RATE
+
+    # -----------------------------------------------------
+    # Loop
+    # -----------------------------------------------------
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._drain()
+            cut = self._find_cut()
+            if cut:
+                try:
+                    self._decode(cut)
+                except Exception:
+                    # _decode já consumiu a região: só marca o resultado como incompleto
+                    logger.exception("Falha na transcricao ao vivo | regiao descartada")
+                    self._complete = False
+            else:
+                self._stop.wait(POLL_INTERVAL_S)
+
+    def _drain(self) -> None:
+        before = self._reader.skipped_frames
+        block = self._reader.read()
+        if self._reader.skipped_frames != before:
+            # Leitor ultrapassado: o pendente não é mais contíguo
+            logger.warning(
+                "Transcricao ao vivo atrasada | %.1fs de audio pulados",
+                (self._reader.skipped_frames - before) / SAMPLE_RATE,
+            )
+            self._complete = False
+            self._pending, self._pending_frames = [], 0
+            self._pending_start = self._reader.position - block.shape[0]
+            self._decoded_until = self._pending_start
+        if block.shape[0]:
+            self._pending.append(block[:, 0])
+            self._pending_frames += block.shape[0]
+
+    def _pending_audio(self) -> np.ndarray:
+        if len(self._pending) > 1:
+            self._pending = [np.concatenate(self._pending)]
+        return self._pending[0] if self._pending else np.zeros(0, dtype=np.float32)
+
+    def _find_cut(self) -> int:
+        """Fim (em amostras do pendente) da região pronta; 0 = esperar."""
+        if self._pending_frames < self.min_region:
+            return 0
+
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        audio = self._pending_audio()
+        speech = get_speech_timestamps(
+            audio, VadOptions(min_silence_duration_ms=int(self.min_silence * 1000 / SAMPLE_RATE))
+        )
+        if not speech:
+            # Só silêncio: descarta sem decodificar quando ficar longo
+            if audio.shape[0] >= self.max_region:
+                self._consume(audio.shape[0])
+            return 0
+
+        closed = [s for s in speech if audio.shape[0] - s["end"] >= self.min_silence]
+        if closed:
+            return closed[-1]["end"] + self.min_silence // 2
+
+        if audio.shape[0] >= self.max_region:
+            tolerance = self.max_region // 4
+            return nearest_quiet_point(audio, SAMPLE_RATE, audio.shape[0] - tolerance, tolerance)
+        return 0
+
+    def _consume(self, frames: int) -> np.ndarray:
+        audio = self._pending_audio()
+        region, rest = audio[:frames], audio[frames:].copy()
+        self._pending = [rest] if rest.shape[0] else []
+        self._pending_frames = rest.shape[0]
+        self._pending_start += frames
+        self._decoded_until = self._pending_start
+        return region
+
+    def _decode(self, frames: int) -> None:
+        offset_s = self._pending_start / SAMPLE_RATE
+        region = self._consume(frames)
+
+        t0 = time.time()
+        segments, language, probability = transcribe_array(
+            region, offset_s=offset_s, language=self.language, profile=self.profile,
+        )
+        self._decode_s += time.time() - t0
+
+        if self.language is None and probability >= PIN_LANGUAGE_PROBABILITY:
+            self.language = language
+            logger.info("Transcricao ao vivo | idioma fixado: %s (p=%.2f)", language, probability)
+
+        with self._lock:
+            self._segments.extend(segments)
+        with self.output_path.open("a", encoding="utf-8") as out:
+            for segment in segments:
+                out.write(json.dumps(segment, ensure_ascii=False) + "\n")
+
+        logger.info(
+            "Regiao ao vivo decodificada | %.1fs-%.1fs | %.2fs | atraso=%.1fs",
+            offset_s, self._pending_start / SAMPLE_RATE, time.time() - t0, self.lag_s(),
+        )
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criada transcrição ao vivo por regiões de fala durante a gravação
+# - faster-whisper (VAD) importado sob demanda
+# - Falha na decodificação não consome a região seguinte (consumo duplo)
+# - Falha no trecho final não impede o resultado (marcado como incompleto)
@@ -0,0 +1,334 @@
+"""
+model_pool.py
+
+Registro compartilhado de modelos faster-whisper.
+
+Responsabilidades:
+- Manter instâncias de WhisperModel reutilizáveis no processo
+- Indexar por (modelo, device, compute_type, cpu_threads, num_workers)
+- Respeitar um orçamento de memória (estimado) com despejo LRU
+- Descarregar modelos ociosos após um timeout
+- Expor contadores de load / hit / evict para diagnóstico
+
+Decisões:
+- Um único pool por processo (get_pool); Streamlit reaproveita o módulo
+  entre reruns, CLI reaproveita entre arquivos
+- Memória estimada por tabela (não medida): CTranslate2 não expõe o
+  consumo real e a estimativa é suficiente para decidir despejo
+- faster-whisper importado apenas no primeiro load
+- num_workers: quantas chamadas transcribe() o CTranslate2 executa em
+  paralelo na mesma instância; com 1, threads concorrentes esperam a vez.
+  Sem num_workers explícito vale pool.num_workers (a interface usa o
+  número de workers da fila de tarefas)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------
+# Parâmetros padrão do pool
+# ---------------------------------------------------------
+DEFAULT_MEMORY_BUDGET_MB = 3000   # cabe small + medium em int8
+DEFAULT_IDLE_TIMEOUT_S = 900.0    # 15 min sem uso -> descarrega
+
+# Tamanho aproximado (MB) dos pesos em float16
+_MODEL_SIZE_MB = {
+    "tiny": 75,
+    "base": 145,
+    "small": 485,
+    "medium": 1530,
+    "large-v1": 3090,
+    "large-v2": 3090,
+    "large-v3": 3090,
+    "large-v3-turbo": 1620,
+    "turbo": 1620,
+    "distil-large-v3": 1510,
+}
+
+_COMPUTE_FACTOR = {
+    "int8": 0.5,
+    "int8_float16": 0.5,
+    "int8_float32": 0.5,
+    "int8_bfloat16": 0.5,
+    "float16": 1.0,
+    "bfloat16": 1.0,
+    "float32": 2.0,
+}
+
+
+class ModelKey(NamedTuple):
+    model: str
+    device: str
+    compute_type: str
+    cpu_threads: int
+    num_workers: int = 1
+
+
+@dataclass
+class _Entry:
+    model: Any
+    size_mb: float
+    last_used: float = field(default_factory=time.monotonic)
+
+
+def estimate_model_mb(model: str, compute_type: str) -> float:
+    """
+    Estima memória ocupada por um modelo.
+
+    Nomes desconhecidos (caminhos locais, repositórios HF) assumem o
+    tamanho do small, que é o padrão do projeto.
+    """
+    base = _MODEL_SIZE_MB.get(model.split("/")[-1].lower(), _MODEL_SIZE_MB["small"])
+    return base * _COMPUTE_FACTOR.get(compute_type, 1.0)
+
+
+def _default_loader(key: ModelKey, download_root: Optional[str]) -> Any:
+    from faster_whisper import WhisperModel
+
+    kwargs: Dict[str, Any] = {
+        "device": key.device,
+        "compute_type": key.compute_type,
+        "cpu_threads": key.cpu_threads,
+        "num_workers": key.num_workers,
+    }
+    if download_root:
+        kwargs["download_root"] = os.path.expanduser(download_root)
+    return WhisperModel(key.model, **kwargs)
+
+
+class ModelPool:
+    """
+    Cache LRU de modelos com orçamento de memória e timeout de ociosidade.
+
+    O load acontece sob um lock por chave: duas threads pedindo o mesmo
+    modelo frio resultam em um único load, sem bloquear consultas ao
+    pool nem o load de outros modelos.
+    """
+
+    def __init__(
+        self,
+        memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB,
+        idle_timeout_s: Optional[float] = DEFAULT_IDLE_TIMEOUT_S,
+        loader: Optional[Callable[[ModelKey, Optional[str]], Any]] = None,
+        num_workers: int = 1,
+    ) -> None:
+        self.memory_budget_mb = memory_budget_mb
+        self.idle_timeout_s = idle_timeout_s
+        self.num_workers = num_workers
+        self._loader = loader or _default_loader
+
+        self._entries: "OrderedDict[ModelKey, _Entry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._loading: Dict[ModelKey, threading.Lock] = {}
+        self._reaper: Optional[threading.Thread] = None
+        self._stats = {"loads": 0, "hits": 0, "evictions": 0, "load_seconds": 0.0}
+
+    # -----------------------------------------------------
+    # API pública
+    # -----------------------------------------------------
+    def get(
+        self,
+        model: str,
+        device: str = "cpu",
+        compute_type: str = "int8",
+        cpu_threads: int = 0,
+        download_root: Optional[str] = None,
+        num_workers: Optional[int] = None,
+    ) -> Any:
+        key = self._key(model, device, compute_type, cpu_threads, num_workers)
+
+        with self._lock:
+            self.evict_idle()
+            instance = self._hit(key)
+            if instance is not None:
+                return instance
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        # Load fora do lock global: stats()/outros modelos seguem livres
+        with key_lock:
+            with self._lock:
+                instance = self._hit(key)
+                if instance is not None:
+                    return instance
+
+            logger.info(
+                "Carregando faster-whisper | model=%s | device=%s | compute=%s | threads=%d | workers=%d",
+                key.model, key.device, key.compute_type, key.cpu_threads, key.num_workers,
+            )
+            t0 = time.monotonic()
+            instance = self._loader(key, download_root)
+            elapsed = time.monotonic() - t0
+
+            size_mb = estimate_model_mb(model, compute_type)
+            with self._lock:
+                self._make_room(size_mb)
+                self._entries[key] = _Entry(model=instance, size_mb=size_mb)
+                self._loading.pop(key, None)
+                self._stats["loads"] += 1
+                self._stats["load_seconds"] += elapsed
+                logger.info(
+                    "Modelo carregado | model=%s | %.2fs | pool=%d modelos / %.0f MB",
+                    key.model, elapsed, len(self._entries), self.used_mb(),
+                )
+                self._ensure_reaper()
+
+        return instance
+
+    def is_loaded(
+        self,
+        model: str,
+        device: str = "cpu",
+        compute_type: str = "int8",
+        cpu_threads: int = 0,
+        num_workers: Optional[int] = None,
+    ) -> bool:
+        key = self._key(model, device, compute_type, cpu_threads, num_workers)
+        with self._lock:
+            return key in self._entries
+
+    def evict_idle(self) -> int:
+        """Descarrega modelos sem uso há mais de idle_timeout_s."""
+        if not self.idle_timeout_s:
+            return 0
+
+        now = time.monotonic()
+        with self._lock:
+            idle = [
+                key for key, entry in self._entries.items()
+                if now - entry.last_used > self.idle_timeout_s
+            ]
+            for key in idle:
+                self._evict(key, reason="idle")
+        return len(idle)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._evict(key, reason="clear")
+
+    def used_mb(self) -> float:
+        with self._lock:
+            return sum(entry.size_mb for entry in self._entries.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "loaded": [key.model for key in self._entries],
+                "used_mb": self.used_mb(),
+                "budget_mb": self.memory_budget_mb,
+            }
+
+    # -----------------------------------------------------
+    # Internos
+    # -----------------------------------------------------
+    def _key(
+        self,
+        model: str,
+        device: str,
+        compute_type: str,
+        cpu_threads: int,
+        num_workers: Optional[int],
+    ) -> ModelKey:
+        workers = self.num_workers if num_workers is None else num_workers
+        return ModelKey(model, device, compute_type, int(cpu_threads), max(int(workers), 1))
+
+    def _hit(self, key: ModelKey) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry.last_used = time.monotonic()
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return entry.model
+
+    def _make_room(self, size_mb: float) -> None:
+        # O modelo pedido sempre é carregado, mesmo acima do orçamento;
+        # o pool apenas garante que não sobra nada além dele.
+        while self._entries and self.used_mb() + size_mb > self.memory_budget_mb:
+            lru_key = next(iter(self._entries))
+            self._evict(lru_key, reason="lru")
+
+    def _evict(self, key: ModelKey, reason: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._stats["evictions"] += 1
+        logger.info(
+            "Modelo descarregado | model=%s | compute=%s | motivo=%s",
+            key.model, key.compute_type, reason,
+        )
+        del entry
+
+    def _ensure_reaper(self) -> None:
+        if not self.idle_timeout_s:
+            return
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+
+        interval = max(1.0, min(self.idle_timeout_s / 2, 60.0))
+
+        def _loop() -> None:
+            while True:
+                time.sleep(interval)
+                with self._lock:
+                    self.evict_idle()
+                    if not self._entries:
+                        self._reaper = None
+                        return
+
+        self._reaper = threading.Thread(target=_loop, name="model-pool-reaper", daemon=True)
+        self._reaper.start()
+
+
+# ---------------------------------------------------------
+# Pool padrão do processo
+# ---------------------------------------------------------
+_pool: Optional[ModelPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ModelPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ModelPool()
+        return _pool
+
+
+def get_model(
+    model: str,
+    device: str = "cpu",
+    compute_type: str = "int8",
+    cpu_threads: int = 0,
+    download_root: Optional[str] = None,
+    num_workers: Optional[int] = None,
+) -> Any:
+    """Atalho para get_pool().get(...)."""
+    return get_pool().get(
+        model,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        download_root=download_root,
+        num_workers=num_workers,
+    )
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado pool de modelos compartilhado (LRU + orçamento + ociosidade)
+# - Substitui a instância global única de whisper_core
+# - num_workers na chave e no load (decodificações paralelas na mesma instância)
+# - pool.num_workers: padrão para quem não informa num_workers
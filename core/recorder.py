@@ -6,12 +6,22 @@ Módulo canônico de gravação de áudio do projeto.
 Responsabilidades:
 - Capturar áudio localmente no Windows
 - Compatível com microfones modernos (Intel Smart Sound / AGC)
-- Gerar WAV mono 16kHz (compatível com Whisper)
+- Gerar WAV ou FLAC mono 16kHz, 16 bits (compatível com Whisper;
+  formato em [recording] do config.toml, core.audio.storage)
 - Não aplicar regras inválidas baseadas em RMS bruto
 
 Decisão técnica:
 - RMS NÃO é critério de bloqueio
 - Validação baseada em variação do sinal (std)
+- Áudio vai para disco durante a captura (<nome>.part.wav|.flac); a
+  normalização de pico é uma segunda passada em blocos. Memória
+  constante independentemente da duração da reunião
+- Transcrição ao vivo opcional (core.live_transcriber): lê o mesmo
+  buffer circular da captura, sem nunca segurá-la
+- Pausa (pause_event) não fecha o arquivo: o callback descarta os
+  blocos e conta as amostras; as pausas vão para <nome>.kept.json
+  (core.audio.speech_gate) e a transcrição única da sessão volta ao
+  tempo real
 
 Fontes:
 - docs/DECISIONS.md
@@ -27,11 +37,17 @@ import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import numpy as np
 import sounddevice as sd
-import soundfile as sf
+
+from core.audio import storage
+from core.audio.speech_gate import SpeechGate, add_pauses, linear_map, save_kept_map
+from core.audio.stream_writer import StreamingWavWriter, apply_gain
+
+if TYPE_CHECKING:
+    from core.live_transcriber import LiveTranscriber
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +61,7 @@ DTYPE = "float32"
 MIN_SECONDS = 1.0
 TARGET_PEAK = 0.9
 MIN_STD = 1e-5  # variação mínima para considerar áudio válido
+BLOCK_SIZE = 1600  # 100 ms por callback
 
 
 # ---------------------------------------------------------
@@ -76,6 +93,11 @@ def normalize_audio(audio: np.ndarray) -> np.ndarray:
     return audio / peak * TARGET_PEAK
 
 
+def normalization_gain(peak: float) -> float:
+    """Ganho equivalente a normalize_audio, a partir do pico já medido."""
+    return TARGET_PEAK / peak if peak > 0 else 1.0
+
+
 def compute_rms(audio: np.ndarray) -> float:
     if audio.size == 0:
         return 0.0
@@ -94,12 +116,27 @@ def record_until_stop(
     base_name: str,
     stop_event: Optional[threading.Event] = None,
     show_timer: bool = True,
+    live: Optional["LiveTranscriber"] = None,
+    storage_cfg: Optional[Dict[str, Any]] = None,
+    pause_event: Optional[threading.Event] = None,
 ) -> Path:
     """
     Grava áudio até o usuário encerrar (ENTER) ou stop_event.
 
+    Com live (qualquer objeto com attach(ring, nome)/finish(), ex:
+    LiveTranscriber ou StreamingRecognizer), a transcrição acontece
+    durante a captura; ao parar, só o trecho final é decodificado e o
+    resultado fica em live.result.
+
+    storage_cfg: resultado de storage.load_storage_config (padrão: WAV
+    PCM16 com dither). Com speech_gate habilitado, silêncios longos não
+    são gravados e o mapa de intervalos vai para <nome>.kept.json.
+
+    pause_event: enquanto setado, a captura é descartada sem fechar o
+    arquivo; as pausas também vão para <nome>.kept.json.
+
     Retorna:
-        Path do arquivo WAV gerado.
+        Path do arquivo de áudio gerado (WAV ou FLAC).
 
     Lança:
         RuntimeError em caso de áudio inválido.
@@ -108,26 +145,61 @@ def record_until_stop(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     safe_name = normalize_filename(base_name)
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    output_path = output_dir / f"{safe_name}_{timestamp}.wav"
+    started_at = datetime.now()
+    timestamp = started_at.strftime("%Y-%m-%d_%H-%M-%S")
+    storage_cfg = storage_cfg or storage.load_storage_config({})
+    fmt = storage_cfg["format"]
+    output_path = output_dir / f"{safe_name}_{timestamp}{storage.suffix(fmt)}"
+    part_path = output_path.with_suffix(f".part{storage.suffix(fmt)}")
 
     device = select_input_device()
     device_info = sd.query_devices(device)
     logger.info("Microfone selecionado: %s", device_info["name"])
 
-    frames: list[np.ndarray] = []
+    gate_cfg = storage_cfg["speech_gate"]
+    gate = (
+        SpeechGate(SAMPLE_RATE, gate_cfg["max_silence_s"], gate_cfg["pad_s"])
+        if gate_cfg["enabled"]
+        else None
+    )
+    writer = StreamingWavWriter(
+        part_path,
+        SAMPLE_RATE,
+        CHANNELS,
+        subtype=storage.capture_subtype(fmt),
+        format=storage.container(fmt),
+        gate=gate,
+    ).start()
+    if live is not None:
+        live.attach(writer.ring, output_path.stem)
     internal_stop = stop_event or threading.Event()
 
-    def callback(indata, _frames, _time, status):
+    # Callback só copia para o buffer circular; status é contado e
+    # logado no fim (logging faz I/O na thread de áudio)
+    capture_status: list = []
+    pushed = [0]
+    pauses: list = []           # [posição, duração] em amostras
+    paused = [False]
+
+    def callback(indata, frames, _time, status):
         if status:
-            logger.warning("Status de captura: %s", status)
-        frames.append(indata.copy())
+            capture_status.append(status)
+        if pause_event is not None and pause_event.is_set():
+            if not paused[0]:
+                pauses.append([pushed[0], 0])
+                paused[0] = True
+            pauses[-1][1] += frames
+            return
+        paused[0] = False
+        pushed[0] += frames
+        writer.push(indata)
 
     def timer(start_time: float):
         while not internal_stop.is_set():
             elapsed = int(time.time() - start_time)
+            label = "⏸️ Pausado" if paused[0] else "🎙️ Gravando..."
             print(
-                f"\r🎙️ Gravando... {elapsed//60:02d}:{elapsed%60:02d}",
+                f"\r{label} {elapsed//60:02d}:{elapsed%60:02d}",
                 end="",
             )
             time.sleep(1)
@@ -140,46 +212,91 @@ def record_until_stop(
     if show_timer:
         threading.Thread(target=timer, args=(start_time,), daemon=True).start()
 
-    with sd.InputStream(
-        samplerate=SAMPLE_RATE,
-        channels=CHANNELS,
-        dtype=DTYPE,
-        device=device,
-        callback=callback,
-    ):
-        if stop_event is None:
-            input()
-            internal_stop.set()
-        else:
-            stop_event.wait()
+    try:
+        with sd.InputStream(
+            samplerate=SAMPLE_RATE,
+            channels=CHANNELS,
+            dtype=DTYPE,
+            device=device,
+            blocksize=BLOCK_SIZE,
+            callback=callback,
+        ):
+            if stop_event is None:
+                input()
+                internal_stop.set()
+            else:
+                stop_event.wait()
+    finally:
+        # Mesmo com erro na captura, o que chegou fica no arquivo .part;
+        # erro ao fechar o arquivo não impede a transcrição ao vivo de
+        # parar (thread e leitor do buffer)
+        try:
+            stats = writer.close()
+        finally:
+            if live is not None:
+                try:
+                    live.finish()
+                except Exception:
+                    # Transcrição ao vivo é acessória: a gravação continua válida
+                    logger.exception("Falha ao concluir transcrição ao vivo")
 
     print()
 
-    audio = np.concatenate(frames, axis=0) if frames else np.array([], dtype=DTYPE)
-    duration = audio.shape[0] / SAMPLE_RATE
+    if capture_status:
+        logger.warning(
+            "Status de captura | ocorrências=%d | último=%s",
+            len(capture_status), capture_status[-1],
+        )
+
+    duration = stats["duration_s"]
 
     if duration < MIN_SECONDS:
+        part_path.unlink(missing_ok=True)
         raise RuntimeError("Áudio muito curto para transcrição")
 
-    audio = normalize_audio(audio)
-
-    rms = compute_rms(audio)
-    std = float(np.std(audio))
+    # Estatísticas após a normalização (o ganho escala rms e std)
+    gain = normalization_gain(stats["peak"])
+    rms = stats["rms"] * gain
+    std = stats["std"] * gain
 
     logger.info(
-        "Gravação encerrada | duração=%.2fs | rms=%.6f | std=%.6f",
+        "Gravação encerrada | duração=%.2fs | rms=%.6f | std=%.6f | overruns=%d | buffer_max=%.0f%%",
         duration,
         rms,
         std,
+        stats["buffer"]["overruns"],
+        stats["buffer"]["high_watermark_ratio"] * 100,
     )
 
     print(f"🔊 RMS: {rms:.6f} | Δ sinal (std): {std:.6f}")
 
-    if not has_signal_variation(audio):
+    if std <= MIN_STD:
+        part_path.unlink(missing_ok=True)
         raise RuntimeError("Áudio inválido (sem variação detectável)")
 
-    sf.write(output_path, audio, SAMPLE_RATE)
-    logger.info("Arquivo salvo: %s", output_path)
+    apply_gain(
+        part_path,
+        output_path,
+        gain,
+        subtype=storage.FINAL_SUBTYPE,
+        format=storage.container(fmt),
+        dither=storage_cfg["dither"],
+    )
+    part_path.unlink(missing_ok=True)
+    logger.info("Arquivo salvo: %s | ganho=%.3f", output_path, gain)
+
+    if gate is not None:
+        logger.info(
+            "Gate de fala | gravado=%.1fs de %.1fs | silencio descartado=%.1fs",
+            stats["gate"]["kept_s"], stats["gate"]["source_s"], stats["gate"]["dropped_s"],
+        )
+
+    kept_map = gate.kept_map() if gate is not None else None
+    if pauses:
+        kept_map = add_pauses(kept_map or linear_map(pushed[0], SAMPLE_RATE, started_at), pauses)
+        logger.info("Pausas | %d | total=%.1fs", len(pauses), kept_map["paused_s"])
+    if kept_map is not None:
+        save_kept_map(output_path, kept_map)
 
     return output_path
 
@@ -193,3 +310,13 @@ def record_until_stop(
 # - Normalização obrigatória antes da validação
 # - Logs enriquecidos para diagnóstico
 # - Compatibilidade confirmada com Intel Smart Sound
+#
+# 2026-10-18
+# - Gravação em streaming para <nome>.part.wav (fila limitada + thread)
+# - Normalização de pico como pós-passada em blocos (memória constante)
+# - Callback copia para buffer circular pré-alocado (overruns/high-watermark no log)
+# - Transcrição ao vivo opcional (live=LiveTranscriber) sobre o mesmo buffer
+# - Formato configurável (storage_cfg): WAV PCM16 ou FLAC incremental, dither TPDF
+# - Gate de fala opcional ([recording.speech_gate]) com mapa <nome>.kept.json
+# - Pausar/retomar sem fechar o arquivo (pause_event); pausas no mapa .kept.json
+# - live.finish() roda mesmo se writer.close() falhar
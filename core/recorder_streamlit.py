@@ -1,7 +1,10 @@
 import threading
 import logging
 from pathlib import Path
-from core.recorder import record_until_stop
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from core.live_transcriber import LiveTranscriber
 
 logger = logging.getLogger(__name__)
 
@@ -10,21 +13,40 @@ class StreamlitRecorder:
     """
     Controlador de gravação para Streamlit.
     O core decide o nome final do arquivo.
+    Com live_transcriber, o texto parcial fica disponível durante a
+    gravação (partial_transcript) e o resultado final em live_result.
+    pause()/resume() mantêm um único arquivo por sessão; as pausas
+    ficam no mapa <nome>.kept.json (ver core.recorder).
     """
 
-    def __init__(self, output_dir: Path, base_name: str):
+    def __init__(
+        self,
+        output_dir: Path,
+        base_name: str,
+        live_transcriber: Optional["LiveTranscriber"] = None,
+        storage_cfg: Optional[Dict[str, Any]] = None,
+    ):
         self.output_dir = output_dir
         self.base_name = base_name
+        self.live_transcriber = live_transcriber
+        self.storage_cfg = storage_cfg
         self.final_audio_path: Path | None = None
 
         self._thread = None
         self._stop_event = threading.Event()
+        self._pause_event = threading.Event()
 
     def _run(self):
+        # sounddevice/PortAudio só carregam quando a gravação começa
+        from core.recorder import record_until_stop
+
         self.final_audio_path = record_until_stop(
             self.output_dir,
             self.base_name,
             self._stop_event,
+            live=self.live_transcriber,
+            storage_cfg=self.storage_cfg,
+            pause_event=self._pause_event,
         )
         logger.info("Gravação concluída | path=%s", self.final_audio_path)
 
@@ -34,6 +56,7 @@ class StreamlitRecorder:
             return
 
         self._stop_event.clear()
+        self._pause_event.clear()
 
         self._thread = threading.Thread(
             target=self._run,
@@ -44,13 +67,46 @@ class StreamlitRecorder:
         logger.info("Thread de gravação iniciada")
 
     def stop(self):
+        """
+        Para a captura e espera o arquivo final: o pós-processamento
+        (ganho sobre o arquivo inteiro, trecho final da transcrição ao
+        vivo) cresce com a duração, então não há timeout.
+        """
         if not self.is_running():
             logger.warning("Stop chamado sem gravação ativa")
             return
 
         logger.info("Finalizando gravação via Streamlit")
         self._stop_event.set()
-        self._thread.join(timeout=10)
+        self._thread.join()
+
+    def pause(self):
+        if not self.is_running():
+            logger.warning("Pause chamado sem gravação ativa")
+            return
+        self._pause_event.set()
+        logger.info("Gravação pausada (arquivo continua aberto)")
+
+    def resume(self):
+        if not self.is_running():
+            logger.warning("Resume chamado sem gravação ativa")
+            return
+        self._pause_event.clear()
+        logger.info("Gravação retomada")
+
+    def is_paused(self) -> bool:
+        return self.is_running() and self._pause_event.is_set()
 
     def is_running(self) -> bool:
         return self._thread is not None and self._thread.is_alive()
+
+    def partial_transcript(self) -> str:
+        if self.live_transcriber is None:
+            return ""
+        return self.live_transcriber.partial_text()
+
+    @property
+    def live_result(self) -> Optional[Dict[str, Any]]:
+        if self.live_transcriber is None:
+            return None
+        return self.live_transcriber.result
@@ -0,0 +1,240 @@
+"""
+segment_store.py
+
+Armazenamento colunar compacto de segmentos (sidecar .npz).
+
+Responsabilidades:
+- Acumular segmentos/palavras em colunas (array.array) durante a
+  transcrição, sem manter um dict por palavra
+- Persistir como arrays estruturados NumPy em <stem>.segments.npz
+- Carregar de forma preguiçosa e recortar por intervalo de tempo
+
+Formato (.npz):
+- segments: start, end, avg_logprob, no_speech_prob (float32),
+            text_offset, text_len, word_first, word_count (int32/int64)
+- words:    start, end, probability (float32), text_offset, text_len
+- text:     blob UTF-8 (uint8) com o texto de segmentos e palavras
+
+Decisões:
+- O JSON do resultado continua sendo a fonte canônica; o .npz é um
+  sidecar opcional para sessões longas com timestamps por palavra
+- float32 basta para timestamps (precisão < 1 ms até ~4 h)
+- Gravado no mesmo tempo do JSON: remap_times() aplica o mapa do gate
+  de fala (core.audio.speech_gate) antes de save()
+"""
+
+from __future__ import annotations
+
+import logging
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_SUFFIX = ".segments.npz"
+
+SEGMENT_DTYPE = np.dtype([
+    ("start", "<f4"),
+    ("end", "<f4"),
+    ("avg_logprob", "<f4"),
+    ("no_speech_prob", "<f4"),
+    ("text_offset", "<i8"),
+    ("text_len", "<i4"),
+    ("word_first", "<i4"),
+    ("word_count", "<i4"),
+])
+
+WORD_DTYPE = np.dtype([
+    ("start", "<f4"),
+    ("end", "<f4"),
+    ("probability", "<f4"),
+    ("text_offset", "<i8"),
+    ("text_len", "<i4"),
+])
+
+
+def sidecar_path(transcript_path: Path) -> Path:
+    """Caminho do sidecar ao lado do .txt/.json (mesmo stem)."""
+    return transcript_path.with_name(transcript_path.stem + SIDECAR_SUFFIX)
+
+
+# ---------------------------------------------------------
+# Escrita
+# ---------------------------------------------------------
+class SegmentColumns:
+    """
+    Acumulador colunar. Aceita os dicts de segmento produzidos por
+    whisper_core (com "words", "avg_logprob" e "no_speech_prob" quando
+    word_timestamps=True).
+    """
+
+    def __init__(self) -> None:
+        self._text = bytearray()
+        self._seg = {name: array("f") for name in ("start", "end", "avg_logprob", "no_speech_prob")}
+        self._seg_text = {"offset": array("q"), "len": array("i")}
+        self._seg_words = {"first": array("i"), "count": array("i")}
+        self._word = {name: array("f") for name in ("start", "end", "probability")}
+        self._word_text = {"offset": array("q"), "len": array("i")}
+
+    def __len__(self) -> int:
+        return len(self._seg["start"])
+
+    def _push_text(self, text: str, target: Dict[str, array]) -> None:
+        encoded = text.encode("utf-8")
+        target["offset"].append(len(self._text))
+        target["len"].append(len(encoded))
+        self._text.extend(encoded)
+
+    def append(self, segment: Dict[str, Any]) -> None:
+        self._seg["start"].append(segment["start"])
+        self._seg["end"].append(segment["end"])
+        self._seg["avg_logprob"].append(segment.get("avg_logprob", float("nan")))
+        self._seg["no_speech_prob"].append(segment.get("no_speech_prob", float("nan")))
+        self._push_text(segment["text"], self._seg_text)
+
+        words = segment.get("words") or []
+        self._seg_words["first"].append(len(self._word["start"]))
+        self._seg_words["count"].append(len(words))
+        for word in words:
+            self._word["start"].append(word["start"])
+            self._word["end"].append(word["end"])
+            self._word["probability"].append(word.get("probability", float("nan")))
+            self._push_text(word["word"], self._word_text)
+
+    @classmethod
+    def load(cls, path: Path) -> "SegmentColumns":
+        """Reconstrói o acumulador a partir de um .npz salvo."""
+        columns = cls()
+        with SegmentStore(path) as store:
+            for index in range(len(store)):
+                columns.append(store.segment(index, with_words=True))
+        return columns
+
+    def remap_times(self, fn: Callable[[float], float]) -> None:
+        """Aplica fn a start/end de segmentos e palavras (ex: to_source_time)."""
+        for table in (self._seg, self._word):
+            for name in ("start", "end"):
+                table[name] = array("f", (fn(t) for t in table[name]))
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        segments = np.empty(len(self), dtype=SEGMENT_DTYPE)
+        for name, col in self._seg.items():
+            segments[name] = np.frombuffer(col, dtype=np.float32)
+        segments["text_offset"] = np.frombuffer(self._seg_text["offset"], dtype=np.int64)
+        segments["text_len"] = np.frombuffer(self._seg_text["len"], dtype=np.int32)
+        segments["word_first"] = np.frombuffer(self._seg_words["first"], dtype=np.int32)
+        segments["word_count"] = np.frombuffer(self._seg_words["count"], dtype=np.int32)
+
+        words = np.empty(len(self._word["start"]), dtype=WORD_DTYPE)
+        for name, col in self._word.items():
+            words[name] = np.frombuffer(col, dtype=np.float32)
+        words["text_offset"] = np.frombuffer(self._word_text["offset"], dtype=np.int64)
+        words["text_len"] = np.frombuffer(self._word_text["len"], dtype=np.int32)
+
+        return {
+            "segments": segments,
+            "words": words,
+            "text": np.frombuffer(bytes(self._text), dtype=np.uint8),
+        }
+
+    def save(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # np.savez acrescenta .npz se o nome não terminar assim
+        with path.open("wb") as f:
+            np.savez_compressed(f, **self.to_arrays())
+        logger.info(
+            "Sidecar salvo | %s | segmentos=%d | palavras=%d | %.1f KB",
+            path.name, len(self), len(self._word["start"]), path.stat().st_size / 1024,
+        )
+        return path
+
+
+# ---------------------------------------------------------
+# Leitura
+# ---------------------------------------------------------
+class SegmentStore:
+    """
+    Leitor preguiçoso do sidecar: só a coluna de segmentos é carregada
+    na abertura; palavras e texto são lidos no primeiro recorte.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._npz = np.load(path)
+        self.segments: np.ndarray = self._npz["segments"]
+        self._words: Optional[np.ndarray] = None
+        self._text: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return int(self.segments.shape[0])
+
+    def __enter__(self) -> "SegmentStore":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._npz.close()
+
+    @property
+    def duration(self) -> float:
+        return float(self.segments["end"].max()) if len(self) else 0.0
+
+    def _blob(self) -> np.ndarray:
+        if self._text is None:
+            self._text = self._npz["text"]
+        return self._text
+
+    def _word_table(self) -> np.ndarray:
+        if self._words is None:
+            self._words = self._npz["words"]
+        return self._words
+
+    def _decode(self, offset: int, length: int) -> str:
+        return self._blob()[offset: offset + length].tobytes().decode("utf-8")
+
+    def index_range(self, start_s: float, end_s: float) -> range:
+        """Índices dos segmentos que intersectam [start_s, end_s)."""
+        # start é crescente; end também (segmentos não se sobrepõem)
+        first = int(np.searchsorted(self.segments["end"], start_s, side="right"))
+        last = int(np.searchsorted(self.segments["start"], end_s, side="left"))
+        return range(first, max(first, last))
+
+    def segment(self, index: int, with_words: bool = False) -> Dict[str, Any]:
+        row = self.segments[index]
+        item: Dict[str, Any] = {
+            "start": float(row["start"]),
+            "end": float(row["end"]),
+            "text": self._decode(int(row["text_offset"]), int(row["text_len"])),
+            "avg_logprob": float(row["avg_logprob"]),
+            "no_speech_prob": float(row["no_speech_prob"]),
+        }
+        if with_words:
+            words = self._word_table()
+            first, count = int(row["word_first"]), int(row["word_count"])
+            item["words"] = [
+                {
+                    "start": float(w["start"]),
+                    "end": float(w["end"]),
+                    "word": self._decode(int(w["text_offset"]), int(w["text_len"])),
+                    "probability": float(w["probability"]),
+                }
+                for w in words[first: first + count]
+            ]
+        return item
+
+    def slice(self, start_s: float, end_s: float, with_words: bool = False) -> List[Dict[str, Any]]:
+        return [self.segment(i, with_words) for i in self.index_range(start_s, end_s)]
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado sidecar colunar (.segments.npz) com leitor preguiçoso
+# - remap_times: sidecar no mesmo tempo do JSON (mapa do gate de fala)
+# - SegmentColumns.load: colunas guardadas no cache de transcrições
@@ -0,0 +1,260 @@
+"""
+session_manifest.py
+
+Manifesto (session.json) de uma sessão gravada em chunks.
+
+Responsabilidades:
+- Registrar cada chunk com seus offsets reais na sessão (início/fim)
+- Registrar o motivo do corte (silêncio ou fim da sessão)
+- Registrar hash do áudio, status da transcrição e tempos
+- Persistir de forma atômica após cada alteração
+- Reconstruir transcricao_completa.txt a partir dos arquivos por chunk
+
+Decisões:
+- Um único JSON pequeno reescrito por inteiro (tmp + os.replace), como
+  language.json: nunca fica meio escrito após uma queda
+- Offsets em segundos com precisão de amostra (round 4)
+- Hash SHA-256 do PCM do chunk: na retomada, um WAV alterado ou
+  truncado é detectado antes de ser transcrito
+- Lock interno: a captura adiciona chunks enquanto os workers marcam
+  transcrições concluídas
+- Sessões antigas (sem session.json) são reconstruídas a partir dos
+  audio_XXXX.wav/.flac existentes
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.audio.storage import audio_info, find_audio
+from core.stitcher import SeamStitcher
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "session.json"
+MANIFEST_VERSION = 2
+CONSOLIDATED_FILE = "transcricao_completa.txt"
+
+
+def audio_name(index: int, suffix: str = ".wav") -> str:
+    return f"audio_{index:04d}{suffix}"
+
+
+def transcript_name(index: int) -> str:
+    return f"transcricao_{index:04d}.txt"
+
+
+def words_name(index: int) -> str:
+    return f"transcricao_{index:04d}.words.json"
+
+
+def pcm_sha256(audio_bytes: bytes) -> str:
+    return hashlib.sha256(audio_bytes).hexdigest()
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class SessionManifest:
+    def __init__(self, session_dir: Path, sample_rate: int, overlap_s: float = 0.0) -> None:
+        self.session_dir = session_dir
+        self.path = session_dir / MANIFEST_FILE
+        self._lock = threading.Lock()
+        self.data: Dict[str, Any] = {
+            "version": MANIFEST_VERSION,
+            "created_at": _now(),
+            "sample_rate": sample_rate,
+            "overlap_s": overlap_s,
+            "chunks": [],
+        }
+
+    # -----------------------------------------------------
+    # Carga
+    # -----------------------------------------------------
+    @classmethod
+    def load(cls, session_dir: Path) -> "SessionManifest":
+        """Lê session.json; sem ele, reconstrói a partir dos áudios."""
+        path = session_dir / MANIFEST_FILE
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            manifest = cls(session_dir, data["sample_rate"], data.get("overlap_s", 0.0))
+            manifest.data.update(data)
+            return manifest
+
+        logger.warning("session.json ausente | reconstruindo a partir dos audios | %s", session_dir)
+        manifest: Optional[SessionManifest] = None
+        offset = 0
+        for audio_path in find_audio(session_dir, "audio_*"):
+            info = audio_info(audio_path)
+            sample_rate, frames = info["sample_rate"], info["frames"]
+            if manifest is None:
+                manifest = cls(session_dir, sample_rate)
+            index = int(audio_path.stem.split("_")[-1])
+            entry = manifest._entry(index, audio_path, offset, offset + frames, "unknown")
+            entry["sha256"] = None
+            if (session_dir / transcript_name(index)).exists():
+                entry["status"] = "done"
+            manifest.chunks.append(entry)
+            offset += frames
+
+        manifest = manifest or cls(session_dir, 16000)
+        manifest.save()
+        return manifest
+
+    # -----------------------------------------------------
+    # Registro
+    # -----------------------------------------------------
+    @property
+    def chunks(self) -> List[Dict[str, Any]]:
+        return self.data["chunks"]
+
+    @property
+    def overlap_s(self) -> float:
+        return float(self.data.get("overlap_s", 0.0))
+
+    def chunk(self, index: int) -> Dict[str, Any]:
+        return next(c for c in self.chunks if c["index"] == index)
+
+    def _entry(
+        self,
+        index: int,
+        audio_path: Path,
+        start_sample: int,
+        end_sample: int,
+        cut: str,
+    ) -> Dict[str, Any]:
+        sr = self.data["sample_rate"]
+        return {
+            "index": index,
+            "audio": audio_path.name,
+            "start_s": round(start_sample / sr, 4),
+            "end_s": round(end_sample / sr, 4),
+            "duration_s": round((end_sample - start_sample) / sr, 4),
+            "cut": cut,
+            "status": "pending",
+        }
+
+    def add_chunk(
+        self,
+        index: int,
+        audio_path: Path,
+        start_sample: int,
+        end_sample: int,
+        cut: str,
+        audio_bytes: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        entry = self._entry(index, audio_path, start_sample, end_sample, cut)
+        entry["sha256"] = pcm_sha256(audio_bytes) if audio_bytes is not None else None
+        entry["captured_at"] = _now()
+        with self._lock:
+            self.chunks.append(entry)
+            self.save()
+        return entry
+
+    def mark_done(
+        self,
+        index: int,
+        decode_s: float,
+        language: Optional[str],
+        words_file: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            entry = self.chunk(index)
+            entry.update(
+                status="done",
+                transcript=transcript_name(index),
+                decode_s=round(decode_s, 2),
+                language=language,
+                transcribed_at=_now(),
+            )
+            entry.pop("error", None)
+            if words_file:
+                entry["words"] = words_file
+            self.save()
+
+    def mark_failed(self, index: int, error: str) -> None:
+        with self._lock:
+            entry = self.chunk(index)
+            entry.update(status="failed", error=error, transcribed_at=_now())
+            self.save()
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    # -----------------------------------------------------
+    # Retomada
+    # -----------------------------------------------------
+    def is_transcribed(self, entry: Dict[str, Any]) -> bool:
+        if entry.get("status") != "done":
+            return False
+        if not (self.session_dir / transcript_name(entry["index"])).exists():
+            return False
+        # Com overlap, a reconstrução precisa das palavras
+        return not self.overlap_s or (self.session_dir / words_name(entry["index"])).exists()
+
+    def pending(self) -> List[Dict[str, Any]]:
+        return [c for c in self.chunks if not self.is_transcribed(c)]
+
+    def verify_audio(self, entry: Dict[str, Any], audio_bytes: bytes) -> bool:
+        expected = entry.get("sha256")
+        return expected is None or expected == pcm_sha256(audio_bytes)
+
+
+def rebuild_consolidated(manifest: SessionManifest) -> Path:
+    """
+    Regrava transcricao_completa.txt a partir dos arquivos por chunk
+    (mesmo formato do modo contínuo). Chunks sem transcrição entram
+    vazios.
+    """
+    session_dir = manifest.session_dir
+    stitcher = SeamStitcher(manifest.overlap_s) if manifest.overlap_s else None
+
+    parts: List[str] = []
+    for entry in sorted(manifest.chunks, key=lambda c: c["index"]):
+        index = entry["index"]
+        text_path = session_dir / transcript_name(index)
+        words_path = session_dir / words_name(index)
+
+        if stitcher is not None and words_path.exists():
+            words = json.loads(words_path.read_text(encoding="utf-8"))
+            head, body = stitcher.push(words, entry["start_s"], entry["end_s"])
+        else:
+            head = ""
+            body = text_path.read_text(encoding="utf-8-sig") if text_path.exists() else ""
+
+        if head:
+            parts.append(f" {head}")
+        if parts:
+            parts.append("\n\n")
+        parts.append(f"--- Chunk {index:04d} ---\n{body}")
+
+    tail = stitcher.flush() if stitcher is not None else ""
+    parts.append(f" {tail}\n\n" if tail else "\n\n")
+
+    consolidated_path = session_dir / CONSOLIDATED_FILE
+    tmp = consolidated_path.with_suffix(".tmp")
+    tmp.write_text("".join(parts), encoding="utf-8-sig")
+    os.replace(tmp, consolidated_path)
+    return consolidated_path
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado manifesto da sessão com offsets reais de cada chunk
+# - overlap_s registrado (chunks sobrepostos)
+# - Hash do PCM, status/tempos de transcrição, carga para retomada e
+#   reconstrução do consolidado
+# - Chunks em WAV ou FLAC (core.audio.storage)
@@ -0,0 +1,150 @@
+"""
+stitcher.py
+
+União (stitching) de transcrições de chunks sobrepostos.
+
+Responsabilidades:
+- Alinhar as palavras da cauda de um chunk com as do início do próximo
+  dentro da região de overlap
+- Manter exatamente uma cópia de cada palavra repetida na emenda
+- Escolher o ponto de emenda mais próximo do centro do overlap, onde
+  os dois chunks têm mais contexto
+
+Decisões:
+- Alinhamento linear (dois ponteiros): palavras iguais (normalizadas)
+  com timestamps a até max_shift_s são pareadas; caso contrário avança
+  o ponteiro da palavra que termina antes. Sem DP quadrática
+- Sem nenhum par, a emenda cai no centro do overlap pelo tempo
+- Timestamps sempre absolutos (segundos desde o início da sessão)
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Tuple
+
+MAX_SHIFT_S = 0.6
+
+Word = Dict[str, Any]
+
+_PUNCT = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_token(word: str) -> str:
+    return _PUNCT.sub("", word).lower()
+
+
+def _mid(word: Word) -> float:
+    return (word["start"] + word["end"]) / 2
+
+
+def align_words(
+    left: List[Word],
+    right: List[Word],
+    max_shift_s: float = MAX_SHIFT_S,
+) -> List[Tuple[int, int]]:
+    """Pares (i, j) de palavras equivalentes, em O(len(left) + len(right))."""
+    pairs: List[Tuple[int, int]] = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        a, b = left[i], right[j]
+        token_a, token_b = normalize_token(a["word"]), normalize_token(b["word"])
+
+        if token_a and token_a == token_b and abs(_mid(a) - _mid(b)) <= max_shift_s:
+            pairs.append((i, j))
+            i += 1
+            j += 1
+        elif _mid(a) <= _mid(b):
+            i += 1
+        else:
+            j += 1
+    return pairs
+
+
+def stitch_words(
+    previous: List[Word],
+    following: List[Word],
+    overlap_start: float,
+    overlap_end: float,
+    max_shift_s: float = MAX_SHIFT_S,
+) -> List[Word]:
+    """
+    Junta as palavras de dois chunks consecutivos cujo áudio se sobrepõe
+    em [overlap_start, overlap_end].
+    """
+    if overlap_end <= overlap_start or not previous or not following:
+        return previous + following
+
+    # Só a região de overlap (com folga) participa do alinhamento
+    left_from = next(
+        (k for k, w in enumerate(previous) if w["end"] > overlap_start - max_shift_s),
+        len(previous),
+    )
+    right_to = next(
+        (k for k, w in enumerate(following) if w["start"] >= overlap_end + max_shift_s),
+        len(following),
+    )
+    left = previous[left_from:]
+    right = following[:right_to]
+
+    center = (overlap_start + overlap_end) / 2
+    pairs = align_words(left, right, max_shift_s)
+
+    if pairs:
+        i, j = min(pairs, key=lambda p: abs(_mid(left[p[0]]) - center))
+        split = (left_from + i, j)
+    else:
+        # Sem âncora: corta pelo tempo no centro do overlap
+        i = next((k for k, w in enumerate(previous) if _mid(w) >= center), len(previous))
+        j = next((k for k, w in enumerate(following) if _mid(w) >= center), len(following))
+        split = (i, j)
+
+    return previous[: split[0]] + following[split[1]:]
+
+
+def words_to_text(words: List[Word]) -> str:
+    return "".join(w["word"] for w in words).strip()
+
+
+class SeamStitcher:
+    """
+    Une chunks sobrepostos em ordem, para escrita incremental: a cauda
+    de cada chunk (ainda sujeita a emenda) fica retida até o próximo.
+    """
+
+    def __init__(self, overlap_s: float, max_shift_s: float = MAX_SHIFT_S) -> None:
+        self.overlap_s = overlap_s
+        self.max_shift_s = max_shift_s
+        self._held: List[Word] = []
+        self._held_end = 0.0
+
+    def push(self, words: List[Word], start_s: float, end_s: float) -> Tuple[str, str]:
+        """
+        Retorna (continuação do chunk anterior, corpo deste chunk) já
+        sem duplicatas; a cauda deste chunk fica retida.
+        """
+        head = ""
+        if self._held:
+            words = stitch_words(self._held, words, start_s, self._held_end, self.max_shift_s)
+            seam = (start_s + self._held_end) / 2
+            head = words_to_text([w for w in words if w["end"] <= seam])
+            words = [w for w in words if w["end"] > seam]
+
+        hold_from = end_s - self.overlap_s - self.max_shift_s
+        self._held = [w for w in words if w["end"] > hold_from]
+        self._held_end = end_s
+        return head, words_to_text([w for w in words if w["end"] <= hold_from])
+
+    def flush(self) -> str:
+        """Cauda retida do último chunk (fim da sessão)."""
+        tail = words_to_text(self._held)
+        self._held = []
+        return tail
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado stitcher de chunks sobrepostos (alinhamento linear de palavras)
+# - SeamStitcher: emenda incremental (modo contínuo e reconstrução)
@@ -0,0 +1,368 @@
+"""
+streaming_recognizer.py
+
+Reconhecimento em streaming de baixa latência (legendas ao vivo).
+
+Responsabilidades:
+- Re-decodificar, a cada passo (~1 s de áudio novo), uma janela
+  deslizante sobre o buffer circular da captura
+- Confirmar só o prefixo estável: palavras em que duas decodificações
+  consecutivas concordam (política "local agreement")
+- Cortar a janela no fim de frases já confirmadas, mantendo a
+  decodificação curta e a latência baixa
+- Emitir eventos "partial" (hipótese instável) e "final" (confirmado),
+  com latência e custo de computação por segundo de áudio
+
+Decisões:
+- Timestamps por palavra (whisper_core.transcribe_array) alinhados no
+  tempo absoluto do stream; comparação por token normalizado (mesma
+  normalização de core.stitcher)
+- Texto confirmado antes da janela vai como initial_prompt: a janela
+  perde áudio, mas não perde contexto
+- Sem fim de frase até max_buffer_s, corta na última palavra confirmada;
+  sem nada confirmado (hipóteses que não concordam, ruído), a hipótese
+  instável sai como final não confirmado e a janela recomeça: o limite
+  vale a cada passo, não só quando algo é confirmado
+- Mesma interface de core.live_transcriber (attach/finish): pode ser
+  passado como live= para core.recorder.record_until_stop
+- Leitor lossy: se a decodificação não acompanhar a captura, o áudio
+  mais antigo é pulado e a janela recomeça (a gravação não é afetada)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from core.audio.ring_buffer import RingBuffer, RingReader
+from core.live_transcriber import PIN_LANGUAGE_PROBABILITY
+from core.stitcher import normalize_token, words_to_text
+from core.whisper_core import SAMPLE_RATE, transcribe_array
+
+logger = logging.getLogger(__name__)
+
+MIN_STEP_S = 1.0
+TRIM_S = 8.0
+MAX_BUFFER_S = 20.0
+PROMPT_CHARS = 200
+POLL_INTERVAL_S = 0.1
+SENTENCE_END = (".", "?", "!", "…")
+MAX_NGRAM = 5
+
+Word = Dict[str, Any]
+Event = Dict[str, Any]
+
+
+class HypothesisBuffer:
+    """
+    Local agreement entre hipóteses consecutivas.
+
+    insert() recebe as palavras da decodificação atual; commit()
+    confirma o maior prefixo comum com a hipótese anterior.
+    """
+
+    def __init__(self) -> None:
+        self.committed_end = 0.0
+        self._recent: List[Word] = []     # cauda confirmada (dedup de n-gramas)
+        self._previous: List[Word] = []
+        self._current: List[Word] = []
+
+    def insert(self, words: List[Word]) -> None:
+        new = [w for w in words if w["start"] > self.committed_end - 0.1]
+
+        # A janela ainda contém o fim já confirmado: remove o n-grama
+        # repetido no início da hipótese
+        if new and abs(new[0]["start"] - self.committed_end) < 1.0:
+            for n in range(min(MAX_NGRAM, len(self._recent), len(new)), 0, -1):
+                tail = [normalize_token(w["word"]) for w in self._recent[-n:]]
+                head = [normalize_token(w["word"]) for w in new[:n]]
+                if tail == head:
+                    new = new[n:]
+                    break
+        self._current = new
+
+    def commit(self) -> List[Word]:
+        agreed: List[Word] = []
+        for prev, cur in zip(self._previous, self._current):
+            if normalize_token(prev["word"]) != normalize_token(cur["word"]):
+                break
+            agreed.append(cur)
+
+        self._previous = self._current[len(agreed):]
+        self._current = []
+        if agreed:
+            self.committed_end = agreed[-1]["end"]
+            self._recent = (self._recent + agreed)[-MAX_NGRAM:]
+        return agreed
+
+    def unstable(self) -> List[Word]:
+        return list(self._previous)
+
+    def reset(self, position_s: float) -> None:
+        self.committed_end = position_s
+        self._recent, self._previous, self._current = [], [], []
+
+
+class StreamingRecognizer:
+    def __init__(
+        self,
+        on_event: Optional[Callable[[Event], None]] = None,
+        language: Optional[str] = None,
+        profile: Optional[Dict[str, Any]] = None,
+        min_step_s: float = MIN_STEP_S,
+        trim_s: float = TRIM_S,
+        max_buffer_s: float = MAX_BUFFER_S,
+    ) -> None:
+        self.on_event = on_event
+        self.language = language
+        self.profile = profile
+        self.min_step = int(min_step_s * SAMPLE_RATE)
+        self.trim = int(trim_s * SAMPLE_RATE)
+        self.max_buffer = int(max_buffer_s * SAMPLE_RATE)
+
+        self.hypothesis = HypothesisBuffer()
+        self._audio = np.zeros(0, dtype=np.float32)
+        self._buffer_start = 0            # amostra absoluta do início da janela
+        self._new_frames = 0
+        self._received = 0
+        self._prompt = ""
+
+        self._reader: Optional[RingReader] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self.result: Optional[Dict[str, Any]] = None
+        self._decodes = 0
+        self._compute_s = 0.0
+        self._latencies: List[float] = []
+
+    # -----------------------------------------------------
+    # Entrada de áudio (uso direto, sem thread)
+    # -----------------------------------------------------
+    @property
+    def stream_s(self) -> float:
+        return (self._buffer_start + self._audio.shape[0]) / SAMPLE_RATE
+
+    def insert_audio(self, audio: np.ndarray) -> None:
+        self._audio = np.concatenate((self._audio, audio.astype(np.float32, copy=False)))
+        self._new_frames += audio.shape[0]
+        self._received += audio.shape[0]
+
+    def ready(self) -> bool:
+        return self._new_frames >= self.min_step
+
+    def process(self) -> List[Event]:
+        """Uma decodificação da janela atual; devolve os eventos gerados."""
+        self._new_frames = 0
+        if self._audio.shape[0] == 0:
+            return []
+
+        offset_s = self._buffer_start / SAMPLE_RATE
+        stream_s = self.stream_s
+        t0 = time.time()
+        segments, language, probability = transcribe_array(
+            self._audio,
+            offset_s=offset_s,
+            language=self.language,
+            profile=self.profile,
+            word_timestamps=True,
+            initial_prompt=self._prompt or None,
+        )
+        compute_s = time.time() - t0
+        self._decodes += 1
+        self._compute_s += compute_s
+
+        if self.language is None and probability >= PIN_LANGUAGE_PROBABILITY:
+            self.language = language
+            logger.info("Streaming | idioma fixado: %s (p=%.2f)", language, probability)
+
+        self.hypothesis.insert([w for seg in segments for w in seg.get("words", [])])
+        committed = self.hypothesis.commit()
+
+        # Latência: do fim da palavra mais antiga até a emissão (captura
+        # em tempo real: áudio recebido depois dela + decodificação)
+        events: List[Event] = []
+        if committed:
+            latency = stream_s - committed[0]["end"] + compute_s
+            self._latencies.append(latency)
+            events.append(self._event("final", committed, latency, compute_s))
+            self._remember(committed)
+            self._trim(committed)
+        self._bound(events, stream_s, compute_s)
+
+        unstable = self.hypothesis.unstable()
+        if unstable:
+            latency = stream_s - unstable[0]["end"] + compute_s
+            events.append(self._event("partial", unstable, latency, compute_s))
+
+        self._emit(events)
+        return events
+
+    def flush(self) -> List[Event]:
+        """Fim do stream: a hipótese pendente vira final sem confirmação."""
+        events: List[Event] = []
+        if self._new_frames:
+            self.process()
+        rest = self.hypothesis.unstable()
+        if rest:
+            events.append(self._event("final", rest, 0.0, 0.0, stable=False))
+            self._emit(events)
+        self.hypothesis.reset(self.stream_s)
+        return events
+
+    # -----------------------------------------------------
+    # Captura (mesma interface de core.live_transcriber)
+    # -----------------------------------------------------
+    def attach(self, ring: RingBuffer, name: str = "") -> None:
+        self._reader = ring.add_reader(lossy=True)
+        self._buffer_start = self._reader.position
+        self.hypothesis.reset(self._buffer_start / SAMPLE_RATE)
+        self._thread = threading.Thread(target=self._run, name="streaming-asr", daemon=True)
+        self._thread.start()
+        logger.info("Reconhecimento em streaming iniciado | %s", name or "-")
+
+    def finish(self) -> Dict[str, Any]:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if self._reader is not None:
+            self._drain()
+            self._reader.close()
+        self.flush()
+
+        self.result = self.metrics()
+        logger.info(
+            "Streaming concluido | audio=%.1fs | decodes=%d | compute/s=%.2f | latencia media=%.2fs | max=%.2fs",
+            self.result["audio_s"], self.result["decodes"],
+            self.result["compute_per_audio_s"], self.result["latency_avg_s"],
+            self.result["latency_max_s"],
+        )
+        return self.result
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._drain()
+            if not self.ready():
+                self._stop.wait(POLL_INTERVAL_S)
+                continue
+            try:
+                self.process()
+            except Exception:
+                logger.exception("Falha no reconhecimento em streaming | janela descartada")
+                self._restart(self.stream_s)
+
+    def _drain(self) -> None:
+        before = self._reader.skipped_frames
+        block = self._reader.read()
+        if self._reader.skipped_frames != before:
+            logger.warning(
+                "Streaming atrasado | %.1fs de audio pulados",
+                (self._reader.skipped_frames - before) / SAMPLE_RATE,
+            )
+            self._restart((self._reader.position - block.shape[0]) / SAMPLE_RATE)
+        if block.shape[0]:
+            self.insert_audio(block[:, 0])
+
+    # -----------------------------------------------------
+    # Janela
+    # -----------------------------------------------------
+    def _trim(self, committed: List[Word]) -> None:
+        """Corta a janela no fim da última frase confirmada."""
+        if self._audio.shape[0] < self.trim:
+            return
+        ends = [w["end"] for w in committed if w["word"].strip().endswith(SENTENCE_END)]
+        if ends:
+            self._cut(ends[-1])
+
+    def _bound(self, events: List[Event], stream_s: float, compute_s: float) -> None:
+        """Mantém a janela abaixo de max_buffer, com ou sem confirmação."""
+        if self._audio.shape[0] < self.max_buffer:
+            return
+        self._cut(self.hypothesis.committed_end)
+        if self._audio.shape[0] < self.max_buffer:
+            return
+
+        # Nada confirmado na janela: a hipótese instável vira final não
+        # confirmado e a janela recomeça depois dela
+        unstable = self.hypothesis.unstable()
+        keep_s = min(self.trim, self.max_buffer // 2) / SAMPLE_RATE
+        cut_s = stream_s - keep_s
+        if unstable:
+            latency = stream_s - unstable[0]["end"] + compute_s
+            events.append(self._event("final", unstable, latency, compute_s, stable=False))
+            self._remember(unstable)
+            cut_s = max(cut_s, unstable[-1]["end"])
+        logger.info("Streaming | janela sem acordo em %.1fs | recomecando", self._audio.shape[0] / SAMPLE_RATE)
+        self._cut(cut_s)
+        self.hypothesis.reset(cut_s)
+
+    def _cut(self, cut_s: float) -> None:
+        cut = int(cut_s * SAMPLE_RATE) - self._buffer_start
+        if cut > 0:
+            self._audio = self._audio[cut:].copy()
+            self._buffer_start += cut
+
+    def _restart(self, position_s: float) -> None:
+        self._audio = np.zeros(0, dtype=np.float32)
+        self._buffer_start = int(position_s * SAMPLE_RATE)
+        self._new_frames = 0
+        self.hypothesis.reset(position_s)
+
+    def _remember(self, words: List[Word]) -> None:
+        self._prompt = f"{self._prompt} {words_to_text(words)}".strip()[-PROMPT_CHARS:]
+
+    # -----------------------------------------------------
+    # Eventos e métricas
+    # -----------------------------------------------------
+    def _event(
+        self,
+        kind: str,
+        words: List[Word],
+        latency_s: float,
+        compute_s: float,
+        stable: bool = True,
+    ) -> Event:
+        return {
+            "type": kind,
+            "text": words_to_text(words),
+            "words": words,
+            "start": words[0]["start"],
+            "end": words[-1]["end"],
+            "stable": stable,
+            "stream_s": self.stream_s,
+            "latency_s": round(latency_s, 3),
+            "compute_s": round(compute_s, 3),
+        }
+
+    def _emit(self, events: List[Event]) -> None:
+        if self.on_event is None:
+            return
+        for event in events:
+            self.on_event(event)
+
+    def metrics(self) -> Dict[str, Any]:
+        audio_s = self._received / SAMPLE_RATE
+        latencies = self._latencies
+        return {
+            "audio_s": round(audio_s, 2),
+            "decodes": self._decodes,
+            "compute_s": round(self._compute_s, 2),
+            # > 1: a decodificação não acompanha a captura
+            "compute_per_audio_s": round(self._compute_s / audio_s, 3) if audio_s else 0.0,
+            "latency_avg_s": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "latency_max_s": round(max(latencies), 3) if latencies else 0.0,
+            "language": self.language,
+        }
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado reconhecedor em streaming (janela deslizante + local agreement)
+# - Limite max_buffer_s aplicado a cada passo (também sem confirmação)
@@ -0,0 +1,156 @@
+"""
+transcript_index.py
+
+Índice em memória de uma transcrição para navegação na interface.
+
+Responsabilidades:
+- Carregar os segmentos (start, end, text) do JSON da transcrição
+- Paginar por número de segmentos e localizar o segmento de um instante
+- Buscar palavras no texto (índice invertido token -> segmentos)
+- Converter o tempo de um segmento para o tempo do arquivo de áudio
+  (mapa .kept.json: gate de fala / pausas) para tocar o trecho
+
+Decisões:
+- O JSON continua sendo a fonte canônica (como em core.segment_store);
+  o índice é reconstruído ao carregar, sem arquivo extra
+- Tempos em arrays NumPy (searchsorted), texto em lista: uma transcrição
+  de várias horas tem poucos milhares de segmentos
+- Tokens normalizados como em core.stitcher (minúsculas, sem
+  pontuação); busca com todas as palavras (AND), a última como prefixo
+  para achar resultados enquanto se digita
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+
+from core.audio.speech_gate import load_kept_map, to_file_time
+from core.stitcher import normalize_token
+
+PAGE_SIZE = 50
+
+
+def format_timestamp(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def parse_timestamp(text: str) -> Optional[float]:
+    """"1:02:03", "02:03" ou "123" -> segundos; None se inválido."""
+    try:
+        parts = [float(p) for p in text.strip().split(":")]
+    except ValueError:
+        return None
+    if not parts or len(parts) > 3 or any(p < 0 for p in parts):
+        return None
+    seconds = 0.0
+    for part in parts:
+        seconds = seconds * 60 + part
+    return seconds
+
+
+class TranscriptIndex:
+    def __init__(self, segments: List[Dict[str, Any]], kept_map: Optional[Dict[str, Any]] = None) -> None:
+        ordered = sorted(segments, key=lambda seg: seg["start"])
+        self.starts = np.array([seg["start"] for seg in ordered], dtype=np.float64)
+        self.ends = np.array([seg["end"] for seg in ordered], dtype=np.float64)
+        self.texts: List[str] = [seg["text"].strip() for seg in ordered]
+        self.kept_map = kept_map
+
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        for i, text in enumerate(self.texts):
+            for token in text.split():
+                token = normalize_token(token)
+                if token:
+                    self._postings[token].add(i)
+        self._vocabulary = sorted(self._postings)
+
+    @classmethod
+    def load(cls, json_path: Path, audio_path: Optional[Path] = None) -> "TranscriptIndex":
+        result = json.loads(json_path.read_text(encoding="utf-8"))
+        kept_map = load_kept_map(audio_path) if audio_path is not None else None
+        return cls(result.get("segments", []), kept_map)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @property
+    def duration(self) -> float:
+        return float(self.ends.max()) if len(self) else 0.0
+
+    # -----------------------------------------------------
+    # Navegação
+    # -----------------------------------------------------
+    def segment(self, index: int) -> Dict[str, Any]:
+        return {
+            "index": index,
+            "start": float(self.starts[index]),
+            "end": float(self.ends[index]),
+            "text": self.texts[index],
+        }
+
+    def page_count(self, page_size: int = PAGE_SIZE) -> int:
+        return max(1, -(-len(self) // page_size))
+
+    def page(self, number: int, page_size: int = PAGE_SIZE) -> List[Dict[str, Any]]:
+        """Segmentos da página number (0-based)."""
+        first = number * page_size
+        return [self.segment(i) for i in range(first, min(first + page_size, len(self)))]
+
+    def locate(self, seconds: float) -> int:
+        """Índice do segmento em andamento (ou o anterior) no instante dado."""
+        if not len(self):
+            return 0
+        return max(int(np.searchsorted(self.starts, seconds, side="right")) - 1, 0)
+
+    def page_of(self, index: int, page_size: int = PAGE_SIZE) -> int:
+        return index // page_size
+
+    # -----------------------------------------------------
+    # Busca
+    # -----------------------------------------------------
+    def _matching(self, token: str, prefix: bool) -> Set[int]:
+        if not prefix:
+            return self._postings.get(token, set())
+        found: Set[int] = set()
+        i = bisect.bisect_left(self._vocabulary, token)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(token):
+            found |= self._postings[self._vocabulary[i]]
+            i += 1
+        return found
+
+    def search(self, query: str, limit: int = 100) -> List[int]:
+        """Índices dos segmentos com todas as palavras da busca, em ordem."""
+        tokens = [t for t in (normalize_token(w) for w in query.split()) if t]
+        if not tokens:
+            return []
+        hits: Optional[Set[int]] = None
+        for n, token in enumerate(tokens):
+            found = self._matching(token, prefix=n == len(tokens) - 1)
+            hits = found if hits is None else hits & found
+            if not hits:
+                return []
+        return sorted(hits)[:limit]
+
+    # -----------------------------------------------------
+    # Áudio
+    # -----------------------------------------------------
+    def file_span(self, index: int) -> tuple[float, float]:
+        """(início, fim) do segmento no arquivo de áudio."""
+        start, end = float(self.starts[index]), float(self.ends[index])
+        if self.kept_map is None:
+            return start, end
+        return to_file_time(start, self.kept_map), to_file_time(end, self.kept_map)
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado índice de transcrição (páginas, instante, busca, trecho de áudio)
@@ -0,0 +1,309 @@
+"""
+transcription_cache.py
+
+Cache de transcrições endereçado por conteúdo.
+
+Responsabilidades:
+- Calcular hash do PCM do áudio (não dos bytes do container)
+- Combinar o hash com os parâmetros de decodificação na chave
+- Persistir o resultado estruturado (dict) em disco, com as colunas
+  de palavras (core.segment_store) ao lado quando houver
+- Despejar entradas antigas quando o cache excede o tamanho máximo
+
+Decisões:
+- Hash sobre PCM float32 lido em blocos: o mesmo áudio reenviado com
+  outro nome ou metadados diferentes ainda acerta o cache
+- Hash do PCM memorizado por (caminho, tamanho, mtime): reexecuções
+  sobre o mesmo arquivo não releem o áudio
+- Despejo por mtime (tocado a cada acerto) = LRU aproximado; as
+  colunas saem junto com a entrada e contam no tamanho
+- Memos de hash (stat/) limitados por quantidade, também por mtime:
+  são minúsculos, mas um por arquivo/versão já visto; perder um custa
+  só recalcular o hash
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from core.segment_store import SIDECAR_SUFFIX, SegmentColumns
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("output") / "cache" / "transcriptions"
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+DEFAULT_MAX_MEMOS = 10_000
+CACHE_VERSION = 1
+
+_BLOCK_FRAMES = 1 << 16
+
+
+def _pcm_digest(audio_path: Path, pcm_dir: Optional[Path] = None) -> str:
+    """SHA-256 do PCM float32 (mono 16 kHz se for preciso decodificar)."""
+    digest = hashlib.sha256()
+    try:
+        import soundfile as sf
+
+        with sf.SoundFile(str(audio_path)) as f:
+            digest.update(f"{f.samplerate}:{f.channels}".encode())
+            for block in f.blocks(blocksize=_BLOCK_FRAMES, dtype="float32"):
+                digest.update(block.tobytes())
+        return digest.hexdigest()
+    except Exception:
+        # Formatos fora do libsndfile (m4a, alguns mp3): PCM decodificado
+        # em streaming, ou o do cache de ingestão; mesmos bytes float32
+        # do faster_whisper.decode_audio
+        import numpy as np
+
+        from core.audio.ingest import ingest, iter_pcm16, open_pcm
+
+        if pcm_dir is not None:
+            pcm = open_pcm(ingest(audio_path, pcm_dir))
+            blocks = (pcm[i:i + _BLOCK_FRAMES] for i in range(0, pcm.shape[0], _BLOCK_FRAMES))
+        else:
+            blocks = iter_pcm16(audio_path)
+
+        digest = hashlib.sha256(b"16000:1")
+        for block in blocks:
+            digest.update((block.astype(np.float32) / 32768.0).tobytes())
+        return digest.hexdigest()
+
+
+class TranscriptionCache:
+    def __init__(
+        self,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        pcm_dir: Optional[Path] = None,
+        max_memos: int = DEFAULT_MAX_MEMOS,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.pcm_dir = pcm_dir
+        self.max_memos = max_memos
+        self._stat_dir = cache_dir / "stat"
+        self._entries_dir = cache_dir / "entries"
+
+    # -----------------------------------------------------
+    # Chave
+    # -----------------------------------------------------
+    def audio_hash(self, audio_path: Path) -> str:
+        stat = audio_path.stat()
+        stat_key = hashlib.sha1(
+            f"{audio_path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}".encode()
+        ).hexdigest()
+        memo = self._stat_dir / f"{stat_key}.txt"
+
+        if memo.exists():
+            os.utime(memo)
+            return memo.read_text(encoding="utf-8").strip()
+
+        t0 = time.time()
+        pcm_hash = _pcm_digest(audio_path, self.pcm_dir)
+        logger.info("Hash PCM calculado | %s | %.2fs", audio_path.name, time.time() - t0)
+
+        memo.parent.mkdir(parents=True, exist_ok=True)
+        memo.write_text(pcm_hash, encoding="utf-8")
+        self._evict_memos()
+        return pcm_hash
+
+    def key_for(self, audio_path: Path, **params: Any) -> str:
+        payload = json.dumps(
+            {"v": CACHE_VERSION, "pcm": self.audio_hash(audio_path), **params},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    # -----------------------------------------------------
+    # Leitura / escrita
+    # -----------------------------------------------------
+    def _entry_path(self, key: str) -> Path:
+        return self._entries_dir / key[:2] / f"{key}.json"
+
+    def _columns_path(self, key: str) -> Path:
+        return self._entries_dir / key[:2] / f"{key}{SIDECAR_SUFFIX}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(key)
+        if not path.exists():
+            return None
+        try:
+            result = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            logger.warning("Entrada de cache corrompida | %s", path.name)
+            path.unlink(missing_ok=True)
+            return None
+
+        os.utime(path)
+        return result
+
+    def get_columns(self, key: str) -> Optional[SegmentColumns]:
+        """Colunas de palavras gravadas com a entrada (None se não houver)."""
+        path = self._columns_path(key)
+        if not path.exists():
+            return None
+        try:
+            return SegmentColumns.load(path)
+        except (OSError, ValueError, KeyError):
+            logger.warning("Colunas de cache corrompidas | %s", path.name)
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, result: Dict[str, Any], columns: Optional[SegmentColumns] = None) -> None:
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Colunas antes da entrada: um acerto nunca vê a entrada sem elas
+        if columns is not None:
+            columns_path = self._columns_path(key)
+            tmp = columns_path.with_suffix(".tmp")
+            columns.save(tmp)
+            os.replace(tmp, columns_path)
+
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for p in self._entries_dir.glob("*/*.json"):
+            columns = self._columns_path(p.stem)
+            size = p.stat().st_size + (columns.stat().st_size if columns.exists() else 0)
+            entries.append((p.stat().st_mtime, size, p))
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            path.unlink(missing_ok=True)
+            self._columns_path(path.stem).unlink(missing_ok=True)
+            total -= size
+            logger.info("Cache de transcricao: entrada removida | %s", path.name)
+            if total <= self.max_bytes:
+                break
+
+    def _evict_memos(self) -> None:
+        memos = list(self._stat_dir.glob("*.txt"))
+        if len(memos) <= self.max_memos:
+            return
+
+        memos.sort(key=lambda p: p.stat().st_mtime)
+        for path in memos[: len(memos) - self.max_memos]:
+            path.unlink(missing_ok=True)
+        logger.info("Cache de transcricao: %d memos de hash removidos", len(memos) - self.max_memos)
+
+
+# ---------------------------------------------------------
+# Atalho: whisper_transcribe com cache
+# ---------------------------------------------------------
+_cache: Optional[TranscriptionCache] = None
+
+
+def get_cache() -> TranscriptionCache:
+    global _cache
+    if _cache is None:
+        _cache = TranscriptionCache()
+    return _cache
+
+
+def decode_params(
+    model_name: str,
+    compute_type: str,
+    vad_filter: bool,
+    beam_size: int,
+    language: Optional[str],
+    profile: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Parâmetros que alteram o resultado e, portanto, entram na chave."""
+    params = {
+        "model": model_name,
+        "compute_type": compute_type,
+        "vad_filter": vad_filter,
+        "beam_size": beam_size,
+        "language": language,
+    }
+    if profile is not None:
+        from core.decode_profiles import decode_kwargs
+
+        # Perfil substitui modelo/VAD/busca; cpu_threads não altera o texto
+        params.update(
+            model=profile["model"],
+            compute_type=profile.get("compute_type", compute_type),
+            vad_filter=profile.get("vad_filter", vad_filter),
+            decode=decode_kwargs(profile),
+        )
+    return params
+
+
+def transcribe_cached(
+    audio_path: Path,
+    vad_filter: bool = True,
+    language: Optional[str] = None,
+    cache: Optional[TranscriptionCache] = None,
+    transcribe: Optional[Callable[[], Dict[str, Any]]] = None,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    whisper_transcribe com cache em disco. Aceita os mesmos argumentos;
+    o resultado de um acerto traz "cached": True.
+
+    session_type é resolvido em perfil antes da chave (tipos de sessão
+    com perfis diferentes não colidem). transcribe, se dado, produz o
+    resultado num erro de cache (ex: versão com progresso no terminal)
+    e deve usar os mesmos parâmetros.
+    """
+    from core.whisper_core import BEAM_SIZE, COMPUTE_TYPE, MODEL_NAME, whisper_transcribe
+
+    profile = kwargs.pop("profile", None)
+    session_type = kwargs.pop("session_type", None)
+    if profile is None and session_type:
+        from core.decode_profiles import resolve_profile
+
+        profile = resolve_profile(session_type=session_type)
+
+    cache = cache or get_cache()
+    key = cache.key_for(
+        audio_path,
+        **decode_params(
+            kwargs.get("model_name", MODEL_NAME),
+            kwargs.get("compute_type", COMPUTE_TYPE),
+            vad_filter,
+            BEAM_SIZE,
+            language,
+            profile,
+        ),
+    )
+
+    hit = cache.get(key)
+    if hit is not None:
+        logger.info("Cache de transcricao: acerto | %s", audio_path.name)
+        return {**hit, "cached": True}
+
+    if transcribe is not None:
+        result = transcribe()
+    else:
+        result = whisper_transcribe(
+            audio_path, vad_filter=vad_filter, language=language, profile=profile, **kwargs
+        )
+    cache.put(key, result)
+    return result
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado cache de transcrições por hash do PCM + parâmetros
+# - Perfil de decodificação entra na chave do cache
+# - Hash de m4a/mp3 em streaming ou a partir do cache de PCM (core.audio.ingest)
+# - Colunas de palavras guardadas com a entrada (sidecar refeito num acerto)
+# - transcribe_cached resolve o perfil antes da chave; usado pela CLI
+# - Memos de hash (stat/) com limite de quantidade (max_memos)
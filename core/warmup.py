@@ -0,0 +1,151 @@
+"""
+warmup.py
+
+Pré-carregamento (warm-up) do modelo Whisper em background.
+
+Responsabilidades:
+- Carregar o modelo no pool compartilhado sem bloquear UI/CLI
+- Opcionalmente executar uma decodificação curta (1 s de silêncio),
+  no idioma configurado ([transcription] default_language)
+- Expor o estado (idle / loading / ready / failed) para a interface
+
+Decisões:
+- Opt-in via [transcription.warmup] no config.toml
+- Idempotente: Streamlit reexecuta o script a cada interação e o
+  módulo (com o estado) sobrevive entre reruns
+- Falha não é retentada sozinha (cada rerun tentaria de novo o mesmo
+  load quebrado): nova tentativa só com retry=True ou outro modelo
+- O pool serializa loads: uma transcrição pedida durante o warm-up
+  espera o mesmo load em vez de carregar o modelo duas vezes
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from core.model_pool import get_model, get_pool
+from core.whisper_core import (
+    COMPUTE_TYPE,
+    CPU_THREADS,
+    DEVICE,
+    MODEL_NAME,
+    SAMPLE_RATE,
+)
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+_state: Dict[str, Any] = {
+    "status": "idle",
+    "model": None,
+    "seconds": None,
+    "error": None,
+}
+
+
+def load_warmup_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Lê [transcription.warmup] com defaults seguros (desligado)."""
+    transcription = config.get("transcription", {})
+    cfg = transcription.get("warmup", {})
+    return {
+        "enabled": bool(cfg.get("enabled", False)),
+        "dummy_decode": bool(cfg.get("dummy_decode", True)),
+        "language": transcription.get("default_language"),
+    }
+
+
+def _run(
+    model_name: str,
+    compute_type: str,
+    cpu_threads: int,
+    dummy_decode: bool,
+    language: Optional[str],
+) -> None:
+    t0 = time.time()
+    try:
+        model = get_model(
+            model_name,
+            device=DEVICE,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+        )
+        if dummy_decode:
+            silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+            segments, _info = model.transcribe(silence, beam_size=1, language=language)
+            list(segments)
+    except Exception as exc:
+        logger.exception("Warm-up falhou | model=%s", model_name)
+        with _lock:
+            _state.update(status="failed", error=f"{type(exc).__name__}: {exc}")
+        return
+
+    elapsed = time.time() - t0
+    with _lock:
+        _state.update(status="ready", seconds=elapsed, error=None)
+    logger.info("Warm-up concluído | model=%s | %.2fs", model_name, elapsed)
+
+
+def start_warmup(
+    model_name: str = MODEL_NAME,
+    compute_type: str = COMPUTE_TYPE,
+    cpu_threads: int = CPU_THREADS,
+    dummy_decode: bool = True,
+    retry: bool = False,
+    language: Optional[str] = None,
+) -> None:
+    """
+    Dispara o warm-up em uma thread daemon (no-op se já em andamento,
+    pronto, ou se falhou para o mesmo modelo e retry=False).
+    language: idioma da decodificação curta (None = autodetect).
+    """
+    global _thread
+
+    with _lock:
+        if _thread is not None and _thread.is_alive():
+            return
+        if _state["status"] == "failed" and _state["model"] == model_name and not retry:
+            return
+        if _state["status"] == "ready" and _state["model"] == model_name and is_ready(
+            model_name, compute_type, cpu_threads
+        ):
+            return
+
+        _state.update(status="loading", model=model_name, seconds=None, error=None)
+        _thread = threading.Thread(
+            target=_run,
+            args=(model_name, compute_type, cpu_threads, dummy_decode, language),
+            name="whisper-warmup",
+            daemon=True,
+        )
+        _thread.start()
+
+    logger.info("Warm-up iniciado | model=%s | dummy_decode=%s", model_name, dummy_decode)
+
+
+def is_ready(
+    model_name: str = MODEL_NAME,
+    compute_type: str = COMPUTE_TYPE,
+    cpu_threads: int = CPU_THREADS,
+) -> bool:
+    """True se o modelo já está carregado no pool (por warm-up ou uso)."""
+    return get_pool().is_loaded(model_name, DEVICE, compute_type, cpu_threads)
+
+
+def warmup_status() -> Dict[str, Any]:
+    with _lock:
+        return dict(_state)
+
+
+# ---------------------------------------------------------
+# CHANGELOG
+# ---------------------------------------------------------
+# 2026-10-18
+# - Criado warm-up opcional do modelo em background
+# - Falha só é retentada com retry=True (não a cada rerun)
+# - Decodificação curta no idioma configurado (não mais "pt" fixo)
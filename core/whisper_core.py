@@ -21,11 +21,22 @@ ReferÃªncias:
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Tuple
 
-from faster_whisper import WhisperModel
+import numpy as np
+
+from core.audio.ingest import load_audio
+from core.audio.silence import find_silence_cuts
+from core.decode_profiles import decode_kwargs, resolve_profile
+from core.model_pool import get_model
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
 
 logger = logging.getLogger(__name__)
 
@@ -36,35 +47,66 @@ logger = logging.getLogger(__name__)
 MODEL_NAME = "small"          # bom equilÃ­brio qualidade/velocidade
 DEVICE = "cpu"                # local, sem GPU
 COMPUTE_TYPE = "int8"         # rÃ¡pido e leve em CPU
+CPU_THREADS = 0               # 0 = default do CTranslate2
+BEAM_SIZE = 5
 
-# InstÃ¢ncia Ãºnica (lazy)
-_model: WhisperModel | None = None
+# Modo paralelo
+SAMPLE_RATE = 16000
+PARALLEL_CHUNK_S = 300.0      # alvo por chunk (5 min)
+PARALLEL_TOLERANCE_S = 15.0   # janela para procurar silencio
 
+# Lacunas do VAD menores que isso nao valem re-decodificacao
+GAP_MIN_S = 1.0
 
-def _get_model() -> WhisperModel:
-    global _model
-    if _model is None:
-        logger.info(
-            "Carregando faster-whisper | model=%s | device=%s | compute=%s",
-            MODEL_NAME, DEVICE, COMPUTE_TYPE
-        )
-        _model = WhisperModel(
-            MODEL_NAME,
-            device=DEVICE,
-            compute_type=COMPUTE_TYPE,
-        )
-    return _model
+
+def _decode_audio(audio_path: Path) -> np.ndarray:
+    # faster-whisper importado sob demanda (como em core.model_pool):
+    # quem so usa constantes/build_result nao carrega o backend
+    from faster_whisper import decode_audio
+
+    return decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE)
+
+
+def _get_model(
+    model_name: str = MODEL_NAME,
+    compute_type: str = COMPUTE_TYPE,
+    cpu_threads: int = CPU_THREADS,
+) -> WhisperModel:
+    # Instancias vivem no pool compartilhado (core.model_pool)
+    return get_model(
+        model_name,
+        device=DEVICE,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+    )
 
 
 # ---------------------------------------------------------
 # API pÃºblica
 # ---------------------------------------------------------
-def whisper_transcribe(audio_path: Path, vad_filter: bool = True) -> Dict[str, Any]:
+def whisper_transcribe(
+    audio_path: Path,
+    vad_filter: bool = True,
+    model_name: str = MODEL_NAME,
+    compute_type: str = COMPUTE_TYPE,
+    cpu_threads: int = CPU_THREADS,
+    language: Optional[str] = None,
+    workers: int = 1,
+    profile: Optional[Dict[str, Any]] = None,
+    session_type: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Executa transcriÃ§Ã£o do Ã¡udio usando faster-whisper.
 
     Args:
         audio_path: caminho para arquivo WAV (mono, 16kHz recomendado)
+        vad_filter: aplica VAD do faster-whisper
+        model_name / compute_type / cpu_threads: chave do modelo no pool
+        language: idioma fixo (ex: "pt"); None = autodetect
+        workers: >1 ativa modo paralelo (chunks em processos separados)
+        profile: perfil de decodificacao (core.decode_profiles); quando
+            presente, define modelo, threads, VAD e parametros de busca
+        session_type: resolve o perfil pelo tipo de sessao (config.toml)
 
     Returns:
         dict com:
@@ -75,44 +117,302 @@ def whisper_transcribe(audio_path: Path, vad_filter: bool = True) -> Dict[str, A
     """
 
     if not audio_path.exists():
-        raise FileNotFoundError(f"Ãudio nÃ£o encontrado: {audio_path}")
+        raise FileNotFoundError(f"Ãudio nÃ£o encontrado: {audio_path}")
 
-    model = _get_model()
+    if profile is None and session_type:
+        profile = resolve_profile(session_type=session_type)
+
+    if workers > 1:
+        return _transcribe_parallel(
+            audio_path,
+            vad_filter=vad_filter,
+            model_name=model_name,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            language=language,
+            workers=workers,
+            profile=profile,
+        )
 
-    logger.info("Iniciando transcriÃ§Ã£o | audio=%s", audio_path)
     t0 = time.time()
+    segments: List[Dict[str, Any]] = []
+    detected: Optional[str] = language
+    vad_dropped: Optional[List[Dict[str, float]]] = None
+    audio_s: Optional[float] = None
+
+    for event in whisper_transcribe_iter(
+        audio_path,
+        vad_filter=vad_filter,
+        model_name=model_name,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        language=language,
+        profile=profile,
+    ):
+        if event["segment"] is not None:
+            segments.append(event["segment"])
+        detected = event["language"]
+        vad_dropped = event["vad_dropped"]
+        audio_s = event["audio_s"]
+
+    return build_result(
+        segments,
+        detected,
+        time.time() - t0,
+        profile["model"] if profile else model_name,
+        vad_dropped=vad_dropped,
+        profile=profile,
+        audio_s=audio_s,
+    )
+
+
+def whisper_transcribe_iter(
+    audio_path: Path,
+    vad_filter: bool = True,
+    model_name: str = MODEL_NAME,
+    compute_type: str = COMPUTE_TYPE,
+    cpu_threads: int = CPU_THREADS,
+    language: Optional[str] = None,
+    word_timestamps: bool = False,
+    profile: Optional[Dict[str, Any]] = None,
+    pcm_dir: Optional[Path] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Versao incremental de whisper_transcribe: produz um evento por
+    segmento, assim que o faster-whisper o decodifica.
+
+    Com profile (core.decode_profiles), modelo, threads, VAD e parametros
+    de busca vem do perfil; ao final, o perfil e o RTF medido sao logados.
+
+    Com word_timestamps=True, cada segmento traz tambem avg_logprob,
+    no_speech_prob e words [{"start", "end", "word", "probability"}]
+    (ver core.segment_store para armazenamento compacto).
+
+    Com pcm_dir, o audio vem do cache de PCM (core.audio.ingest):
+    decodificado uma vez, reaproveitado em novas tentativas.
+
+    Cada evento e um dict com:
+      - segment: {"start", "end", "text"}; None no evento final
+      - done: True so no evento final (sempre emitido, mesmo sem
+        segmentos: idioma, duracao e vad_dropped nunca se perdem)
+      - language: idioma (detectado ou fixo)
+      - audio_s: duracao total do audio
+      - progress: fracao concluida (seg.end / audio_s), 0..1
+      - elapsed_s: tempo de execucao ate aqui
+      - rtf: real-time factor corrente (elapsed / audio processado)
+      - eta_s: estimativa de tempo restante (None no inicio)
+      - vad_dropped: regioes [{"start", "end"}] descartadas pelo VAD
+        (mesma lista em todos os eventos)
+    """
+
+    if not audio_path.exists():
+        raise FileNotFoundError(f"Ãudio nÃ£o encontrado: {audio_path}")
+
+    model_name, compute_type, cpu_threads, vad_filter, decode = _apply_profile(
+        profile, model_name, compute_type, cpu_threads, vad_filter
+    )
+    vad_parameters = decode.pop("vad_parameters", None)
+
+    logger.info(
+        "Iniciando transcriÃ§Ã£o | audio=%s | perfil=%s | model=%s",
+        audio_path, profile["name"] if profile else "-", model_name,
+    )
+    t0 = time.time()
+
+    # Com VAD, o Silero roda uma unica vez aqui (o faster-whisper nao
+    # expoe as regioes descartadas): a fala e concatenada como no
+    # vad_filter do faster-whisper, o modelo recebe so ela (vad_filter=False)
+    # e os timestamps voltam para o tempo do arquivo. O arquivo so e lido
+    # uma vez. Feito antes de pedir o modelo: sobrepoe com um warm-up.
+    audio: Any = str(audio_path)
+    vad_dropped: List[Dict[str, float]] = []
+    speech: List[Dict[str, int]] = []
+    if pcm_dir is not None:
+        audio = load_audio(audio_path, pcm_dir)
+    if vad_filter:
+        if pcm_dir is None:
+            audio = _decode_audio(audio_path)
+        speech = _speech_chunks(audio, vad_parameters)
+        vad_dropped = _vad_dropped_spans(speech, audio.shape[0])
+
+    model = _get_model(model_name, compute_type, cpu_threads)
 
     segments_iter, info = model.transcribe(
-        str(audio_path),
-        beam_size=5,
-        vad_filter=vad_filter,     # ajuda em ruÃ­do/silÃªncios
+        _speech_only(audio, speech) if vad_filter else audio,
+        vad_filter=False,
+        language=language,
+        word_timestamps=word_timestamps,
+        **decode,
     )
+    if speech:
+        segments_iter = _restore_timestamps(segments_iter, speech)
 
-    segments: List[Dict[str, Any]] = []
-    texts: List[str] = []
+    # info.duration e a duracao da fala quando o VAD filtrou aqui
+    audio_s = audio.shape[0] / SAMPLE_RATE if vad_filter else float(info.duration) or 0.0
 
     for seg in segments_iter:
-        seg_dict = {
-            "start": float(seg.start),
-            "end": float(seg.end),
-            "text": seg.text.strip(),
+        segment = _segment_to_dict(seg, detailed=word_timestamps)
+        elapsed = time.time() - t0
+        done_s = min(segment["end"], audio_s) if audio_s else segment["end"]
+        progress = done_s / audio_s if audio_s else 0.0
+
+        yield {
+            "segment": segment,
+            "done": False,
+            "language": info.language,
+            "audio_s": audio_s,
+            "progress": progress,
+            "elapsed_s": elapsed,
+            "rtf": elapsed / done_s if done_s > 0 else 0.0,
+            "eta_s": elapsed / progress - elapsed if progress > 0 else None,
+            "vad_dropped": vad_dropped,
         }
-        segments.append(seg_dict)
-        texts.append(seg_dict["text"])
 
-    duration_s = time.time() - t0
-    full_text = " ".join(texts).strip()
+    elapsed = time.time() - t0
+    logger.info(
+        "Perfil de decodificacao | perfil=%s | model=%s | beam=%s | audio=%.1fs | tempo=%.1fs | RTF=%.3f",
+        profile["name"] if profile else "-",
+        model_name,
+        decode.get("beam_size"),
+        audio_s,
+        elapsed,
+        elapsed / audio_s if audio_s else 0.0,
+    )
+
+    yield {
+        "segment": None,
+        "done": True,
+        "language": info.language,
+        "audio_s": audio_s,
+        "progress": 1.0,
+        "elapsed_s": elapsed,
+        "rtf": elapsed / audio_s if audio_s else 0.0,
+        "eta_s": 0.0,
+        "vad_dropped": vad_dropped,
+    }
+
+
+# ---------------------------------------------------------
+# Montagem do resultado
+# ---------------------------------------------------------
+def _apply_profile(
+    profile: Optional[Dict[str, Any]],
+    model_name: str,
+    compute_type: str,
+    cpu_threads: int,
+    vad_filter: bool,
+) -> Tuple[str, str, int, bool, Dict[str, Any]]:
+    """Perfil (se houver) sobrepoe modelo/threads/VAD; devolve os kwargs de busca."""
+    decode: Dict[str, Any] = {"beam_size": BEAM_SIZE}
+    if profile is not None:
+        model_name = profile["model"]
+        compute_type = profile.get("compute_type", compute_type)
+        cpu_threads = profile.get("cpu_threads", cpu_threads)
+        vad_filter = profile.get("vad_filter", vad_filter)
+        decode.update(decode_kwargs(profile))
+    if not vad_filter:
+        decode.pop("vad_parameters", None)
+    return model_name, compute_type, cpu_threads, vad_filter, decode
+
+
+def transcribe_array(
+    audio: np.ndarray,
+    offset_s: float = 0.0,
+    vad_filter: bool = True,
+    model_name: str = MODEL_NAME,
+    compute_type: str = COMPUTE_TYPE,
+    cpu_threads: int = CPU_THREADS,
+    language: Optional[str] = None,
+    profile: Optional[Dict[str, Any]] = None,
+    word_timestamps: bool = False,
+    initial_prompt: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str], float]:
+    """
+    Decodifica um trecho ja em memoria (float32 mono 16 kHz), por
+    exemplo uma regiao de fala capturada ao vivo.
+
+    initial_prompt: texto ja confirmado antes do trecho (contexto para
+    janelas deslizantes, ver core.streaming_recognizer).
+
+    Returns:
+        (segmentos com timestamps deslocados por offset_s, idioma,
+        probabilidade do idioma)
+    """
+    model_name, compute_type, cpu_threads, vad_filter, decode = _apply_profile(
+        profile, model_name, compute_type, cpu_threads, vad_filter
+    )
+
+    model = _get_model(model_name, compute_type, cpu_threads)
+    segments_iter, info = model.transcribe(
+        audio,
+        vad_filter=vad_filter,
+        language=language,
+        word_timestamps=word_timestamps,
+        initial_prompt=initial_prompt,
+        **decode,
+    )
+    segments = [
+        _segment_to_dict(seg, offset_s, detailed=word_timestamps)
+        for seg in segments_iter
+    ]
+    return segments, info.language, float(info.language_probability)
+
+
+def _segment_to_dict(
+    seg: Any,
+    offset_s: float = 0.0,
+    detailed: bool = False,
+) -> Dict[str, Any]:
+    item: Dict[str, Any] = {
+        "start": offset_s + float(seg.start),
+        "end": offset_s + float(seg.end),
+        "text": seg.text.strip(),
+    }
+    if detailed:
+        item["avg_logprob"] = float(seg.avg_logprob)
+        item["no_speech_prob"] = float(seg.no_speech_prob)
+        item["words"] = [
+            {
+                "start": offset_s + float(w.start),
+                "end": offset_s + float(w.end),
+                "word": w.word,
+                "probability": float(w.probability),
+            }
+            for w in (seg.words or [])
+        ]
+    return item
+
+
+def build_result(
+    segments: List[Dict[str, Any]],
+    language: Optional[str],
+    duration_s: float,
+    model_name: str,
+    vad_dropped: Optional[List[Dict[str, float]]] = None,
+    profile: Optional[Dict[str, Any]] = None,
+    audio_s: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Monta o dict canonico a partir de segmentos ja coletados."""
+    full_text = " ".join(seg["text"] for seg in segments).strip()
 
     result = {
         "text": full_text,
-        "language": info.language,
+        "language": language,
         "segments": segments,
         "duration_s": duration_s,
+        "model": model_name,
     }
+    if vad_dropped is not None:
+        result["vad_dropped"] = vad_dropped
+    if profile is not None:
+        result["profile"] = profile["name"]
+    if audio_s:
+        result["audio_s"] = audio_s
+        result["rtf"] = round(duration_s / audio_s, 3)
 
     logger.info(
-        "TranscriÃ§Ã£o concluÃ­da | idioma=%s | segmentos=%d | chars=%d | tempo=%.2fs",
-        info.language,
+        "Transcricao concluida | idioma=%s | segmentos=%d | chars=%d | tempo=%.2fs",
+        language,
         len(segments),
         len(full_text),
         duration_s,
@@ -121,6 +421,273 @@ def whisper_transcribe(audio_path: Path, vad_filter: bool = True) -> Dict[str, A
     return result
 
 
+# ---------------------------------------------------------
+# Regioes descartadas pelo VAD / re-decodificacao de lacunas
+# ---------------------------------------------------------
+def _complement_spans(
+    kept: List[Dict[str, float]],
+    total_s: float,
+    min_gap_s: float,
+) -> List[Dict[str, float]]:
+    """Intervalos de [0, total_s] nao cobertos por `kept` (ordenado)."""
+    gaps: List[Dict[str, float]] = []
+    cursor = 0.0
+    for span in kept:
+        if span["start"] - cursor >= min_gap_s:
+            gaps.append({"start": round(cursor, 3), "end": round(span["start"], 3)})
+        cursor = max(cursor, span["end"])
+    if total_s - cursor >= min_gap_s:
+        gaps.append({"start": round(cursor, 3), "end": round(total_s, 3)})
+    return gaps
+
+
+def _speech_chunks(
+    audio: np.ndarray,
+    vad_parameters: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, int]]:
+    """Regioes de fala (em amostras), como o vad_filter do faster-whisper."""
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    return get_speech_timestamps(audio, VadOptions(**(vad_parameters or {})))
+
+
+def _speech_only(audio: np.ndarray, speech: List[Dict[str, int]]) -> np.ndarray:
+    from faster_whisper.vad import collect_chunks
+
+    chunks, _metadata = collect_chunks(audio, speech)
+    return np.concatenate(chunks, axis=0)
+
+
+def _restore_timestamps(segments: Iterator[Any], speech: List[Dict[str, int]]) -> Iterator[Any]:
+    # Tempo da fala concatenada -> tempo do arquivo (segmentos e palavras)
+    from faster_whisper.transcribe import restore_speech_timestamps
+
+    return restore_speech_timestamps(segments, speech, SAMPLE_RATE)
+
+
+def _vad_dropped_spans(speech: List[Dict[str, int]], frames: int) -> List[Dict[str, float]]:
+    kept = [
+        {"start": chunk["start"] / SAMPLE_RATE, "end": chunk["end"] / SAMPLE_RATE}
+        for chunk in speech
+    ]
+    return _complement_spans(kept, frames / SAMPLE_RATE, GAP_MIN_S)
+
+
+def redecode_gaps(
+    audio_path: Path,
+    result: Dict[str, Any],
+    model_name: str = MODEL_NAME,
+    compute_type: str = COMPUTE_TYPE,
+    cpu_threads: int = CPU_THREADS,
+    min_gap_s: float = GAP_MIN_S,
+    pcm_dir: Optional[Path] = None,
+    profile: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Re-decodifica, sem VAD, apenas as regioes que a primeira passada
+    descartou e mescla os segmentos recuperados por timestamp.
+
+    Com profile, usa o mesmo modelo e parametros de busca da primeira
+    passada (o VAD do perfil e ignorado).
+
+    Usa result["vad_dropped"]; se ausente (ex: modo paralelo), considera
+    lacunas os trechos nao cobertos por nenhum segmento.
+
+    O custo e proporcional ao audio descartado, nao a duracao total.
+    Com pcm_dir, le o PCM ja decodificado (core.audio.ingest).
+    """
+    audio: Any = str(audio_path)
+    if pcm_dir is not None:
+        audio = load_audio(audio_path, pcm_dir)
+
+    gaps = result.get("vad_dropped")
+    if gaps is None:
+        if pcm_dir is None:
+            audio = _decode_audio(audio_path)
+        audio_s = audio.shape[0] / SAMPLE_RATE
+        gaps = _complement_spans(result.get("segments", []), audio_s, min_gap_s)
+    gaps = [g for g in gaps if g["end"] - g["start"] >= min_gap_s]
+
+    if not gaps:
+        logger.info("Re-decodificacao: nenhuma lacuna | audio=%s", audio_path)
+        return result
+
+    gap_s = sum(g["end"] - g["start"] for g in gaps)
+    logger.info(
+        "Re-decodificando lacunas | audio=%s | lacunas=%d | %.1fs",
+        audio_path, len(gaps), gap_s,
+    )
+
+    model_name, compute_type, cpu_threads, _vad, decode = _apply_profile(
+        profile, model_name, compute_type, cpu_threads, False
+    )
+    model = _get_model(model_name, compute_type, cpu_threads)
+    t0 = time.time()
+
+    # clip_timestamps: uma unica chamada decodifica todas as lacunas,
+    # com timestamps ja na linha do tempo original
+    clips: List[float] = []
+    for g in gaps:
+        clips.extend([g["start"], g["end"]])
+
+    segments_iter, _info = model.transcribe(
+        audio,
+        vad_filter=False,
+        language=result.get("language"),
+        clip_timestamps=clips,
+        **decode,
+    )
+    recovered = [
+        seg for seg in (_segment_to_dict(s) for s in segments_iter) if seg["text"]
+    ]
+
+    merged = sorted(result.get("segments", []) + recovered, key=lambda seg: seg["start"])
+    elapsed = time.time() - t0
+
+    logger.info(
+        "Lacunas re-decodificadas | recuperados=%d | %.2fs",
+        len(recovered), elapsed,
+    )
+
+    # Perfil, regioes do VAD e audio_s (RTF) da primeira passada
+    if profile is None and result.get("profile"):
+        profile = {"name": result["profile"]}
+    new_result = build_result(
+        merged,
+        result.get("language"),
+        result.get("duration_s", 0.0) + elapsed,
+        result.get("model", model_name),
+        vad_dropped=result.get("vad_dropped"),
+        profile=profile,
+        audio_s=result.get("audio_s"),
+    )
+    new_result["gaps_redecoded"] = gaps
+    new_result["recovered_segments"] = len(recovered)
+    return new_result
+
+
+# ---------------------------------------------------------
+# Modo paralelo (arquivos longos)
+# ---------------------------------------------------------
+def _transcribe_piece(
+    index: int,
+    offset_s: float,
+    audio: np.ndarray,
+    options: Dict[str, Any],
+) -> Tuple[int, Optional[str], float, List[Dict[str, Any]]]:
+    """Executado no processo worker: cada processo tem seu proprio pool."""
+    model = _get_model(
+        options["model_name"],
+        options["compute_type"],
+        options["cpu_threads"],
+    )
+    t0 = time.time()
+    segments_iter, info = model.transcribe(
+        audio,
+        vad_filter=options["vad_filter"],
+        language=options["language"],
+        **options["decode"],
+    )
+    segments = [_segment_to_dict(seg, offset_s) for seg in segments_iter]
+    logger.info(
+        "Chunk %d processado | offset=%.1fs | %.2fs",
+        index, offset_s, time.time() - t0,
+    )
+    return index, info.language, audio.shape[0] / SAMPLE_RATE, segments
+
+
+def _transcribe_parallel(
+    audio_path: Path,
+    vad_filter: bool,
+    model_name: str,
+    compute_type: str,
+    cpu_threads: int,
+    language: Optional[str],
+    workers: int,
+    profile: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    model_name, compute_type, cpu_threads, vad_filter, decode = _apply_profile(
+        profile, model_name, compute_type, cpu_threads, vad_filter
+    )
+
+    t0 = time.time()
+    audio = _decode_audio(audio_path)
+
+    cuts = find_silence_cuts(
+        audio,
+        SAMPLE_RATE,
+        target_s=PARALLEL_CHUNK_S,
+        tolerance_s=PARALLEL_TOLERANCE_S,
+    )
+    bounds = list(zip([0] + cuts, cuts + [audio.shape[0]]))
+
+    if len(bounds) == 1:
+        logger.info("Audio curto para modo paralelo | seguindo sequencial")
+        return whisper_transcribe(
+            audio_path,
+            vad_filter=vad_filter,
+            model_name=model_name,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            language=language,
+            profile=profile,
+        )
+
+    workers = min(workers, len(bounds))
+    threads = cpu_threads or max(1, (os.cpu_count() or 1) // workers)
+    options = {
+        "model_name": model_name,
+        "compute_type": compute_type,
+        "cpu_threads": threads,
+        "vad_filter": vad_filter,
+        "language": language,
+        "decode": decode,
+    }
+
+    logger.info(
+        "Iniciando transcricao paralela | audio=%s | %.0fs | chunks=%d | workers=%d | threads=%d",
+        audio_path, audio.shape[0] / SAMPLE_RATE, len(bounds), workers, threads,
+    )
+
+    pieces: Dict[int, List[Dict[str, Any]]] = {}
+    language_votes: Dict[str, float] = {}
+
+    # spawn: mesmo comportamento em Windows e Linux, sem herdar threads
+    # do CTranslate2 do processo pai
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+        futures = [
+            executor.submit(
+                _transcribe_piece,
+                index,
+                start / SAMPLE_RATE,
+                audio[start:end],
+                options,
+            )
+            for index, (start, end) in enumerate(bounds)
+        ]
+        for future in as_completed(futures):
+            index, piece_language, piece_seconds, segments = future.result()
+            pieces[index] = segments
+            if piece_language:
+                language_votes[piece_language] = (
+                    language_votes.get(piece_language, 0.0) + piece_seconds
+                )
+            logger.info("Progresso paralelo | %d/%d chunks", len(pieces), len(bounds))
+
+    segments = [seg for index in sorted(pieces) for seg in pieces[index]]
+    detected = language or max(language_votes, key=language_votes.get, default=None)
+
+    return build_result(
+        segments,
+        detected,
+        time.time() - t0,
+        model_name,
+        profile=profile,
+        audio_s=audio.shape[0] / SAMPLE_RATE,
+    )
+
+
 # ---------------------------------------------------------
 # CHANGELOG
 # ---------------------------------------------------------
@@ -129,4 +696,22 @@ def whisper_transcribe(audio_path: Path, vad_filter: bool = True) -> Dict[str, A
 # - Modelo default: small (CPU, int8)
 # - Retorno estruturado (dict) mantido
 # - Logs de idioma, tempo e tamanho
-
+#
+# 2026-10-18
+# - Modelo obtido do pool compartilhado (core.model_pool)
+# - whisper_transcribe aceita model_name / compute_type / cpu_threads
+# - Modo paralelo (workers>1): cortes em silencio + ProcessPoolExecutor
+# - Parametro language (idioma fixo)
+# - whisper_transcribe_iter: segmentos incrementais com progresso/RTF/ETA
+# - Registro das regioes descartadas pelo VAD (vad_dropped)
+# - redecode_gaps: re-decodifica apenas as lacunas e mescla por timestamp
+# - word_timestamps no iterador (palavras, avg_logprob, no_speech_prob)
+# - Perfis de decodificacao (profile / session_type) com log de RTF
+# - transcribe_array: decodificacao de trecho em memoria (transcricao ao vivo)
+# - transcribe_array: word_timestamps e initial_prompt (reconhecimento em streaming)
+# - pcm_dir: iterador e redecode_gaps leem o cache de PCM (core.audio.ingest)
+# - faster-whisper importado sob demanda (importar o modulo nao carrega o backend)
+# - redecode_gaps aceita profile (mesmo modelo/busca da primeira passada)
+# - Iterador: VAD executado uma vez (fala concatenada + timestamps restaurados)
+# - Iterador: evento final (done=True) com idioma/duracao mesmo sem segmentos
+# - redecode_gaps preserva perfil, vad_dropped e audio_s (RTF) da primeira passada
@@ -0,0 +1,81 @@
+import io
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from core.audio.ingest import cached_entry, copy_upload, ingest, load_audio, open_pcm
+
+
+def test_copy_upload_in_chunks():
+    with tempfile.TemporaryDirectory() as tmp:
+        data = np.random.default_rng(0).bytes(3 * 1024 + 17)
+        upload = io.BytesIO(data)
+        upload.read(10)   # posição do cursor não importa
+
+        dest = copy_upload(upload, Path(tmp) / "up" / "a.m4a", chunk_bytes=1024)
+        assert dest.read_bytes() == data
+        assert not list(dest.parent.glob("*.tmp"))
+
+
+def test_ingest_decodes_once_and_reports_duration():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        rng = np.random.default_rng(1)
+        samples = (rng.standard_normal(16000 * 3 + 123) * 3000).astype(np.int16)
+        audio = tmp / "a.flac"
+        sf.write(str(audio), samples, 16000, subtype="PCM_16")
+
+        pcm_dir = tmp / "pcm"
+        assert cached_entry(audio, pcm_dir) is None
+
+        entry = ingest(audio, pcm_dir)
+        assert entry["frames"] == samples.shape[0]
+        assert abs(entry["duration_s"] - samples.shape[0] / 16000) < 1e-9
+        assert np.array_equal(open_pcm(entry), samples)
+
+        # Segunda chamada: acerto no cache, sem nova decodificação
+        inode = Path(entry["pcm"]).stat().st_ino
+        again = ingest(audio, pcm_dir)
+        assert again["pcm"] == entry["pcm"]
+        assert Path(again["pcm"]).stat().st_ino == inode
+
+        audio_f32 = load_audio(audio, pcm_dir)
+        assert audio_f32.dtype == np.float32
+        assert np.allclose(audio_f32, samples / 32768.0)
+
+
+def test_concurrent_ingest_of_same_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        samples = (np.random.default_rng(2).standard_normal(16000 * 2) * 3000).astype(np.int16)
+        audio = tmp / "a.flac"
+        sf.write(str(audio), samples, 16000, subtype="PCM_16")
+
+        pcm_dir = tmp / "pcm"
+        entries, errors = [], []
+
+        def worker():
+            try:
+                entries.append(ingest(audio, pcm_dir))
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors and len(entries) == 4
+        assert np.array_equal(open_pcm(cached_entry(audio, pcm_dir)), samples)
+        assert not list(pcm_dir.glob("*.tmp"))
+
+
+if __name__ == "__main__":
+    test_copy_upload_in_chunks()
+    test_ingest_decodes_once_and_reports_duration()
+    test_concurrent_ingest_of_same_file()
+    print("OK — audio_ingest")
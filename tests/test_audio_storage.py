@@ -0,0 +1,56 @@
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from core.audio import storage
+from core.audio.stream_writer import StreamingWavWriter, apply_gain
+
+
+def test_flac_capture_round_trip():
+    rng = np.random.default_rng(0)
+    audio = (rng.standard_normal(16000 * 2) * 0.01).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        part = Path(tmp) / "rec.part.flac"
+        writer = StreamingWavWriter(
+            part, 16000, subtype=storage.capture_subtype("flac"), format="FLAC"
+        ).start()
+        for block in np.split(audio, 20):
+            writer.push(block.reshape(-1, 1))
+        stats = writer.close()
+
+        final = apply_gain(part, Path(tmp) / "rec.flac", 0.9 / stats["peak"], format="FLAC", dither=True)
+        assert storage.audio_duration(final) == 2.0
+
+        pcm = storage.read_pcm16(final)
+        copy = Path(tmp) / "audio_0001.flac"
+        storage.write_pcm16(pcm, 16000, copy)
+        assert storage.read_pcm16(copy) == pcm
+        assert storage.find_audio(Path(tmp), "audio_*") == [copy]
+
+
+def test_dither_stays_within_one_lsb():
+    block = np.zeros(10000, dtype=np.float32)
+    dithered = storage.tpdf_dither(block, np.random.default_rng(1))
+    assert np.max(np.abs(dithered)) <= 1 / 32768
+    assert np.std(dithered) > 0
+
+
+def test_rejects_unknown_format():
+    cfg = storage.load_storage_config({})
+    assert (cfg["format"], cfg["dither"]) == ("wav", True)
+    assert cfg["speech_gate"]["enabled"] is False
+    try:
+        storage.load_storage_config({"recording": {"format": "mp3"}})
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("formato invalido aceito")
+
+
+if __name__ == "__main__":
+    test_flac_capture_round_trip()
+    test_dither_stays_within_one_lsb()
+    test_rejects_unknown_format()
+    print("OK — audio_storage")
@@ -0,0 +1,81 @@
+import json
+import tempfile
+from pathlib import Path
+
+import core.batch_transcribe as batch
+from core.batch_transcribe import collect_audio_files, load_manifest, plan_outputs, run_batch
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+    return path
+
+
+def test_collect_and_plan_outputs_without_collisions():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "in"
+        _touch(root / "a.wav")
+        _touch(root / "a.mp3")
+        _touch(root / "b.flac")
+        _touch(root / "notas.txt")
+        _touch(root / "sub" / "a.wav")
+
+        # --dir não é recursivo; extensões fora da lista ficam de fora
+        files = collect_audio_files(directory=root)
+        assert [p.name for p in files] == ["a.mp3", "a.wav", "b.flac"]
+
+        files.append(root / "sub" / "a.wav")
+        out = Path(tmp) / "out"
+        outputs = plan_outputs(files, out, root)
+        assert {p.relative_to(root).as_posix(): o.relative_to(out).as_posix() for p, o in outputs.items()} == {
+            "a.mp3": "a.mp3.txt",
+            "a.wav": "a.wav.txt",
+            "b.flac": "b.txt",
+            "sub/a.wav": "sub/a.txt",
+        }
+        assert len(set(outputs.values())) == len(files)
+
+
+def test_manifest_resume_skips_only_done_outputs():
+    calls = []
+
+    def fake_transcribe(audio_path, **_options):
+        calls.append(audio_path.name)
+        if audio_path.name == "ruim.wav":
+            raise RuntimeError("falhou de proposito")
+        return {"text": f"texto de {audio_path.name}", "segments": [], "language": "pt"}
+
+    original = batch.whisper_transcribe
+    batch.whisper_transcribe = fake_transcribe
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "in"
+            files = [_touch(root / n) for n in ("a.wav", "a.mp3", "ruim.wav")]
+            out = Path(tmp) / "out"
+
+            summary = run_batch(files, out, root=root)
+            assert (summary["done"], summary["failed"], summary["skipped"]) == (2, 1, 0)
+            assert (out / "a.wav.txt").read_text(encoding="utf-8") == "texto de a.wav"
+            assert (out / "a.mp3.txt").read_text(encoding="utf-8") == "texto de a.mp3"
+
+            records = load_manifest(out / batch.MANIFEST_NAME)
+            assert set(records) == {str((out / n).resolve()) for n in ("a.wav.txt", "a.mp3.txt", "ruim.txt")}
+
+            # Reinício: só o que falhou ou perdeu a saída volta a rodar
+            calls.clear()
+            (out / "a.mp3.txt").unlink()
+            summary = run_batch(files, out, root=root)
+            assert sorted(calls) == ["a.mp3", "ruim.wav"]
+            assert summary["skipped"] == 1
+
+            lines = (out / batch.MANIFEST_NAME).read_text(encoding="utf-8").splitlines()
+            assert len(lines) == 5 and json.loads(lines[-1])["status"] in ("done", "failed")
+    finally:
+        batch.whisper_transcribe = original
+
+
+if __name__ == "__main__":
+    test_collect_and_plan_outputs_without_collisions()
+    test_manifest_resume_skips_only_done_outputs()
+    print("OK — batch_transcribe")
@@ -0,0 +1,43 @@
+from core.decode_profiles import decode_kwargs, resolve_profile
+
+CONFIG = {
+    "transcription": {
+        "target": "high_quality",
+        "whisper": {"logprob_threshold": -1.0, "temperature": 0.0},
+    },
+    "decode_profiles": {
+        "fast": {"temperature": [0.0, 0.5]},
+        "session_types": {"daily": "fast"},
+    },
+    "profiles": {"daily": {"whisper": {"no_speech_threshold": 0.2}}},
+}
+
+
+def test_session_type_resolves_profile_with_overrides():
+    profile = resolve_profile(session_type="daily", config=CONFIG)
+    assert profile["name"] == "fast"
+    assert profile["temperature"] == [0.0, 0.5]
+    assert profile["no_speech_threshold"] == 0.2
+
+    kwargs = decode_kwargs(profile)
+    assert kwargs["log_prob_threshold"] == -1.0
+    assert "logprob_threshold" not in kwargs
+    assert "model" not in kwargs
+
+
+def test_default_target_alias_and_unknown_name():
+    assert resolve_profile(config=CONFIG)["name"] == "accurate"
+    assert resolve_profile("inexistente", config=CONFIG)["name"] == "balanced"
+
+
+def test_global_whisper_keys_do_not_override_builtin():
+    # temperature global (0.0) não apaga o fallback do perfil embutido
+    assert resolve_profile("accurate", config=CONFIG)["temperature"] == [0.0, 0.2, 0.4, 0.6, 0.8, 1.0]
+    assert resolve_profile("balanced", config=CONFIG)["temperature"] == 0.0
+
+
+if __name__ == "__main__":
+    test_session_type_resolves_profile_with_overrides()
+    test_default_target_alias_and_unknown_name()
+    test_global_whisper_keys_do_not_override_builtin()
+    print("OK — perfis de decodificação")
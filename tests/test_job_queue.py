@@ -0,0 +1,78 @@
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from core.job_queue import DONE, FAILED, JobQueue
+
+
+def _echo(params, progress):
+    progress(0.5, "metade")
+    return {"echo": params["value"]}
+
+
+def _boom(params, progress):
+    raise ValueError("falhou de proposito")
+
+
+def _wait(queue, job_id, timeout_s=5.0):
+    deadline = time.time() + timeout_s
+    while time.time() < deadline:
+        job = queue.get(job_id)
+        if job["status"] in (DONE, FAILED):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"tarefa nao terminou: {job_id}")
+
+
+def test_jobs_run_in_background_and_persist_state():
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs_dir = Path(tmp)
+        queue = JobQueue(jobs_dir, {"echo": _echo, "boom": _boom})
+
+        ok = queue.submit("echo", {"value": 42}, label="eco")
+        bad = queue.submit("boom", {})
+
+        job = _wait(queue, ok)
+        assert job["status"] == DONE
+        assert job["result"] == {"echo": 42}
+        assert job["progress"] == 1.0
+
+        job = _wait(queue, bad)
+        assert job["status"] == FAILED
+        assert "ValueError" in job["error"]
+
+        saved = json.loads((jobs_dir / f"{ok}.json").read_text(encoding="utf-8"))
+        assert saved["status"] == DONE and saved["label"] == "eco"
+        assert not queue.active()
+
+
+def test_unfinished_jobs_are_requeued_on_restart():
+    with tempfile.TemporaryDirectory() as tmp:
+        jobs_dir = Path(tmp)
+        state = {
+            "id": "20261018-120000-abcdef",
+            "kind": "echo",
+            "label": "eco",
+            "params": {"value": 7},
+            "status": "running",
+            "progress": 0.4,
+            "message": "",
+            "created_at": None,
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None,
+        }
+        (jobs_dir / f"{state['id']}.json").write_text(json.dumps(state), encoding="utf-8")
+
+        queue = JobQueue(jobs_dir, {"echo": _echo})
+        job = _wait(queue, state["id"])
+        assert job["status"] == DONE
+        assert job["result"] == {"echo": 7}
+
+
+if __name__ == "__main__":
+    test_jobs_run_in_background_and_persist_state()
+    test_unfinished_jobs_are_requeued_on_restart()
+    print("OK — job_queue")
@@ -0,0 +1,31 @@
+import tempfile
+from pathlib import Path
+
+from core.language_session import SessionLanguage
+
+
+def test_pins_on_confident_chunk_and_persists():
+    with tempfile.TemporaryDirectory() as tmp:
+        session = SessionLanguage(Path(tmp))
+        session.observe("es", 0.55)
+        assert session.language is None
+        session.observe("pt", 0.93)
+        assert session.language == "pt"
+
+        # nova instância (ex: após reinício) reaproveita o idioma salvo
+        assert SessionLanguage(Path(tmp)).language == "pt"
+
+
+def test_majority_after_max_chunks():
+    with tempfile.TemporaryDirectory() as tmp:
+        session = SessionLanguage(Path(tmp), max_chunks=3)
+        for lang, prob in [("pt", 0.6), ("es", 0.7), ("pt", 0.6)]:
+            session.observe(lang, prob)
+        assert session.language == "pt"
+        assert session.source == "majority"
+
+
+if __name__ == "__main__":
+    test_pins_on_confident_chunk_and_persists()
+    test_majority_after_max_chunks()
+    print("OK — idioma da sessão")
@@ -0,0 +1,52 @@
+from core.model_pool import ModelPool
+
+
+def fake_loader(key, _download_root):
+    return object()
+
+
+def test_hit_reuses_instance():
+    pool = ModelPool(loader=fake_loader, idle_timeout_s=None)
+    first = pool.get("small")
+    second = pool.get("small")
+    assert first is second
+    assert pool.stats()["loads"] == 1
+    assert pool.stats()["hits"] == 1
+
+
+def test_num_workers_is_part_of_key():
+    keys = []
+    pool = ModelPool(loader=lambda key, _root: keys.append(key) or object(), idle_timeout_s=None)
+    single = pool.get("small")
+    parallel = pool.get("small", num_workers=2)
+    assert single is not parallel
+    assert [key.num_workers for key in keys] == [1, 2]
+    assert pool.is_loaded("small", num_workers=2)
+
+    # Sem num_workers explícito: padrão do pool (ex: workers da fila de tarefas)
+    pool.num_workers = 2
+    assert pool.get("small") is parallel
+
+
+def test_lru_eviction_respects_budget():
+    # small/int8 ~ 242 MB, base/int8 ~ 72 MB
+    pool = ModelPool(memory_budget_mb=300, loader=fake_loader, idle_timeout_s=None)
+    pool.get("small")
+    pool.get("base")
+    assert pool.stats()["loaded"] == ["base"]
+    assert pool.stats()["evictions"] == 1
+
+
+def test_idle_eviction():
+    pool = ModelPool(loader=fake_loader, idle_timeout_s=1e-9)
+    pool.get("tiny")
+    assert pool.evict_idle() == 1
+    assert not pool.is_loaded("tiny")
+
+
+if __name__ == "__main__":
+    test_hit_reuses_instance()
+    test_num_workers_is_part_of_key()
+    test_lru_eviction_respects_budget()
+    test_idle_eviction()
+    print("OK — pool de modelos")
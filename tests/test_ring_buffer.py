@@ -0,0 +1,117 @@
+import tempfile
+from pathlib import Path
+
+import faster_whisper.vad as vad
+import numpy as np
+
+import core.live_transcriber as live
+from core.audio.ring_buffer import RingBuffer
+from core.live_transcriber import LiveTranscriber
+
+
+def test_wraparound_and_independent_readers():
+    ring = RingBuffer(10)
+    writer, meter = ring.add_reader(), ring.add_reader()
+
+    assert ring.write(np.arange(6, dtype=np.float32))
+    assert writer.read().ravel().tolist() == [0, 1, 2, 3, 4, 5]
+
+    # meter ainda não leu: só há 4 frames livres
+    assert not ring.write(np.arange(6, 12, dtype=np.float32))
+    assert ring.overruns == 1 and ring.dropped_frames == 6
+
+    assert meter.read(4).ravel().tolist() == [0, 1, 2, 3]
+    meter.read()
+    assert ring.write(np.arange(6, 14, dtype=np.float32))  # atravessa o fim
+    assert writer.read().ravel().tolist() == list(range(6, 14))
+    assert ring.peek_latest(3).ravel().tolist() == [11, 12, 13]
+    assert ring.stats()["high_watermark_frames"] == 8
+
+
+def test_lossy_reader_skips_oldest_and_never_blocks_writer():
+    ring = RingBuffer(10)
+    lossy = ring.add_reader(lossy=True)
+
+    assert ring.write(np.arange(8, dtype=np.float32))
+    assert ring.write(np.arange(8, 16, dtype=np.float32))   # leitor lossy não segura
+    assert ring.overruns == 0
+
+    # 16 disponíveis, folga de 10%: pula os 7 mais antigos
+    assert lossy.read().ravel().tolist() == list(range(7, 16))
+    assert lossy.skipped_frames == 7 and lossy.position == 16
+    assert lossy.read().shape[0] == 0
+
+
+def _transcriber(tmp, ring):
+    # Regiões de 1-4 s, silêncio de fechamento 0,5 s; sem thread
+    transcriber = LiveTranscriber(Path(tmp), min_region_s=1.0, max_region_s=4.0, min_silence_s=0.5)
+    transcriber._reader = ring.add_reader(lossy=True)
+    transcriber.output_path = Path(tmp) / "rec.live.jsonl"
+    return transcriber
+
+
+def test_live_transcriber_cuts_regions():
+    sr = 16000
+    speech = []
+    original = vad.get_speech_timestamps
+    vad.get_speech_timestamps = lambda audio, _options: list(speech)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            ring = RingBuffer(sr * 10)
+            transcriber = _transcriber(tmp, ring)
+
+            ring.write(np.zeros(sr // 2, dtype=np.float32))
+            transcriber._drain()
+            assert transcriber._find_cut() == 0              # menor que min_region
+
+            ring.write(np.zeros(sr * 2, dtype=np.float32))
+            transcriber._drain()
+            speech[:] = [{"start": 0, "end": sr}]
+            # Fala fechada por silêncio: corte no meio do silêncio mínimo
+            assert transcriber._find_cut() == sr + sr // 4
+
+            speech[:] = [{"start": 0, "end": int(2.4 * sr)}]
+            assert transcriber._find_cut() == 0              # fala ainda aberta
+
+            # Só silêncio acima de max_region: descartado sem decodificar
+            speech[:] = []
+            ring.write(np.zeros(sr * 2, dtype=np.float32))
+            transcriber._drain()
+            assert transcriber._find_cut() == 0
+            assert transcriber._pending_frames == 0
+            assert transcriber._decoded_until == int(4.5 * sr)
+    finally:
+        vad.get_speech_timestamps = original
+
+
+def test_failed_region_is_consumed_once():
+    sr = 16000
+    original = live.transcribe_array
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            ring = RingBuffer(sr * 10)
+            transcriber = _transcriber(tmp, ring)
+
+            def boom(*_args, **_kwargs):
+                transcriber._stop.set()
+                raise RuntimeError("falhou de proposito")
+
+            live.transcribe_array = boom
+            transcriber._find_cut = lambda: sr
+            ring.write(np.zeros(3 * sr, dtype=np.float32))
+            transcriber._run()
+
+            # Só a região que falhou sai do pendente
+            assert transcriber._pending_frames == 2 * sr
+            assert transcriber._decoded_until == sr
+            assert transcriber._complete is False
+    finally:
+        live.transcribe_array = original
+
+
+if __name__ == "__main__":
+    test_wraparound_and_independent_readers()
+    test_lossy_reader_skips_oldest_and_never_blocks_writer()
+    test_live_transcriber_cuts_regions()
+    test_failed_region_is_consumed_once()
+    print("OK — buffer circular")
@@ -0,0 +1,43 @@
+import tempfile
+from pathlib import Path
+
+from core.segment_store import SegmentColumns, SegmentStore, sidecar_path
+
+
+def _segment(start, end, text):
+    words = text.split()
+    step = (end - start) / len(words)
+    return {
+        "start": start,
+        "end": end,
+        "text": text,
+        "avg_logprob": -0.2,
+        "no_speech_prob": 0.01,
+        "words": [
+            {"start": start + i * step, "end": start + (i + 1) * step, "word": w, "probability": 0.9}
+            for i, w in enumerate(words)
+        ],
+    }
+
+
+def test_roundtrip_and_time_slice():
+    columns = SegmentColumns()
+    columns.append(_segment(0.0, 2.0, "bom dia"))
+    columns.append(_segment(2.0, 5.0, "reunião de alinhamento"))
+    columns.append(_segment(5.0, 7.0, "próximos passos"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = columns.save(sidecar_path(Path(tmp) / "sessao.txt"))
+        assert path.name == "sessao.segments.npz"
+
+        with SegmentStore(path) as store:
+            assert len(store) == 3
+            sliced = store.slice(2.5, 4.0, with_words=True)
+            assert [s["text"] for s in sliced] == ["reunião de alinhamento"]
+            assert [w["word"] for w in sliced[0]["words"]] == ["reunião", "de", "alinhamento"]
+            assert store.duration == 7.0
+
+
+if __name__ == "__main__":
+    test_roundtrip_and_time_slice()
+    print("OK — sidecar de segmentos")
@@ -0,0 +1,58 @@
+import tempfile
+import wave
+from pathlib import Path
+
+from core.session_manifest import SessionManifest, rebuild_consolidated
+
+
+def _write_wav(path: Path, seconds: float) -> bytes:
+    audio = b"\x01\x00" * int(16000 * seconds)
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(audio)
+    return audio
+
+
+def test_status_survives_reload_and_rebuild():
+    with tempfile.TemporaryDirectory() as tmp:
+        session_dir = Path(tmp)
+        manifest = SessionManifest(session_dir, 16000)
+        for index in (1, 2):
+            audio_path = session_dir / f"audio_{index:04d}.wav"
+            audio = _write_wav(audio_path, 2)
+            start = (index - 1) * 32000
+            manifest.add_chunk(index, audio_path, start, start + 32000, "silence", audio)
+
+        (session_dir / "transcricao_0001.txt").write_text("primeiro", encoding="utf-8-sig")
+        manifest.mark_done(1, 0.5, "pt")
+        manifest.mark_failed(2, "RuntimeError: boom")
+
+        reloaded = SessionManifest.load(session_dir)
+        assert [c["index"] for c in reloaded.pending()] == [2]
+        assert reloaded.chunk(2)["start_s"] == 2.0
+        assert reloaded.verify_audio(reloaded.chunk(1), b"\x01\x00" * 32000)
+
+        text = rebuild_consolidated(reloaded).read_text(encoding="utf-8-sig")
+        assert text == "--- Chunk 0001 ---\nprimeiro\n\n--- Chunk 0002 ---\n\n\n"
+
+
+def test_legacy_session_without_manifest():
+    with tempfile.TemporaryDirectory() as tmp:
+        session_dir = Path(tmp)
+        _write_wav(session_dir / "audio_0001.wav", 1)
+        _write_wav(session_dir / "audio_0002.wav", 1)
+        (session_dir / "transcricao_0001.txt").write_text("ok", encoding="utf-8-sig")
+
+        manifest = SessionManifest.load(session_dir)
+
+        assert (session_dir / "session.json").exists()
+        assert [c["index"] for c in manifest.pending()] == [2]
+        assert manifest.chunk(2)["start_s"] == 1.0
+
+
+if __name__ == "__main__":
+    test_status_survives_reload_and_rebuild()
+    test_legacy_session_without_manifest()
+    print("OK — manifesto da sessão")
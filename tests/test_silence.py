@@ -0,0 +1,40 @@
+import numpy as np
+
+from core.audio.silence import OnlineChunker, find_silence_cuts
+
+SR = 16000
+
+
+def test_cut_lands_in_silence():
+    rng = np.random.default_rng(0)
+    audio = rng.uniform(-0.5, 0.5, SR * 25).astype(np.float32)
+    # silêncio entre 11s e 11.5s, dentro da tolerância do alvo (10s ± 2s)
+    audio[11 * SR: int(11.5 * SR)] = 0.0
+
+    cuts = find_silence_cuts(audio, SR, target_s=10, tolerance_s=2)
+
+    assert 11 * SR <= cuts[0] <= int(11.5 * SR)
+    assert all(a < b for a, b in zip(cuts, cuts[1:]))
+
+
+def test_online_chunker_cuts_in_silence_and_keeps_offsets():
+    rng = np.random.default_rng(1)
+    audio = rng.uniform(-0.5, 0.5, SR * 25).astype(np.float32)
+    audio[9 * SR: int(9.4 * SR)] = 0.0
+
+    chunker = OnlineChunker(SR, target_s=10, tolerance_s=2)
+    chunks = []
+    for piece in np.array_split(audio, 25):
+        chunks.extend(chunker.feed(piece))
+    chunks.append(chunker.flush())
+
+    assert 9 * SR <= chunks[0].end <= int(9.4 * SR)
+    assert chunks[-1].cut == "final" and chunks[-1].end == audio.shape[0]
+    assert all(a.end == b.start for a, b in zip(chunks, chunks[1:]))
+    assert np.array_equal(np.concatenate([c.audio for c in chunks]), audio)
+
+
+if __name__ == "__main__":
+    test_cut_lands_in_silence()
+    test_online_chunker_cuts_in_silence_and_keeps_offsets()
+    print("OK — cortes em silêncio")
@@ -0,0 +1,115 @@
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from core.app_jobs import save_transcript
+from core.audio.speech_gate import (
+    SpeechGate,
+    add_pauses,
+    linear_map,
+    pause_map,
+    remap_result,
+    save_kept_map,
+    to_file_time,
+    to_source_time,
+)
+from core.segment_store import SegmentColumns, SegmentStore
+
+
+def _tone(seconds, rng):
+    t = np.arange(int(seconds * 16000)) / 16000
+    return (0.3 * np.sin(2 * np.pi * 200 * t) + rng.standard_normal(t.size) * 1e-3).astype(np.float32)
+
+
+def _noise(seconds, rng):
+    return (rng.standard_normal(int(seconds * 16000)) * 1e-3).astype(np.float32)
+
+
+def test_drops_long_silence_and_maps_back():
+    rng = np.random.default_rng(0)
+    audio = np.concatenate([_tone(2, rng), _noise(1, rng), _tone(2, rng), _noise(20, rng), _tone(2, rng)])
+
+    gate = SpeechGate(16000, max_silence_s=3.0, pad_s=0.3)
+    kept = [gate.process(b.reshape(-1, 1)) for b in np.array_split(audio, 270)]
+    kept.append(gate.flush())
+    kept_s = sum(k.shape[0] for k in kept) / 16000
+
+    # Pausa curta (1 s) inteira; silêncio de 20 s vira 3 s + pré-roll
+    assert abs(kept_s - (2 + 1 + 2 + 3.0 + 0.3 + 2)) < 0.1
+
+    kept_map = gate.kept_map()
+    assert len(kept_map["intervals"]) == 2
+    # Início do último tom: 8 s no arquivo -> 25 s na gravação
+    assert abs(to_source_time(8.35, kept_map) - 25.05) < 0.1
+
+    result = remap_result({"segments": [{"start": 8.35, "end": 9.0, "text": "x"}]}, kept_map)
+    assert abs(result["segments"][0]["start"] - 25.05) < 0.1
+    assert result["speech_gate"]["source_s"] == 27.0
+
+
+def test_pauses_map_file_time_to_session_time():
+    # 30 s gravados com pausas de 60 s (após 10 s) e 5 s (após 20 s)
+    sr = 16000
+    kept_map = add_pauses(linear_map(30 * sr, sr, datetime(2026, 10, 18, 9)), [[10 * sr, 60 * sr], [20 * sr, 5 * sr]])
+
+    assert kept_map["intervals"] == [[0.0, 10.0, 0.0], [70.0, 80.0, 10.0], [85.0, 95.0, 20.0]]
+    assert kept_map["pauses"] == [[10.0, 60.0], [80.0, 5.0]]
+    assert kept_map["source_s"] == 95.0 and kept_map["paused_s"] == 65.0
+    assert to_source_time(9.5, kept_map) == 9.5
+    assert to_source_time(12.0, kept_map) == 72.0
+    assert to_source_time(25.0, kept_map) == 90.0
+    assert to_file_time(72.0, kept_map) == 12.0
+    assert to_file_time(30.0, kept_map) == 10.0     # durante a pausa
+
+    # Com gate: pausa dentro de um intervalo mantido divide o intervalo
+    gate_map = {**kept_map, "intervals": [[0.0, 4.0, 0.0], [8.0, 12.0, 4.0]], "source_s": 12.0}
+    paused = add_pauses(gate_map, [[10 * sr, 30 * sr]])
+    assert paused["intervals"] == [[0.0, 4.0, 0.0], [8.0, 10.0, 4.0], [40.0, 42.0, 6.0]]
+
+
+def test_live_result_only_gets_pauses_with_gate_on():
+    # Stream de 12 s: gate descartou 4-8 s; pausa de 30 s após 10 s
+    sr = 16000
+    gate_map = {
+        **linear_map(12 * sr, sr, datetime(2026, 10, 18, 9)),
+        "intervals": [[0.0, 4.0, 0.0], [8.0, 12.0, 4.0]],
+        "kept_s": 8.0,
+        "dropped_s": 4.0,
+    }
+    kept_map = add_pauses(gate_map, [[10 * sr, 30 * sr]])
+    assert pause_map(kept_map)["intervals"] == [[0.0, 10.0, 0.0], [40.0, 42.0, 10.0]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        audio = tmp / "rec.wav"
+        audio.write_bytes(b"")
+        save_kept_map(audio, kept_map)
+        segments = [{"start": 9.0, "end": 11.0, "text": "ao vivo"}]
+
+        # Ao vivo: tempo do stream antes do gate -> só soma a pausa
+        save_transcript(audio, tmp, {"text": "ao vivo", "segments": segments}, live=True)
+        saved = json.loads((tmp / "rec.json").read_text(encoding="utf-8"))
+        assert [(s["start"], s["end"]) for s in saved["segments"]] == [(9.0, 41.0)]
+
+        # Arquivo gravado: tempo do arquivo (após o gate) -> gate + pausa
+        segments = [{"start": 3.0, "end": 7.5, "text": "arquivo"}]
+        columns = SegmentColumns()
+        columns.append({**segments[0], "words": [{"start": 3.0, "end": 7.5, "word": " arquivo"}]})
+        save_transcript(audio, tmp, {"text": "arquivo", "segments": segments}, columns=columns)
+        saved = json.loads((tmp / "rec.json").read_text(encoding="utf-8"))
+        assert [(s["start"], s["end"]) for s in saved["segments"]] == [(3.0, 41.5)]
+
+        # Sidecar de palavras no mesmo tempo do JSON
+        with SegmentStore(tmp / "rec.segments.npz") as store:
+            word = store.segment(0, with_words=True)["words"][0]
+            assert (word["start"], word["end"]) == (3.0, 41.5)
+
+
+if __name__ == "__main__":
+    test_drops_long_silence_and_maps_back()
+    test_pauses_map_file_time_to_session_time()
+    test_live_result_only_gets_pauses_with_gate_on()
+    print("OK — speech_gate")
@@ -0,0 +1,33 @@
+from core.stitcher import stitch_words, words_to_text
+
+
+def _words(spec, shift=0.0):
+    return [
+        {"start": start + shift, "end": start + shift + 0.4, "word": f" {text}"}
+        for start, text in spec
+    ]
+
+
+def test_overlap_keeps_single_copy():
+    # chunk A: 0-10s, chunk B: 8-18s (overlap de 2s)
+    a = _words([(7.0, "vamos"), (7.5, "fechar"), (8.2, "o"), (8.7, "escopo"), (9.4, "hoj")])
+    b = _words([(8.2, "o"), (8.7, "Escopo,"), (9.4, "hoje"), (10.1, "mesmo")], shift=0.1)
+
+    merged = stitch_words(a, b, overlap_start=8.0, overlap_end=10.0)
+
+    assert words_to_text(merged) == "vamos fechar o Escopo, hoje mesmo"
+
+
+def test_no_anchor_splits_at_overlap_center():
+    a = _words([(8.1, "aaa"), (9.5, "bbb")])
+    b = _words([(8.1, "xxx"), (9.5, "yyy"), (10.5, "zzz")])
+
+    merged = stitch_words(a, b, overlap_start=8.0, overlap_end=10.0)
+
+    assert words_to_text(merged) == "aaa yyy zzz"
+
+
+if __name__ == "__main__":
+    test_overlap_keeps_single_copy()
+    test_no_anchor_splits_at_overlap_center()
+    print("OK — stitcher")
@@ -0,0 +1,37 @@
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from core.audio.stream_writer import StreamingWavWriter, apply_gain
+
+
+def test_streams_blocks_and_tracks_stats():
+    rng = np.random.default_rng(0)
+    audio = (rng.standard_normal(16000 * 3) * 0.1).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        part = Path(tmp) / "rec.part.wav"
+        writer = StreamingWavWriter(part, 16000, flush_interval_s=0.0).start()
+        for block in np.split(audio, 30):
+            writer.push(block.reshape(-1, 1))
+        stats = writer.close()
+
+        assert stats["frames"] == audio.shape[0]
+        assert stats["dropped_blocks"] == 0
+        assert abs(stats["peak"] - float(np.max(np.abs(audio)))) < 1e-6
+        assert abs(stats["std"] - float(np.std(audio))) < 1e-4
+
+        written, sr = sf.read(part, dtype="float32")
+        assert sr == 16000
+        assert np.allclose(written, audio)
+
+        final = apply_gain(part, Path(tmp) / "rec.wav", 0.9 / stats["peak"])
+        normalized, _ = sf.read(final, dtype="float32")
+        assert abs(float(np.max(np.abs(normalized))) - 0.9) < 1e-3
+
+
+if __name__ == "__main__":
+    test_streams_blocks_and_tracks_stats()
+    print("OK — gravação em streaming")
@@ -0,0 +1,77 @@
+import numpy as np
+
+import core.streaming_recognizer as streaming
+from core.streaming_recognizer import HypothesisBuffer, StreamingRecognizer
+from core.stitcher import words_to_text
+
+
+def _words(spec):
+    return [
+        {"start": start, "end": start + 0.4, "word": f" {text}"}
+        for start, text in spec
+    ]
+
+
+def test_commits_only_agreed_prefix():
+    hyp = HypothesisBuffer()
+
+    hyp.insert(_words([(0.0, "bom"), (0.5, "dia"), (1.0, "a")]))
+    assert hyp.commit() == []
+
+    hyp.insert(_words([(0.0, "bom"), (0.5, "Dia,"), (1.0, "a"), (1.5, "todos")]))
+    committed = hyp.commit()
+    assert words_to_text(committed) == "bom Dia, a"
+    assert words_to_text(hyp.unstable()) == "todos"
+    assert hyp.committed_end == 1.4
+
+
+def test_drops_repeated_ngram_after_trim():
+    hyp = HypothesisBuffer()
+    hyp.insert(_words([(0.0, "vamos"), (0.5, "fechar")]))
+    hyp.commit()
+    hyp.insert(_words([(0.0, "vamos"), (0.5, "fechar"), (1.0, "hoje")]))
+    hyp.commit()
+
+    # Nova janela repete "fechar" com timestamp levemente deslocado
+    hyp.insert(_words([(0.85, "fechar"), (1.0, "hoje"), (1.5, "mesmo")]))
+    assert words_to_text(hyp.commit()) == "hoje"
+
+
+def test_window_stays_bounded_without_agreement():
+    calls = [0]
+
+    def never_agrees(audio, offset_s=0.0, **_kwargs):
+        # Uma palavra diferente por segundo de janela, a cada decodificação
+        calls[0] += 1
+        words = [
+            {"start": offset_s + i, "end": offset_s + i + 0.5, "word": f" w{calls[0]}_{i}"}
+            for i in range(int(audio.shape[0] / 16000))
+        ]
+        return [{"start": offset_s, "end": offset_s + 1, "text": "", "words": words}], "pt", 1.0
+
+    original = streaming.transcribe_array
+    streaming.transcribe_array = never_agrees
+    try:
+        for silence in (False, True):
+            events = []
+            recognizer = StreamingRecognizer(on_event=events.append, language="pt", max_buffer_s=6.0, trim_s=2.0)
+            if silence:
+                streaming.transcribe_array = lambda audio, offset_s=0.0, **_k: ([], "pt", 1.0)
+            for _ in range(40):
+                recognizer.insert_audio(np.zeros(16000, dtype=np.float32))
+                recognizer.process()
+                assert recognizer._audio.shape[0] <= 6 * 16000
+
+            assert recognizer.stream_s == 40.0
+            finals = [e for e in events if e["type"] == "final"]
+            assert all(not e["stable"] for e in finals)
+            assert bool(finals) is not silence
+    finally:
+        streaming.transcribe_array = original
+
+
+if __name__ == "__main__":
+    test_commits_only_agreed_prefix()
+    test_drops_repeated_ngram_after_trim()
+    test_window_stays_bounded_without_agreement()
+    print("OK — streaming_recognizer")
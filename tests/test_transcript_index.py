@@ -0,0 +1,56 @@
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from core.audio.ingest import read_slice
+from core.transcript_index import TranscriptIndex, format_timestamp, parse_timestamp
+
+
+def _segments(n):
+    return [
+        {"start": i * 4.0, "end": i * 4.0 + 3.5, "text": f" Segmento {i} sobre orçamento." if i % 10 == 0 else f" Segmento {i}."}
+        for i in range(n)
+    ]
+
+
+def test_pages_locate_and_search():
+    index = TranscriptIndex(_segments(120))
+
+    assert index.page_count(50) == 3
+    assert [s["index"] for s in index.page(2, 50)] == list(range(100, 120))
+
+    # 02:05 = 125 s -> segmento 31 (124..127.5)
+    assert parse_timestamp("02:05") == 125.0
+    assert parse_timestamp("x") is None
+    assert index.locate(125.0) == 31
+    assert index.page_of(31, 50) == 0
+    assert format_timestamp(3725) == "01:02:05"
+
+    assert index.search("orçamento") == [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 110]
+    assert index.search("sobre orç") == index.search("orçamento")    # último termo como prefixo
+    assert index.search("segmento 7") == [7, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79]
+    assert index.search("inexistente") == []
+
+
+def test_file_span_with_kept_map_and_seek_slice():
+    # Arquivo de 20 s; gravação com pausa de 60 s após 10 s
+    kept_map = {"intervals": [[0.0, 10.0, 0.0], [70.0, 80.0, 10.0]]}
+    index = TranscriptIndex([{"start": 72.0, "end": 74.0, "text": "depois da pausa"}], kept_map)
+    assert index.file_span(0) == (12.0, 14.0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        audio = Path(tmp) / "a.flac"
+        samples = np.arange(16000 * 20, dtype=np.int16) % 1000
+        sf.write(str(audio), samples, 16000, subtype="PCM_16")
+
+        block, sr = read_slice(audio, 12.0, 14.0, Path(tmp) / "pcm")
+        assert sr == 16000 and block.shape[0] == 2 * 16000
+        assert np.allclose(block * 32768, samples[12 * 16000: 14 * 16000])
+
+
+if __name__ == "__main__":
+    test_pages_locate_and_search()
+    test_file_span_with_kept_map_and_seek_slice()
+    print("OK — transcript_index")
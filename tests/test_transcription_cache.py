@@ -0,0 +1,88 @@
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+from core.segment_store import SegmentColumns
+from core.transcription_cache import TranscriptionCache, transcribe_cached
+
+
+def test_same_pcm_hits_regardless_of_filename():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        audio = np.linspace(-0.5, 0.5, 16000, dtype=np.float32)
+        sf.write(tmp / "a.wav", audio, 16000)
+        sf.write(tmp / "copia.wav", audio, 16000)
+
+        cache = TranscriptionCache(tmp / "cache")
+        key_a = cache.key_for(tmp / "a.wav", model="small", vad_filter=True)
+        key_b = cache.key_for(tmp / "copia.wav", model="small", vad_filter=True)
+        key_no_vad = cache.key_for(tmp / "a.wav", model="small", vad_filter=False)
+
+        assert key_a == key_b
+        assert key_a != key_no_vad
+
+        cache.put(key_a, {"text": "ola"})
+        assert cache.get(key_b) == {"text": "ola"}
+        assert cache.get(key_no_vad) is None
+        assert cache.get_columns(key_b) is None
+
+        # Colunas de palavras voltam com a entrada (sidecar num acerto)
+        columns = SegmentColumns()
+        columns.append({"start": 0.0, "end": 1.0, "text": " ola", "words": [{"start": 0.0, "end": 1.0, "word": " ola"}]})
+        cache.put(key_no_vad, {"text": "ola"}, columns)
+        restored = cache.get_columns(key_no_vad)
+        assert len(restored) == 1
+        assert restored.to_arrays()["words"]["end"].tolist() == [1.0]
+
+
+def test_hash_memos_are_capped_lru():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        cache = TranscriptionCache(tmp / "cache", max_memos=2)
+        paths = []
+        for n in range(3):
+            path = tmp / f"{n}.wav"
+            sf.write(path, np.full(1600, n / 10, dtype=np.float32), 16000)
+            paths.append(path)
+
+        stat_dir = tmp / "cache" / "stat"
+        hashes = [cache.audio_hash(paths[0]), cache.audio_hash(paths[1])]
+        for memo in stat_dir.glob("*.txt"):
+            os.utime(memo, (1000, 1000))
+
+        cache.audio_hash(paths[0])          # acerto toca o memo de 0.wav
+        hashes.append(cache.audio_hash(paths[2]))
+
+        # Limite 2: sai o memo usado há mais tempo (1.wav)
+        remaining = {p.read_text(encoding="utf-8") for p in stat_dir.glob("*.txt")}
+        assert remaining == {hashes[0], hashes[2]}
+
+
+def test_transcribe_cached_keys_on_profile():
+    calls = []
+
+    def transcribe():
+        calls.append(1)
+        return {"text": "ola"}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sf.write(tmp / "a.wav", np.zeros(16000, dtype=np.float32), 16000)
+        cache = TranscriptionCache(tmp / "cache")
+        fast = {"name": "fast", "model": "base", "beam_size": 1}
+        accurate = {"name": "accurate", "model": "small", "beam_size": 5}
+
+        assert transcribe_cached(tmp / "a.wav", cache=cache, profile=fast, transcribe=transcribe) == {"text": "ola"}
+        assert transcribe_cached(tmp / "a.wav", cache=cache, profile=fast, transcribe=transcribe)["cached"]
+        transcribe_cached(tmp / "a.wav", cache=cache, profile=accurate, transcribe=transcribe)
+        assert len(calls) == 2
+
+
+if __name__ == "__main__":
+    test_same_pcm_hits_regardless_of_filename()
+    test_hash_memos_are_capped_lru()
+    test_transcribe_cached_keys_on_profile()
+    print("OK — cache de transcrição")
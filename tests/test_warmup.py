@@ -0,0 +1,93 @@
+import time
+
+import core.model_pool as model_pool
+import core.warmup as warmup
+from core.model_pool import ModelPool
+from core.warmup import is_ready, load_warmup_config, start_warmup, warmup_status
+
+
+def _wait_done(timeout_s=5.0):
+    deadline = time.time() + timeout_s
+    while time.time() < deadline:
+        if warmup_status()["status"] in ("ready", "failed"):
+            return warmup_status()
+        time.sleep(0.01)
+    raise AssertionError("warm-up nao terminou")
+
+
+def _reset(loader):
+    original = model_pool._pool
+    model_pool._pool = ModelPool(loader=loader, idle_timeout_s=None)
+    warmup._thread = None
+    warmup._state.update(status="idle", model=None, seconds=None, error=None)
+    return original
+
+
+def test_load_warmup_config_defaults():
+    assert load_warmup_config({}) == {"enabled": False, "dummy_decode": True, "language": None}
+    cfg = {"transcription": {"default_language": "en", "warmup": {"enabled": True, "dummy_decode": False}}}
+    assert load_warmup_config(cfg) == {"enabled": True, "dummy_decode": False, "language": "en"}
+
+
+def test_dummy_decode_uses_configured_language():
+    calls = []
+
+    class FakeModel:
+        def transcribe(self, audio, **kwargs):
+            calls.append(kwargs)
+            return iter([]), None
+
+    original = _reset(lambda key, _root: FakeModel())
+    try:
+        start_warmup("tiny", language="en")
+        assert _wait_done()["status"] == "ready"
+        assert calls == [{"beam_size": 1, "language": "en"}]
+    finally:
+        model_pool._pool = original
+
+
+def test_start_warmup_loads_once_and_is_ready():
+    loads = []
+    original = _reset(lambda key, _root: loads.append(key) or object())
+    try:
+        assert not is_ready("tiny")
+        start_warmup("tiny", dummy_decode=False)
+        assert _wait_done()["status"] == "ready"
+        assert is_ready("tiny")
+
+        start_warmup("tiny", dummy_decode=False)      # rerun: no-op
+        assert len(loads) == 1
+    finally:
+        model_pool._pool = original
+
+
+def test_failed_warmup_needs_explicit_retry():
+    calls = []
+
+    def broken(key, _root):
+        calls.append(key)
+        raise OSError("modelo indisponivel")
+
+    original = _reset(broken)
+    try:
+        start_warmup("tiny", dummy_decode=False)
+        state = _wait_done()
+        assert state["status"] == "failed" and "OSError" in state["error"]
+
+        # Reruns não repetem o load quebrado
+        start_warmup("tiny", dummy_decode=False)
+        assert warmup_status()["status"] == "failed" and len(calls) == 1
+
+        start_warmup("tiny", dummy_decode=False, retry=True)
+        assert _wait_done()["status"] == "failed" and len(calls) == 2
+        assert not is_ready("tiny")
+    finally:
+        model_pool._pool = original
+
+
+if __name__ == "__main__":
+    test_load_warmup_config_defaults()
+    test_dummy_decode_uses_configured_language()
+    test_start_warmup_loads_once_and_is_ready()
+    test_failed_warmup_needs_explicit_retry()
+    print("OK — warmup")
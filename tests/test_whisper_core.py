@@ -0,0 +1,164 @@
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace as NS
+
+import faster_whisper.vad as vad
+import numpy as np
+import soundfile as sf
+
+import core.model_pool as model_pool
+from core.model_pool import ModelPool
+from core.whisper_core import _complement_spans, redecode_gaps, whisper_transcribe, whisper_transcribe_iter
+
+
+def _segment(start, end, text):
+    return NS(start=start, end=end, text=text, avg_logprob=-0.1, no_speech_prob=0.0, words=[])
+
+
+class FakeModel:
+    """
+    Com clip_timestamps, um segmento por clipe; sem, devolve `segments`.
+    Guarda os kwargs e a duração do áudio recebido.
+    """
+
+    def __init__(self, segments=()):
+        self.segments = list(segments)
+        self.calls = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append({**kwargs, "audio_s": len(audio) / 16000 if not isinstance(audio, str) else None})
+        clips = kwargs.get("clip_timestamps") or []
+        segments = [_segment(a, b, f" recuperado {a:.0f}") for a, b in zip(clips[::2], clips[1::2])]
+        segments = segments or [_segment(*seg) for seg in self.segments]
+        duration = self.calls[-1]["audio_s"] or 60.0
+        return iter(segments), NS(language="pt", language_probability=1.0, duration=duration)
+
+
+def _with_fake_pool(model):
+    original = model_pool._pool
+    model_pool._pool = ModelPool(loader=lambda key, _root: model, idle_timeout_s=None)
+    return original
+
+
+def test_redecode_gaps_merges_by_time_with_profile():
+    model = FakeModel()
+    original = _with_fake_pool(model)
+    try:
+        result = {
+            "text": "a b",
+            "language": "pt",
+            "segments": [{"start": 0.0, "end": 5.0, "text": "a"}, {"start": 30.0, "end": 35.0, "text": "b"}],
+            "vad_dropped": [{"start": 5.0, "end": 30.0}, {"start": 35.0, "end": 35.5}],
+            "duration_s": 2.0,
+            "model": "small",
+            "profile": "accurate",
+            "audio_s": 40.0,
+        }
+        profile = {"name": "accurate", "model": "small", "beam_size": 8, "vad_filter": True}
+        merged = redecode_gaps(Path("x.wav"), result, profile=profile)
+
+        # Lacuna curta (< GAP_MIN_S) não é re-decodificada
+        assert model.calls[0]["clip_timestamps"] == [5.0, 30.0]
+        assert model.calls[0]["beam_size"] == 8 and model.calls[0]["vad_filter"] is False
+        assert [s["text"] for s in merged["segments"]] == ["a", "recuperado 5", "b"]
+        assert merged["text"] == "a recuperado 5 b"
+        assert merged["recovered_segments"] == 1
+
+        # Campos da primeira passada sobrevivem (perfil, VAD, RTF)
+        assert merged["profile"] == "accurate" and merged["audio_s"] == 40.0
+        assert merged["vad_dropped"] == result["vad_dropped"]
+        assert merged["rtf"] == round(merged["duration_s"] / 40.0, 3)
+    finally:
+        model_pool._pool = original
+
+
+def test_complement_spans():
+    kept = [{"start": 1.0, "end": 3.0}, {"start": 2.5, "end": 4.0}, {"start": 4.5, "end": 6.0}]
+    # Sobreposição não gera lacuna; 4.0-4.5 é menor que o mínimo
+    assert _complement_spans(kept, 10.0, 1.0) == [
+        {"start": 0.0, "end": 1.0},
+        {"start": 6.0, "end": 10.0},
+    ]
+    assert _complement_spans([], 2.0, 1.0) == [{"start": 0.0, "end": 2.0}]
+    assert _complement_spans([{"start": 0.0, "end": 2.0}], 2.0, 1.0) == []
+
+
+def test_iter_runs_vad_once_and_restores_file_time():
+    sr = 16000
+    vad_calls = []
+    speech = [{"start": 1 * sr, "end": 3 * sr}, {"start": 6 * sr, "end": 8 * sr}]
+
+    def fake_vad(audio, _options, **_kwargs):
+        vad_calls.append(audio.shape[0])
+        return [dict(chunk) for chunk in speech]
+
+    # Tempos no áudio concatenado (4 s de fala)
+    model = FakeModel([(0.5, 1.5, " um"), (2.5, 3.5, " dois")])
+    original_pool, original_vad = _with_fake_pool(model), vad.get_speech_timestamps
+    vad.get_speech_timestamps = fake_vad
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            audio = Path(tmp) / "a.wav"
+            sf.write(str(audio), np.zeros(10 * sr, dtype=np.int16), sr, subtype="PCM_16")
+            events = list(whisper_transcribe_iter(audio))
+
+        assert vad_calls == [10 * sr]
+        assert model.calls[0]["vad_filter"] is False and model.calls[0]["audio_s"] == 4.0
+        assert [(e["segment"]["start"], e["segment"]["end"]) for e in events[:-1]] == [(1.5, 2.5), (6.5, 7.5)]
+        assert events[0]["vad_dropped"] == [
+            {"start": 0.0, "end": 1.0},
+            {"start": 3.0, "end": 6.0},
+            {"start": 8.0, "end": 10.0},
+        ]
+        assert events[-2]["audio_s"] == 10.0 and events[-2]["progress"] == 0.75
+    finally:
+        model_pool._pool = original_pool
+        vad.get_speech_timestamps = original_vad
+
+
+def test_iter_event_fields_progress_and_eta():
+    model = FakeModel([(0.0, 15.0, " um"), (15.0, 45.0, " dois")])
+    original = _with_fake_pool(model)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            audio = Path(tmp) / "a.wav"
+            audio.write_bytes(b"")      # sem VAD: o caminho vai direto ao modelo
+            events = list(whisper_transcribe_iter(audio, vad_filter=False))
+    finally:
+        model_pool._pool = original
+
+    assert [e["done"] for e in events] == [False, False, True]
+    first, second, final = events
+    assert first["segment"] == {"start": 0.0, "end": 15.0, "text": "um"}
+    assert (first["language"], first["audio_s"], first["vad_dropped"]) == ("pt", 60.0, [])
+    assert first["progress"] == 0.25 and second["progress"] == 0.75
+    for event in (first, second):
+        done_s = event["segment"]["end"]
+        assert abs(event["rtf"] - event["elapsed_s"] / done_s) < 1e-12
+        # ETA = tempo decorrido x (restante / processado)
+        assert abs(event["eta_s"] - event["elapsed_s"] * (1 - event["progress"]) / event["progress"]) < 1e-9
+    assert final["segment"] is None and final["progress"] == 1.0 and final["eta_s"] == 0.0
+
+
+def test_language_survives_zero_segments():
+    original = _with_fake_pool(FakeModel())
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            audio = Path(tmp) / "a.wav"
+            audio.write_bytes(b"")
+            events = list(whisper_transcribe_iter(audio, vad_filter=False))
+            result = whisper_transcribe(audio, vad_filter=False)
+    finally:
+        model_pool._pool = original
+
+    assert len(events) == 1 and events[0]["done"] and events[0]["language"] == "pt"
+    assert result["language"] == "pt" and result["segments"] == [] and result["audio_s"] == 60.0
+
+
+if __name__ == "__main__":
+    test_redecode_gaps_merges_by_time_with_profile()
+    test_complement_spans()
+    test_iter_runs_vad_once_and_restores_file_time()
+    test_iter_event_fields_progress_and_eta()
+    test_language_survives_zero_segments()
+    print("OK — whisper_core")
@@ -19,6 +19,14 @@ Responsabilidades:
 # - Suporte explícito a retornos (str) e (str, dict)
 # - Garantia absoluta de que texto válido nunca é zerado
 #
+# 2026-10-18
+# - Opção -w/--workers (transcrição paralela por chunks)
+# - ASR incremental: progresso e TXT bruto gravado por segmento
+# - Removido session_type da chamada ao core (parâmetro inexistente)
+# - Perfil de decodificação resolvido pelo tipo de sessão (-t) ou -p;
+#   perfil e RTF do ASR gravados no metrics.json
+# - metrics.json: áudio gravado x mantido pelo gate de fala (<nome>.kept.json)
+#
 # =========================
 
 import argparse
@@ -27,7 +35,13 @@ import time
 from pathlib import Path
 from typing import Any, Tuple
 
-from core.whisper_core import whisper_transcribe
+from core.audio.speech_gate import load_kept_map
+from core.decode_profiles import resolve_profile
+from core.transcription_cache import transcribe_cached
+from core.whisper_core import (
+    build_result,
+    whisper_transcribe_iter,
+)
 from refiners.orality import normalize_orality
 from refiners.repetition import remove_repetition
 from refiners.hallucination import cut_hallucinated_tail
@@ -69,11 +83,64 @@ def _apply_refiner(current: str, result: Any) -> str:
     return current
 
 
+def _run_asr_streaming(audio_path: Path, raw_path: Path, profile: dict) -> dict:
+    """
+    Executa ASR incremental: cada segmento é anexado ao TXT bruto
+    assim que decodificado, com progresso no terminal.
+    """
+    t0 = time.time()
+    segments = []
+    language = None
+    audio_s = None
+
+    with raw_path.open("w", encoding="utf-8") as raw_file:
+        for event in whisper_transcribe_iter(audio_path, language="pt", profile=profile):
+            segment = event["segment"]
+            if segment is not None:
+                raw_file.write(f"{segment['text']}\n")
+                raw_file.flush()
+                segments.append(segment)
+
+            language = event["language"]
+            audio_s = event["audio_s"]
+
+            eta = event["eta_s"]
+            print(
+                f"\r[ASR] {event['progress'] * 100:5.1f}% | "
+                f"RTF {event['rtf']:.2f} | "
+                f"ETA {int(eta) if eta is not None else '--'}s",
+                end="",
+                flush=True,
+            )
+
+    print()
+    return build_result(
+        segments,
+        language,
+        time.time() - t0,
+        profile["model"],
+        profile=profile,
+        audio_s=audio_s,
+    )
+
+
+def _gate_summary(audio_path: Path) -> dict | None:
+    """Audio gravado x audio mantido pelo gate de fala / pausas (se houver mapa)."""
+    kept_map = load_kept_map(audio_path)
+    if kept_map is None:
+        return None
+    summary = {k: kept_map[k] for k in ("started_at", "source_s", "kept_s", "dropped_s")}
+    summary["paused_s"] = kept_map.get("paused_s", 0.0)
+    return summary
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("-a", "--audio", required=True)
     parser.add_argument("-t", "--type", default="reuniao")
     parser.add_argument("-s", "--slug", default=None)
+    parser.add_argument("-w", "--workers", type=int, default=1)
+    parser.add_argument("-p", "--profile", default=None)
     args = parser.parse_args()
 
     audio_path = Path(args.audio)
@@ -83,15 +150,34 @@ def main() -> None:
     print("[PIPELINE] Iniciando transcrição")
     start = time.time()
 
+    output_root = audio_path.parents[1]
+    transcripts_dir = output_root / "transcripts"
+    transcripts_dir.mkdir(parents=True, exist_ok=True)
+
+    name = args.slug or audio_path.stem
+
     # ==================================================
     # ASR
     # ==================================================
-    print("[PIPELINE] Etapa 1/3 — ASR")
-    core_result = whisper_transcribe(
-        audio_path=audio_path,
-        language="pt",
-        session_type=args.type,
-    )
+    profile = resolve_profile(name=args.profile, session_type=args.type)
+    print(f"[PIPELINE] Etapa 1/3 — ASR | perfil={profile['name']} | modelo={profile['model']}")
+    if args.workers > 1:
+        core_result = transcribe_cached(
+            audio_path,
+            language="pt",
+            workers=args.workers,
+            profile=profile,
+        )
+    else:
+        raw_path = transcripts_dir / f"{name}_raw.txt"
+        core_result = transcribe_cached(
+            audio_path,
+            language="pt",
+            profile=profile,
+            transcribe=lambda: _run_asr_streaming(audio_path, raw_path, profile),
+        )
+    if core_result.get("cached"):
+        print("[PIPELINE] ASR recuperado do cache")
 
     text = core_result.get("text") or ""
     text = text.strip()
@@ -116,12 +202,6 @@ def main() -> None:
     # ==================================================
     print("[PIPELINE] Etapa 3/3 — Salvando arquivos")
 
-    output_root = audio_path.parents[1]
-    transcripts_dir = output_root / "transcripts"
-    transcripts_dir.mkdir(parents=True, exist_ok=True)
-
-    name = args.slug or audio_path.stem
-
     transcript_path = transcripts_dir / f"{name}_transcricao.txt"
     transcript_path.write_text(text, encoding="utf-8")
 
@@ -132,6 +212,9 @@ def main() -> None:
                 "audio": audio_path.name,
                 "session_type": args.type,
                 "model": core_result.get("model"),
+                "decode_profile": core_result.get("profile"),
+                "asr_rtf": core_result.get("rtf"),
+                "speech_gate": _gate_summary(audio_path),
                 "pipeline_seconds": round(time.time() - start, 2),
                 "text_length": len(text),
             },